@@ -8,6 +8,8 @@ import subprocess
 root_dir = os.path.dirname(os.path.abspath(__file__))
 java_dir = os.path.join(root_dir, "donuts", "java")
 jar_file = os.path.join(java_dir, "donuts-all.jar")
+cds_file = os.path.join(java_dir, "donuts-all.jsa")
+cds_release_file = os.path.join(java_dir, "donuts-all.jsa.release")
 
 if os.name == "posix":
     gradlew_cmd = "./gradlew"
@@ -35,6 +37,42 @@ def build_jar() -> None:
         raise OSError("Failed to generate the JAR file")
 
 
+def build_cds_archive() -> None:
+    """Generate the CDS archive for the JAR file.
+
+    The archive is valid only for the JDK used to generate it (13 or later), which is
+    taken from `JAVA_HOME` or `PATH`. Its "release" file is kept alongside so that the
+    archive can be skipped at runtime for other JDKs.
+    """
+    java_home = os.getenv("JAVA_HOME")
+    java_cmd = os.path.join(java_home, "bin", "java") if java_home else "java"
+
+    for f in (cds_file, cds_release_file):
+        if os.path.isfile(f):
+            os.remove(f)
+
+    # Run the training workload and dump the loaded classes at exit.
+    result = subprocess.run(  # noqa: S603
+        [
+            java_cmd,
+            f"-XX:ArchiveClassesAtExit={cds_file}",
+            "-cp",
+            jar_file,
+            "com.github.tueda.donuts.python.CdsTraining",
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+    if not os.path.isfile(cds_file):
+        raise OSError("Failed to generate the CDS archive")
+
+    # The last line of the output is `java.home`.
+    java_home = result.stdout.strip().splitlines()[-1]
+    shutil.copy(os.path.join(java_home, "release"), cds_release_file)
+
+
 def run_gradle(*cmd: str) -> None:
     """Run a Gradle command."""
     if not os.path.isfile(os.path.join(java_dir, "build.gradle")):
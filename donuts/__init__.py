@@ -2,19 +2,25 @@
 
 __version__ = "0.0.6a0"
 
+from .modpoly import ModPolynomial
+from .numeric import compile_many
 from .poly import Polynomial, gcd, lcm, product
 from .rat import RationalFunction
+from .recon import reconstruct
 from .var import Variable
 
 # NOTE: we do not add the "sum" function intentionally because it shadows
 #       the built-in function.
 __all__ = (
+    "ModPolynomial",
     "Polynomial",
     "RationalFunction",
     "Variable",
+    "compile_many",
     "gcd",
     "lcm",
     "product",
+    "reconstruct",
 )
 
 # The following attributes are explicitly re-exported for mypy with
@@ -22,6 +28,26 @@ __all__ = (
 
 # isort: off
 
+from .cache import CacheInfo as CacheInfo  # noqa: F401
+from .cache import DiskCacheInfo as DiskCacheInfo  # noqa: F401
+from .cache import ParseCacheInfo as ParseCacheInfo  # noqa: F401
+from .cache import ResultCacheInfo as ResultCacheInfo  # noqa: F401
+from .cache import cache_info as cache_info  # noqa: F401
+from .cache import clear_disk_cache as clear_disk_cache  # noqa: F401
+from .cache import clear_parse_cache as clear_parse_cache  # noqa: F401
+from .cache import clear_result_cache as clear_result_cache  # noqa: F401
+from .cache import configure_caches as configure_caches  # noqa: F401
+from .cache import configure_disk_cache as configure_disk_cache  # noqa: F401
+from .cache import configure_parse_cache as configure_parse_cache  # noqa: F401
+from .cache import configure_result_cache as configure_result_cache  # noqa: F401
+from .cache import disk_cache_info as disk_cache_info  # noqa: F401
+from .cache import parse_cache_info as parse_cache_info  # noqa: F401
+from .cache import result_cache_info as result_cache_info  # noqa: F401
+from .intern import InternInfo as InternInfo  # noqa: F401
+from .intern import interning_info as interning_info  # noqa: F401
+from .intern import set_interning as set_interning  # noqa: F401
+from .jvm import configure as configure  # noqa: F401
+from .jvm import start as start  # noqa: F401
 from .poly import PolynomialLike as PolynomialLike  # noqa: F401
 from .poly import sum as sum  # noqa: A004,F401
 from .rat import RationalFunctionLike as RationalFunctionLike  # noqa: F401
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterable, Sequence, Union
+import array
+import functools
+import operator
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, List, Sequence, Tuple, Union
 
 from .jvm import jvm
 
@@ -13,19 +17,84 @@ if TYPE_CHECKING:
 
 _RawVariable = jvm.find_class("com.github.tueda.donuts.Variable")
 _RawPolynomial = jvm.find_class("com.github.tueda.donuts.Polynomial")
-_new_array = jvm.new_array
-_new_int_array = jvm.new_int_array
+_RawString = jvm.find_class("java.lang.String")
 
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
 
-def _create_raw_int_array(values: Sequence[int]) -> Any:
-    """Create a Java array of integers."""
-    array = _new_int_array(len(values))
-    for i in range(len(values)):
-        x = values[i]
-        if not isinstance(x, int):
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy() -> Any:
+    """Return the NumPy module if available, otherwise None."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def _is_int_array_like(values: Any) -> bool:
+    """Return `True` if the given object is accepted by `_create_raw_int_array`."""
+    if isinstance(values, Sequence):
+        return not isinstance(values, (str, bytes))
+    np = _import_numpy()
+    return np is not None and isinstance(values, np.ndarray) and values.ndim == 1
+
+
+def _is_int32(value: int) -> bool:
+    """Return `True` if the given integer fits in a Java int."""
+    return _INT32_MIN <= value <= _INT32_MAX
+
+
+def _create_raw_int_array(values: Any) -> Any:
+    """Create a Java array of integers.
+
+    The values may be given as a sequence of integers, including `array.array`, or
+    a one-dimensional NumPy array.
+    """
+    return jvm.create_int_array(_to_int32_array(values))
+
+
+def _create_raw_int_values(values: Any) -> Any:
+    """Create a Java array of integers, or pack them if some exceed 32 bits.
+
+    Return the Java array, or a tuple of the packed data and whether it contains big
+    integers (see `_pack_integers`).
+    """
+    try:
+        return _create_raw_int_array(values)
+    except OverflowError:
+        _, data, big = _pack_integers(values)
+        return (data, big)
+
+
+def _to_int32_array(values: Any) -> array.array[int]:
+    """Convert the given integers to an array of 32-bit integers."""
+    if isinstance(values, (list, tuple)):
+        if not all(isinstance(x, int) for x in values):
             raise TypeError("not integer")
-        array[i] = x
-    return array
+        return array.array("i", values)
+
+    if isinstance(values, array.array):
+        if values.typecode == "i":
+            return values
+        if values.typecode not in "bBhHiIlLqQ":
+            raise TypeError("not integer")
+        return array.array("i", values)
+
+    np = _import_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind not in "iu":
+            raise TypeError("not integer")
+        if values.size and (values.min() < _INT32_MIN or values.max() > _INT32_MAX):
+            raise OverflowError("integer out of range")
+        result = array.array("i")
+        result.frombytes(np.ascontiguousarray(values, dtype=np.intc).tobytes())
+        return result
+
+    return _to_int32_array(list(values))
 
 
 def _create_raw_var_array(
@@ -42,16 +111,15 @@ def _create_raw_var_array(
             if isinstance(x, Iterable):
                 return _create_raw_var_array(tuple(x))
 
-    array = _new_array(_RawVariable, len(variables))
-    for i in range(len(variables)):
-        x = variables[i]
+    raw_variables = []
+    for x in variables:
         if isinstance(x, Variable):
-            array[i] = x._raw
+            raw_variables.append(x._raw)
         elif isinstance(x, str):
-            array[i] = Variable(x)._raw
+            raw_variables.append(Variable(x)._raw)
         else:
             raise TypeError("not Variable")
-    return array
+    return jvm.create_array(_RawVariable, raw_variables)
 
 
 def _create_raw_poly_array(
@@ -69,13 +137,193 @@ def _create_raw_poly_array(
             if isinstance(x, Iterable):
                 return _create_raw_poly_array(tuple(x))
 
-    array = _new_array(_RawPolynomial, len(polynomials))
-    for i in range(len(polynomials)):
-        x = polynomials[i]
+    raw_polynomials = []
+    for x in polynomials:
         if isinstance(x, Polynomial):
-            array[i] = x._raw
+            raw_polynomials.append(x._raw)
         elif isinstance(x, (Variable, int)):
-            array[i] = Polynomial(x)._raw
+            raw_polynomials.append(Polynomial(x)._raw)
         else:
             raise TypeError("not Polynomial")
-    return array
+    return jvm.create_array(_RawPolynomial, raw_polynomials)
+
+
+def _create_raw_str_array(values: Sequence[str]) -> Any:
+    """Create a Java array of strings."""
+    return jvm.create_array(_RawString, values)
+
+
+def _pack_exponent_matrix(values: Any, ncols: int) -> Tuple[int, bytes]:
+    """Pack a matrix of exponents into little-endian 32-bit integers.
+
+    Return the number of rows and the packed data.
+    """
+    np = _import_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        if values.ndim != 2 or values.shape[1] != ncols:
+            raise ValueError(f"exponents must be an (nterms, {ncols}) matrix")
+        if values.dtype.kind not in "iu":
+            raise TypeError("not integer")
+        if values.size and (values.min() < 0 or values.max() > _INT32_MAX):
+            raise ValueError("exponent out of range")
+        return values.shape[0], np.ascontiguousarray(values, dtype="<i4").tobytes()
+
+    packed = array.array("i")
+    nrows = 0
+    for row in values:
+        row = [_as_int(x) for x in row]
+        if len(row) != ncols:
+            raise ValueError(f"exponents must be an (nterms, {ncols}) matrix")
+        if row and (min(row) < 0 or max(row) > _INT32_MAX):
+            raise ValueError("exponent out of range")
+        packed.extend(row)
+        nrows += 1
+    if sys.byteorder == "big":
+        packed.byteswap()  # pragma: no cover
+    return nrows, packed.tobytes()
+
+
+def _pack_integers(values: Any) -> Tuple[int, bytes, bool]:
+    """Pack integers.
+
+    They are packed as little-endian 64-bit integers if possible; otherwise each
+    integer is packed as a little-endian 32-bit length followed by its big-endian
+    two's-complement representation. Return the number of integers, the packed data
+    and whether the latter format is used.
+    """
+    np = _import_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        if values.ndim != 1:
+            raise ValueError("integers must be a one-dimensional array")
+        kind = values.dtype.kind
+        if kind == "u" and values.size and values.max() > _INT64_MAX:
+            kind = "O"
+        if kind in "iu":
+            data = np.ascontiguousarray(values, dtype="<i8").tobytes()
+            return len(values), data, False
+        if kind != "O":
+            raise TypeError("not integer")
+        values = values.tolist()
+
+    ints: List[int] = [_as_int(x) for x in values]
+    if not ints or (min(ints) >= _INT64_MIN and max(ints) <= _INT64_MAX):
+        packed = array.array("q", ints)
+        if sys.byteorder == "big":
+            packed.byteswap()  # pragma: no cover
+        return len(ints), packed.tobytes(), False
+
+    parts = []
+    for x in ints:
+        b = _int_to_bytes(x)
+        parts.append(len(b).to_bytes(4, "little"))
+        parts.append(b)
+    return len(ints), b"".join(parts), True
+
+
+def _pack_integer_matrix(values: Any, ncols: int) -> Tuple[int, bytes, bool]:
+    """Pack a matrix of integers in the row-major order by `_pack_integers`.
+
+    Return the number of rows, the packed data and the format flag.
+    """
+    np = _import_numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        if values.ndim != 2 or values.shape[1] != ncols:
+            raise ValueError(f"points must be an (npoints, {ncols}) matrix")
+        _, data, big = _pack_integers(values.reshape(-1))
+        return values.shape[0], data, big
+
+    flat: List[Any] = []
+    nrows = 0
+    for row in values:
+        row = list(row)
+        if len(row) != ncols:
+            raise ValueError(f"points must be an (npoints, {ncols}) matrix")
+        flat.extend(row)
+        nrows += 1
+    _, data, big = _pack_integers(flat)
+    return nrows, data, big
+
+
+def _unpack_term_arrays(data: bytes) -> Tuple[Any, Any]:
+    """Unpack an exponent matrix and coefficients as NumPy arrays.
+
+    The data is in the format produced by ``PolynomialArrays.toArrays``.
+    """
+    import numpy as np
+
+    nterms, ncols, big = np.frombuffer(data, dtype="<i4", count=3)
+    offset = 12
+    exponents = np.frombuffer(data, dtype="<i4", count=nterms * ncols, offset=offset)
+    exponents = exponents.astype(np.int32).reshape(nterms, ncols)
+    offset += exponents.nbytes
+    return exponents, _unpack_integer_array(data, nterms, bool(big), offset)
+
+
+def _unpack_integer_array(data: bytes, n: int, big: bool, offset: int = 0) -> Any:
+    """Unpack integers packed by `_pack_integers` as a NumPy array.
+
+    The result is an array of 64-bit integers, or of Python integers if `big` is
+    `True`.
+    """
+    import numpy as np
+
+    if not big:
+        values = np.frombuffer(data, dtype="<i8", count=n, offset=offset)
+        return values.astype(np.int64)
+
+    values = np.empty(n, dtype=object)
+    for i in range(n):
+        m = int.from_bytes(data[offset : offset + 4], "little")
+        offset += 4
+        values[i] = _int_from_bytes(data[offset : offset + m])
+        offset += m
+    return values
+
+
+def _unpack_terms(data: bytes) -> List[Tuple[Tuple[int, ...], int]]:
+    """Unpack terms as pairs of exponents and coefficients.
+
+    The data is in the format produced by ``PolynomialArrays.toArrays``.
+    """
+    nterms = int.from_bytes(data[0:4], "little")
+    ncols = int.from_bytes(data[4:8], "little")
+    big = int.from_bytes(data[8:12], "little")
+    offset = 12 + 4 * nterms * ncols
+    exponents = array.array("i", data[12:offset])
+    coefficients: Sequence[int]
+    if not big:
+        coefficients = array.array("q", data[offset : offset + 8 * nterms])
+        if sys.byteorder == "big":
+            coefficients.byteswap()  # pragma: no cover
+    else:
+        big_coefficients = []
+        for _ in range(nterms):
+            n = int.from_bytes(data[offset : offset + 4], "little")
+            offset += 4
+            big_coefficients.append(_int_from_bytes(data[offset : offset + n]))
+            offset += n
+        coefficients = big_coefficients
+    if sys.byteorder == "big":
+        exponents.byteswap()  # pragma: no cover
+    return [
+        (tuple(exponents[i * ncols : (i + 1) * ncols]), coefficients[i])
+        for i in range(nterms)
+    ]
+
+
+def _int_to_bytes(value: int) -> bytes:
+    """Return the big-endian two's-complement representation of an integer."""
+    return value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+
+
+def _int_from_bytes(data: bytes) -> int:
+    """Return the integer given in the big-endian two's-complement representation."""
+    return int.from_bytes(data, "big", signed=True)
+
+
+def _as_int(x: Any) -> int:
+    """Convert the given integer-like object to int."""
+    try:
+        return operator.index(x)
+    except TypeError:
+        raise TypeError("not integer") from None
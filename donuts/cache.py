@@ -0,0 +1,511 @@
+"""Process-wide caches."""
+
+from __future__ import annotations
+
+import functools
+import os
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from .jvm import jvm
+
+_RawPolynomial = jvm.find_class("com.github.tueda.donuts.Polynomial")
+_RawBinaryFormat = jvm.find_class("com.github.tueda.donuts.python.BinaryFormat")
+_RawResultCache = jvm.find_class("com.github.tueda.donuts.python.ResultCache")
+
+# The default maximum number of entries in ResultCache.java.
+_RESULT_CACHE_MAXSIZE = 1024
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+# The functions wrapped by `_lru_cache`, and their cached versions.
+_lru_caches: Dict[str, List[Callable[..., Any]]] = {}
+
+
+def _lru_cache(name: str, maxsize: int) -> Callable[[F], F]:
+    """Decorate a module-level function with a resizable `functools.lru_cache`.
+
+    The cached function is rebound in its module when resized by
+    :func:`configure_caches`, so it must be called via the module globals.
+    """
+
+    def decorator(func: F) -> F:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _lru_caches[name] = [func, cached]
+        return cached  # type: ignore[return-value]
+
+    return decorator
+
+
+class ResultCacheInfo(NamedTuple):
+    """Statistics of the result cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    max_bytes: int
+    nbytes: int
+
+
+def configure_result_cache(
+    *, maxsize: Optional[int] = None, max_bytes: Optional[int] = None
+) -> None:
+    """Configure the cache of factorizations, GCDs, LCMs and exact divisions.
+
+    The results are cached in the JVM, keyed by the values of the operands, and
+    evicted in the least recently used order when the number of entries exceeds
+    ``maxsize`` (default: 1024) or the estimated memory usage exceeds ``max_bytes``
+    (default: 64 MiB). ``maxsize=0`` disables the cache. Only the given settings
+    are updated.
+    """
+    info = result_cache_info()
+    if maxsize is None:
+        maxsize = info.maxsize
+    if max_bytes is None:
+        max_bytes = info.max_bytes
+    if maxsize < 0 or max_bytes < 0:
+        raise ValueError("cache size must be non-negative")
+    _RawResultCache.configure(min(maxsize, 2**31 - 1), min(max_bytes, 2**63 - 1))
+
+
+def result_cache_info() -> ResultCacheInfo:
+    """Return the statistics of the cache of factorizations, GCDs, LCMs, etc."""
+    return ResultCacheInfo(*(int(x) for x in _RawResultCache.getInfo()))
+
+
+def clear_result_cache() -> None:
+    """Clear the cache of factorizations, GCDs, LCMs, etc., and its statistics."""
+    _RawResultCache.clear()
+
+
+class DiskCacheInfo(NamedTuple):
+    """Statistics of the persistent cache."""
+
+    hits: int
+    misses: int
+    currsize: int
+    max_bytes: int
+    nbytes: int
+
+
+def _pack_blobs(blobs: Iterable[bytes]) -> bytes:
+    return b"".join(struct.pack("<I", len(b)) + b for b in blobs)
+
+
+def _unpack_blobs(data: bytes) -> List[bytes]:
+    blobs = []
+    i = 0
+    while i < len(data):
+        (n,) = struct.unpack_from("<I", data, i)
+        if i + 4 + n > len(data):
+            raise ValueError("truncated data")
+        blobs.append(data[i + 4 : i + 4 + n])
+        i += 4 + n
+    if not blobs:
+        raise ValueError("no results")
+    return blobs
+
+
+class _DiskCache:
+    """Persistent cache of results in an SQLite database."""
+
+    __slots__ = ("path", "max_bytes", "min_time", "hits", "misses", "_conn", "_pid")
+
+    # Access times are updated only when older than this (in seconds), which avoids
+    # a write for every hit.
+    _ATIME_RESOLUTION = 60.0
+
+    # Serializes the use of the connection among threads.
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.path: Optional[str] = None
+        self.max_bytes = 0
+        self.min_time = 0.0
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def apply(self, op: str, raw_args: Sequence[Any]) -> List[Any]:
+        """Return the results of the operation on raw polynomials.
+
+        The in-memory cache is looked up first, then the database.
+        """
+        raw_array = jvm.create_array(_RawPolynomial, raw_args)
+        raw_results = _RawResultCache.get(op, raw_array)
+        if raw_results is not None:
+            return jvm.get_array_items(raw_results)  # type: ignore[no-any-return]
+
+        key = jvm.to_bytes(_RawResultCache.digest(op, raw_array))
+        value = self._load(key)
+        if value is not None:
+            try:
+                results = [
+                    _RawBinaryFormat.decodePolynomial(b) for b in _unpack_blobs(value)
+                ]
+            except (ValueError, struct.error, jvm.java_error_class):
+                # A corrupt or incompatible entry is treated as a miss.
+                self._delete(key)
+            else:
+                # The stored results have the variables of whoever computed them,
+                # while the key ignores variables. Use those of the operands.
+                variables = raw_args[0].getVariables()
+                for x in raw_args[1:]:
+                    variables = variables.union(x.getVariables())
+                results = [x.translate(variables) for x in results]
+                self.hits += 1
+                _RawResultCache.put(
+                    op, raw_array, jvm.create_array(_RawPolynomial, results)
+                )
+                return results
+
+        self.misses += 1
+        start = time.perf_counter()
+        results = jvm.get_array_items(_RawResultCache.compute(op, raw_array))
+        if time.perf_counter() - start >= self.min_time:
+            value = _pack_blobs(
+                jvm.to_bytes(_RawBinaryFormat.encodePolynomial(x)) for x in results
+            )
+            if len(value) <= self.max_bytes:
+                self._store(key, value)
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def info(self) -> DiskCacheInfo:
+        currsize = 0
+        nbytes = 0
+        if self.path is not None:
+            with self._lock:
+                conn = self._connect()
+                (currsize,) = conn.execute("SELECT count(*) FROM results").fetchone()
+                nbytes = self._used_bytes(conn)
+        return DiskCacheInfo(self.hits, self.misses, currsize, self.max_bytes, nbytes)
+
+    def clear(self) -> None:
+        if self.path is not None:
+            with self._lock:
+                self._connect().execute("DELETE FROM results")
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection must not be shared with forked processes.
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            assert self.path is not None  # noqa: S101
+            conn = sqlite3.connect(
+                self.path, timeout=60, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key BLOB PRIMARY KEY, value BLOB NOT NULL, atime REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_atime ON results (atime)")
+            self._conn = conn
+            self._pid = pid
+        return self._conn
+
+    def _load(self, key: bytes) -> Optional[bytes]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, atime FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[1] > self._ATIME_RESOLUTION:
+                conn.execute("UPDATE results SET atime = ? WHERE key = ?", (now, key))
+            return row[0]  # type: ignore[no-any-return]
+
+    def _delete(self, key: bytes) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def _store(self, key: bytes, value: bytes) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            # Evict the least recently used quarter of the entries at a time.
+            while self._used_bytes(conn) > self.max_bytes:
+                (n,) = conn.execute("SELECT count(*) FROM results").fetchone()
+                if n == 0:
+                    break
+                conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY atime LIMIT ?)",
+                    (max(n // 4, 1),),
+                )
+
+    @staticmethod
+    def _used_bytes(conn: sqlite3.Connection) -> int:
+        (page_size,) = conn.execute("PRAGMA page_size").fetchone()
+        (page_count,) = conn.execute("PRAGMA page_count").fetchone()
+        (freelist_count,) = conn.execute("PRAGMA freelist_count").fetchone()
+        return (page_count - freelist_count) * page_size  # type: ignore[no-any-return]
+
+
+_disk_cache = _DiskCache()
+
+
+def configure_disk_cache(
+    path: Union[str, os.PathLike[str], None],
+    *,
+    max_bytes: int = 1 << 30,
+    min_time: float = 0.01,
+) -> None:
+    """Configure the persistent cache of factorizations, GCDs, LCMs, etc.
+
+    The results are stored in an SQLite database at ``path`` (or in
+    ``donuts-cache.sqlite3`` if ``path`` is a directory), keyed by a digest of the
+    operands, so that they are shared across runs and by concurrent processes.
+    Results computed faster than ``min_time`` seconds are not stored. The least
+    recently used entries are evicted when the database exceeds ``max_bytes``
+    (default: 1 GiB). ``path=None`` disables the cache.
+
+    The environment variable ``DONUTS_PYTHON_DISK_CACHE`` gives the initial path.
+    """
+    if max_bytes < 0:
+        raise ValueError("cache size must be non-negative")
+    _disk_cache.close()
+    if path is not None:
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "donuts-cache.sqlite3")
+    _disk_cache.path = path
+    _disk_cache.max_bytes = max_bytes
+    _disk_cache.min_time = min_time
+    _disk_cache.hits = 0
+    _disk_cache.misses = 0
+    if path is not None:
+        try:
+            with _disk_cache._lock:
+                _disk_cache._connect()
+        except sqlite3.Error as e:
+            _disk_cache.path = None
+            raise OSError(f"failed to open {path}") from e
+
+
+def disk_cache_info() -> DiskCacheInfo:
+    """Return the statistics of the persistent cache."""
+    return _disk_cache.info()
+
+
+def clear_disk_cache() -> None:
+    """Remove all the entries in the persistent cache and reset its statistics."""
+    _disk_cache.clear()
+
+
+if os.environ.get("DONUTS_PYTHON_DISK_CACHE"):
+    configure_disk_cache(os.environ["DONUTS_PYTHON_DISK_CACHE"])
+
+
+class ParseCacheInfo(NamedTuple):
+    """Statistics of the parse caches."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    max_length: int
+    max_terms: int
+
+
+class _ParseCache:
+    """LRU cache of raw objects parsed from strings, which skips large ones."""
+
+    __slots__ = ("_parse", "_count_terms", "_entries", "_lock", "hits", "misses")
+
+    maxsize = 1024
+    max_length = 1000
+    max_terms = 100
+
+    def __init__(
+        self, parse: Callable[[str], Any], count_terms: Callable[[Any], int]
+    ) -> None:
+        self._parse = parse
+        self._count_terms = count_terms
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        _parse_caches.append(self)
+
+    def parse(self, value: str) -> Any:
+        """Return the raw object parsed from the given string."""
+        if len(value) > _ParseCache.max_length or _ParseCache.maxsize == 0:
+            return self._parse(value)
+        with self._lock:
+            raw = self._entries.get(value)
+            if raw is not None:
+                self._entries.move_to_end(value)
+                self.hits += 1
+                return raw
+            self.misses += 1
+        raw = self._parse(value)
+        # Do not pin large objects.
+        if self._count_terms(raw) <= _ParseCache.max_terms:
+            with self._lock:
+                self._entries[value] = raw
+                self._evict()
+        return raw
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self) -> None:
+        while len(self._entries) > _ParseCache.maxsize:
+            self._entries.popitem(last=False)
+
+
+_parse_caches: List[_ParseCache] = []
+
+
+def configure_parse_cache(
+    *,
+    maxsize: Optional[int] = None,
+    max_length: Optional[int] = None,
+    max_terms: Optional[int] = None,
+) -> None:
+    """Configure the caches of polynomials and rational functions parsed from strings.
+
+    Each cache keeps at most ``maxsize`` (default: 1024) strings in the least
+    recently used order. Strings longer than ``max_length`` (default: 1000) and
+    results with more than ``max_terms`` terms (default: 100) are not cached.
+    ``maxsize=0`` disables the caches. Only the given settings are updated.
+    """
+    for x in (maxsize, max_length, max_terms):
+        if x is not None and x < 0:
+            raise ValueError("cache size must be non-negative")
+    if maxsize is not None:
+        _ParseCache.maxsize = maxsize
+    if max_length is not None:
+        _ParseCache.max_length = max_length
+    if max_terms is not None:
+        _ParseCache.max_terms = max_terms
+    for cache in _parse_caches:
+        with cache._lock:
+            cache._evict()
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """Return the statistics of the parse caches, summed over all types."""
+    return ParseCacheInfo(
+        sum(c.hits for c in _parse_caches),
+        sum(c.misses for c in _parse_caches),
+        _ParseCache.maxsize,
+        sum(len(c._entries) for c in _parse_caches),
+        _ParseCache.max_length,
+        _ParseCache.max_terms,
+    )
+
+
+def clear_parse_cache() -> None:
+    """Clear the parse caches and their statistics."""
+    for cache in _parse_caches:
+        cache.clear()
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """Return the statistics of all the in-memory caches.
+
+    The caches are:
+
+    - ``"variable"``: variables created from names.
+    - ``"variable_set"``: variable sets created from sets of variables.
+    - ``"polynomial_int"``, ``"rational_function_int"``: integers.
+    - ``"polynomial_variable"``, ``"rational_function_variable"``: variables
+      converted to polynomials and rational functions.
+    - ``"parse"``: strings parsed as polynomials and rational functions
+      (see :func:`configure_parse_cache`).
+    - ``"result"``: factorizations, GCDs, LCMs and exact divisions
+      (see :func:`configure_result_cache`).
+    """
+    result: Dict[str, CacheInfo] = {}
+    for name, (_, cached) in _lru_caches.items():
+        result[name] = CacheInfo(*cached.cache_info())  # type: ignore[attr-defined]
+    info = parse_cache_info()
+    result["parse"] = CacheInfo(info.hits, info.misses, info.maxsize, info.currsize)
+    if jvm.is_started:
+        info2 = result_cache_info()
+        result["result"] = CacheInfo(
+            info2.hits, info2.misses, info2.maxsize, info2.currsize
+        )
+    else:
+        # Not worth starting the JVM; the cache is still empty.
+        result["result"] = CacheInfo(0, 0, _RESULT_CACHE_MAXSIZE, 0)
+    return result
+
+
+def configure_caches(**maxsizes: Optional[int]) -> None:
+    """Resize the in-memory caches given by their names in :func:`cache_info`.
+
+    For example, ``configure_caches(variable=100000, parse=0)`` enlarges the cache
+    of variables and disables the parse cache. A size of zero disables the cache;
+    `None` makes it unbounded, except for ``"parse"`` and ``"result"``. Resizing a
+    cache clears it, except for ``"parse"`` and ``"result"``, which only evict
+    entries as needed.
+    """
+    for name, maxsize in maxsizes.items():
+        if name not in _lru_caches and name not in ("parse", "result"):
+            raise ValueError(f"unknown cache: `{name}`")
+        if maxsize is None:
+            if name in ("parse", "result"):
+                raise ValueError(f"cache `{name}` cannot be unbounded")
+        elif maxsize < 0:
+            raise ValueError("cache size must be non-negative")
+
+    for name, maxsize in maxsizes.items():
+        if name == "parse":
+            configure_parse_cache(maxsize=maxsize)
+        elif name == "result":
+            configure_result_cache(maxsize=maxsize)
+        else:
+            func, _ = _lru_caches[name]
+            cached = functools.lru_cache(maxsize=maxsize)(func)
+            setattr(sys.modules[func.__module__], func.__name__, cached)
+            _lru_caches[name][1] = cached
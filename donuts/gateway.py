@@ -0,0 +1,50 @@
+"""Launcher of a shared Py4J gateway.
+
+Running this module starts a JVM with a Py4J gateway, which many Python processes
+with the py4j backend can attach to::
+
+    $ python -m donuts.gateway --port 25333
+    DONUTS_PYTHON_BACKEND=py4j
+    DONUTS_PYTHON_PY4J_PORT=25333
+    DONUTS_PYTHON_PY4J_TOKEN=...
+
+The printed environment variables make the processes use the gateway, which
+stays alive until this launcher is terminated.
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from .jvm import _launch_py4j_gateway, configure
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """Launch a shared Py4J gateway and wait until it exits."""
+    parser = argparse.ArgumentParser(
+        prog="python -m donuts.gateway", description="Launch a shared Py4J gateway."
+    )
+    parser.add_argument(
+        "--port", type=int, default=0, help="port number (default: any free port)"
+    )
+    parser.add_argument("--heap", help="maximum heap size, e.g., 8g")
+    parser.add_argument("--gc", help="garbage collector, e.g., g1")
+    opts = parser.parse_args(args)
+
+    configure(heap=opts.heap, gc=opts.gc)
+    (port, token, proc) = _launch_py4j_gateway(opts.port)
+
+    print("DONUTS_PYTHON_BACKEND=py4j")
+    print(f"DONUTS_PYTHON_PY4J_PORT={port}")
+    print(f"DONUTS_PYTHON_PY4J_TOKEN={token}")
+    sys.stdout.flush()
+
+    # The JVM dies when this process exits.
+    try:
+        proc.wait()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
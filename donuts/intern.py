@@ -0,0 +1,91 @@
+"""Hash-consing of polynomials and rational functions."""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from .jvm import jvm
+
+_RawInterner = jvm.find_class("com.github.tueda.donuts.python.Interner")
+
+T = TypeVar("T")
+
+
+class InternInfo(NamedTuple):
+    """Statistics of interning."""
+
+    requests: int
+    """The number of interned results."""
+
+    hits: int
+    """The number of results equal to existing values, which have been deduplicated."""
+
+    size: int
+    """The number of distinct values in the table, possibly including dead ones."""
+
+    @property
+    def ratio(self) -> float:
+        """The deduplication ratio, i.e., results per distinct value created."""
+        created = self.requests - self.hits
+        return self.requests / created if created else 1.0
+
+
+class _Interner:
+    """Table of the wrappers of canonical raw objects."""
+
+    __slots__ = ("enabled", "requests", "hits", "objects")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.requests = 0
+        self.hits = 0
+        self.objects: weakref.WeakValueDictionary[int, Any] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def intern(self, raw: Any, new: Callable[[Any], T]) -> T:
+        """Return the wrapper of the canonical object equal to the given raw object."""
+        key = _RawInterner.intern(raw)
+        self.requests += 1
+        if key < 0:
+            obj = new(raw)
+            self.objects[-key] = obj
+            return obj
+        self.hits += 1
+        cached = self.objects.get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+        canonical = _RawInterner.get(key)
+        obj = new(raw if canonical is None else canonical)
+        self.objects[key] = obj
+        return obj
+
+    def clear(self) -> None:
+        """Clear the tables and statistics."""
+        _RawInterner.clear()
+        self.objects.clear()
+        self.requests = 0
+        self.hits = 0
+
+
+_interner = _Interner()
+
+
+def set_interning(enabled: bool) -> None:
+    """Enable or disable interning of polynomials and rational functions.
+
+    When enabled, results of operations equal to existing values share one object,
+    both on the Python and on the Java side, which saves memory when the same values
+    recur many times. Disabling it clears the tables and statistics.
+    """
+    if enabled == _interner.enabled:
+        return
+    _interner.enabled = enabled
+    if not enabled:
+        _interner.clear()
+
+
+def interning_info() -> InternInfo:
+    """Return the statistics of interning."""
+    return InternInfo(_interner.requests, _interner.hits, _RawInterner.size())
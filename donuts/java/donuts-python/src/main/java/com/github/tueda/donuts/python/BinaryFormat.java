@@ -0,0 +1,269 @@
+package com.github.tueda.donuts.python;
+
+import cc.redberry.rings.Rings;
+import cc.redberry.rings.bigint.BigInteger;
+import cc.redberry.rings.poly.multivar.Monomial;
+import cc.redberry.rings.poly.multivar.MonomialOrder;
+import cc.redberry.rings.poly.multivar.MultivariatePolynomial;
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import com.github.tueda.donuts.VariableSet;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class provides a compact binary format of polynomials and rational functions.
+ *
+ * <p>The format consists of a tag byte ({@code 'P'} or {@code 'R'}), a version byte, the variable
+ * table and the terms of the polynomial (or the numerator and the denominator). Unsigned integers
+ * are written as varints (7 bits per byte, little-endian). Each term consists of the exponents for
+ * the variables followed by the coefficient.
+ */
+@UtilityClass
+public class BinaryFormat {
+  /** The tag for polynomials. */
+  private static final int POLYNOMIAL_TAG = 'P';
+
+  /** The tag for rational functions. */
+  private static final int RATIONAL_FUNCTION_TAG = 'R';
+
+  /** The current version of the format. */
+  private static final int VERSION = 1;
+
+  /** Coefficients up to this bit length are written as single varints. */
+  private static final int MAX_SMALL_BIT_LENGTH = 61;
+
+  /**
+   * Encodes the given polynomial.
+   *
+   * @param polynomial the polynomial
+   * @return the encoded data
+   */
+  public static byte[] encodePolynomial(final Polynomial polynomial) {
+    final Writer out = new Writer(POLYNOMIAL_TAG);
+    out.writeVariables(polynomial.getVariables());
+    out.writeTerms(polynomial.getRawPolynomial());
+    return out.toByteArray();
+  }
+
+  /**
+   * Encodes the given rational function.
+   *
+   * @param rationalFunction the rational function
+   * @return the encoded data
+   */
+  public static byte[] encodeRationalFunction(final RationalFunction rationalFunction) {
+    final Writer out = new Writer(RATIONAL_FUNCTION_TAG);
+    out.writeVariables(rationalFunction.getVariables());
+    out.writeTerms(rationalFunction.getNumerator().getRawPolynomial());
+    out.writeTerms(rationalFunction.getDenominator().getRawPolynomial());
+    return out.toByteArray();
+  }
+
+  /**
+   * Decodes a polynomial.
+   *
+   * @param data the encoded data
+   * @return the polynomial
+   * @throws IllegalArgumentException when the data is malformed
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial decodePolynomial(final byte[] data) {
+    final Reader in = new Reader(data, POLYNOMIAL_TAG);
+    final VariableSet variables = in.readVariables();
+    final Polynomial result =
+        Internals.createPolynomial(variables, in.readTerms(variables.size()));
+    in.checkEnd();
+    return result;
+  }
+
+  /**
+   * Decodes a rational function.
+   *
+   * @param data the encoded data
+   * @return the rational function
+   * @throws IllegalArgumentException when the data is malformed
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static RationalFunction decodeRationalFunction(final byte[] data) {
+    final Reader in = new Reader(data, RATIONAL_FUNCTION_TAG);
+    final VariableSet variables = in.readVariables();
+    final Polynomial numerator =
+        Internals.createPolynomial(variables, in.readTerms(variables.size()));
+    final Polynomial denominator =
+        Internals.createPolynomial(variables, in.readTerms(variables.size()));
+    in.checkEnd();
+    return new RationalFunction(numerator, denominator);
+  }
+
+  /** Writer of encoded data, which is not synchronized unlike ByteArrayOutputStream. */
+  private static class Writer {
+    /** The buffer. */
+    private byte[] buf = new byte[256];
+
+    /** The number of bytes written. */
+    private int size;
+
+    /** Constructs a writer after writing the header. */
+    /* default */ Writer(final int tag) {
+      write(tag);
+      write(VERSION);
+    }
+
+    /* default */ byte[] toByteArray() {
+      return Arrays.copyOf(buf, size);
+    }
+
+    /* default */ void writeVariables(final VariableSet variables) {
+      final String[] table = Internals.getRawTable(variables);
+      writeVarint(table.length);
+      for (final String v : table) {
+        final byte[] name = v.getBytes(StandardCharsets.UTF_8);
+        writeVarint(name.length);
+        ensureCapacity(name.length);
+        System.arraycopy(name, 0, buf, size, name.length);
+        size += name.length;
+      }
+    }
+
+    /* default */ void writeTerms(final MultivariatePolynomial<BigInteger> raw) {
+      writeVarint(raw.size());
+      for (final Monomial<BigInteger> term : raw) {
+        for (final int e : term.exponents) {
+          writeVarint(e);
+        }
+        writeInteger(term.coefficient);
+      }
+    }
+
+    private void writeInteger(final BigInteger value) {
+      if (value.bitLength() <= MAX_SMALL_BIT_LENGTH) {
+        // Zigzag encoding with the lowest bit cleared.
+        final long x = value.longValue();
+        writeVarint(((x << 1) ^ (x >> 63)) << 1);
+      } else {
+        // The magnitude follows, with the sign and the lowest bit set.
+        final byte[] magnitude = value.abs().toByteArray();
+        writeVarint((long) magnitude.length << 2 | (value.signum() < 0 ? 2 : 0) | 1);
+        ensureCapacity(magnitude.length);
+        System.arraycopy(magnitude, 0, buf, size, magnitude.length);
+        size += magnitude.length;
+      }
+    }
+
+    private void writeVarint(final long value) {
+      ensureCapacity(10);
+      long x = value;
+      while ((x & ~0x7FL) != 0) {
+        buf[size++] = (byte) ((x & 0x7F) | 0x80);
+        x >>>= 7;
+      }
+      buf[size++] = (byte) x;
+    }
+
+    private void write(final int b) {
+      ensureCapacity(1);
+      buf[size++] = (byte) b;
+    }
+
+    private void ensureCapacity(final int n) {
+      if (size + n > buf.length) {
+        buf = Arrays.copyOf(buf, Math.max(buf.length * 2, size + n));
+      }
+    }
+  }
+
+  /** Reader of encoded data. */
+  private static class Reader {
+    /** The data. */
+    private final byte[] data;
+
+    /** The current position. */
+    private int pos;
+
+    /** Constructs a reader after checking the header. */
+    /* default */ Reader(final byte[] data, final int tag) {
+      this.data = data;
+      if (data.length < 2 || data[0] != tag) {
+        throw new IllegalArgumentException("invalid data");
+      }
+      if (data[1] != VERSION) {
+        throw new IllegalArgumentException("unsupported version: " + data[1]);
+      }
+      pos = 2;
+    }
+
+    /* default */ VariableSet readVariables() {
+      final String[] names = new String[readInt()];
+      for (int i = 0; i < names.length; i++) {
+        final int n = readInt();
+        checkAvailable(n);
+        names[i] = new String(data, pos, n, StandardCharsets.UTF_8);
+        pos += n;
+      }
+      return Internals.createVariableSet(names);
+    }
+
+    /* default */ MultivariatePolynomial<BigInteger> readTerms(final int nvars) {
+      final int nterms = readInt();
+      final List<Monomial<BigInteger>> terms = new ArrayList<>(nterms);
+      for (int i = 0; i < nterms; i++) {
+        final int[] exponents = new int[nvars];
+        for (int j = 0; j < nvars; j++) {
+          exponents[j] = readInt();
+        }
+        terms.add(new Monomial<>(exponents, readInteger()));
+      }
+      return MultivariatePolynomial.create(nvars, Rings.Z, MonomialOrder.DEFAULT, terms);
+    }
+
+    /* default */ void checkEnd() {
+      if (pos != data.length) {
+        throw new IllegalArgumentException("trailing data");
+      }
+    }
+
+    private BigInteger readInteger() {
+      final long header = readVarint();
+      if ((header & 1) == 0) {
+        final long x = header >>> 1;
+        return BigInteger.valueOf((x >>> 1) ^ -(x & 1));
+      }
+      final int n = (int) (header >>> 2);
+      checkAvailable(n);
+      final BigInteger value = new BigInteger(1, Arrays.copyOfRange(data, pos, pos + n));
+      pos += n;
+      return (header & 2) == 0 ? value : value.negate();
+    }
+
+    private int readInt() {
+      final long x = readVarint();
+      if (x > Integer.MAX_VALUE) {
+        throw new IllegalArgumentException("integer overflow");
+      }
+      return (int) x;
+    }
+
+    private long readVarint() {
+      long x = 0;
+      for (int shift = 0; shift < 64; shift += 7) {
+        checkAvailable(1);
+        final int b = data[pos++];
+        x |= (long) (b & 0x7F) << shift;
+        if ((b & 0x80) == 0) {
+          return x;
+        }
+      }
+      throw new IllegalArgumentException("malformed varint");
+    }
+
+    private void checkAvailable(final int n) {
+      if (n < 0 || pos + n > data.length) {
+        throw new IllegalArgumentException("unexpected end of data");
+      }
+    }
+  }
+}
@@ -0,0 +1,82 @@
+package com.github.tueda.donuts.python;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import com.github.tueda.donuts.Variable;
+import com.github.tueda.donuts.VariableSet;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.ObjectInputStream;
+import java.io.ObjectOutputStream;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class provides a training workload for generating a class data sharing (CDS) archive. It
+ * loads the classes typically used by the Python binding.
+ */
+@UtilityClass
+public class CdsTraining {
+  /**
+   * Runs typical operations of the Python binding.
+   *
+   * @throws IOException when an I/O error occurs in serialization
+   * @throws ClassNotFoundException when deserialization fails
+   */
+  public static void run() throws IOException, ClassNotFoundException {
+    final Variable[] vars = Variable.of("x", "y", "z");
+    final VariableSet varset = PythonUtils.variableSet(vars);
+
+    final Polynomial a = Polynomial.of("(1+x+y)^3*(2-z)");
+    final Polynomial b = Polynomial.of("(1-x+2*z)^2*(2-z)");
+    final Polynomial c = new Polynomial(42).add(new Polynomial(vars[0].getName()));
+
+    a.add(b).subtract(c).multiply(b).pow(2).negate().translate(varset);
+    a.multiply(b).divideExact(b);
+    a.gcd(b);
+    a.lcm(b);
+    a.factors();
+    a.coefficientOf(vars[0], 1);
+    a.evaluate(vars, new int[] {1, 2, 3});
+    a.shift(vars, new int[] {1, 2, 3});
+    a.substitute(new Polynomial("x"), b);
+    a.derivative(vars[1], 2);
+    PythonUtils.getCoefficientMap(a, vars);
+    PythonUtils.sumOf(new Polynomial[] {a, b, c});
+    PythonUtils.productOf(new Polynomial[] {a, b, c});
+    PythonUtils.gcdOf(new Polynomial[] {a, b, c});
+    PythonUtils.lcmOf(new Polynomial[] {a, b, c});
+
+    final RationalFunction r = a.divide(b);
+    final RationalFunction s = new RationalFunction("(1+x)/(1-y)");
+    r.add(s).subtract(s).multiply(s).divide(s).pow(-2).getNumerator().toString();
+    r.evaluate(vars, new int[] {1, 2, 3});
+    r.substitute(new Polynomial("x"), s);
+    r.derivative(vars[2]);
+
+    BinaryFormat.decodePolynomial(BinaryFormat.encodePolynomial(a));
+    BinaryFormat.decodeRationalFunction(BinaryFormat.encodeRationalFunction(r));
+
+    final ByteArrayOutputStream bstream = new ByteArrayOutputStream();
+    try (ObjectOutputStream ostream = new ObjectOutputStream(bstream)) {
+      ostream.writeObject(varset);
+    }
+    try (ObjectInputStream istream =
+        PythonUtils.createObjectInputStream(new ByteArrayInputStream(bstream.toByteArray()))) {
+      istream.readObject();
+    }
+  }
+
+  /**
+   * Runs the training workload and prints the Java home directory.
+   *
+   * @param args the command line arguments (ignored)
+   * @throws IOException when an I/O error occurs in serialization
+   * @throws ClassNotFoundException when deserialization fails
+   */
+  @SuppressWarnings("PMD.SystemPrintln")
+  public static void main(final String[] args) throws IOException, ClassNotFoundException {
+    run();
+    System.out.println(System.getProperty("java.home"));
+  }
+}
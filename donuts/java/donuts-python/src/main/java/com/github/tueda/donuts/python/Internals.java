@@ -0,0 +1,82 @@
+package com.github.tueda.donuts.python;
+
+import cc.redberry.rings.bigint.BigInteger;
+import cc.redberry.rings.poly.multivar.MultivariatePolynomial;
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.VariableSet;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class gives access to non-public factories and accessors in Donuts, which avoid the
+ * overhead of validating data already known to be consistent, as in deserialization.
+ */
+@UtilityClass
+class Internals {
+  /** {@code VariableSet.createFromRaw}. */
+  private static final Method CREATE_VARIABLE_SET;
+
+  /** {@code VariableSet.getRawTable}. */
+  private static final Method GET_RAW_TABLE;
+
+  /** {@code Polynomial.createFromRaw}. */
+  private static final Method CREATE_POLYNOMIAL;
+
+  static {
+    try {
+      CREATE_VARIABLE_SET = VariableSet.class.getDeclaredMethod("createFromRaw", String[].class);
+      CREATE_VARIABLE_SET.setAccessible(true);
+      GET_RAW_TABLE = VariableSet.class.getDeclaredMethod("getRawTable");
+      GET_RAW_TABLE.setAccessible(true);
+      CREATE_POLYNOMIAL =
+          Polynomial.class.getDeclaredMethod(
+              "createFromRaw", VariableSet.class, MultivariatePolynomial.class);
+      CREATE_POLYNOMIAL.setAccessible(true);
+    } catch (NoSuchMethodException e) {
+      throw new ExceptionInInitializerError(e);
+    }
+  }
+
+  /**
+   * Constructs a variable set from the given table of variable names, which must be sorted as in
+   * {@link #getRawTable}.
+   *
+   * @param table the variable names
+   * @return the variable set
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  /* default */ static VariableSet createVariableSet(final String[] table) {
+    return (VariableSet) invoke(CREATE_VARIABLE_SET, null, (Object) table);
+  }
+
+  /**
+   * Returns the table of variable names in the given variable set.
+   *
+   * @param variables the variable set
+   * @return the variable names, which must not be modified
+   */
+  /* default */ static String[] getRawTable(final VariableSet variables) {
+    return (String[]) invoke(GET_RAW_TABLE, variables);
+  }
+
+  /**
+   * Constructs a polynomial from the given variables and raw polynomial.
+   *
+   * @param variables the variables
+   * @param raw the raw polynomial, with the same number of variables
+   * @return the polynomial
+   */
+  /* default */ static Polynomial createPolynomial(
+      final VariableSet variables, final MultivariatePolynomial<BigInteger> raw) {
+    return (Polynomial) invoke(CREATE_POLYNOMIAL, null, variables, raw);
+  }
+
+  private static Object invoke(final Method method, final Object obj, final Object... args) {
+    try {
+      return method.invoke(obj, args);
+    } catch (IllegalAccessException | InvocationTargetException e) {
+      throw new IllegalStateException("failed to invoke " + method.getName(), e);
+    }
+  }
+}
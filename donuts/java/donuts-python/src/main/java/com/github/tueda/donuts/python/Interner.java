@@ -0,0 +1,124 @@
+package com.github.tueda.donuts.python;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import java.lang.ref.Reference;
+import java.lang.ref.ReferenceQueue;
+import java.lang.ref.WeakReference;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.List;
+import java.util.Map;
+import java.util.WeakHashMap;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class canonicalizes immutable objects, e.g., polynomials and rational functions, such that
+ * equal objects share one instance (hash-consing). Polynomials and rational functions are
+ * canonicalized only among those with the same set of variables, because equal objects may have
+ * different sets of variables.
+ *
+ * <p>Canonical objects are weakly referenced: they are removed from the table when no longer used
+ * elsewhere. Each canonical object has a positive ID, which the Python side uses as the key of its
+ * own table of wrappers.
+ */
+@UtilityClass
+public class Interner {
+  /** Weak reference to a canonical object, with its ID. */
+  private static final class Entry extends WeakReference<Object> {
+    /** The ID. */
+    /* default */ final long id;
+
+    /* default */ Entry(final Object referent, final long id, final ReferenceQueue<Object> queue) {
+      super(referent, queue);
+      this.id = id;
+    }
+  }
+
+  /** The table from canonical objects to their entries, one for each set of variables. */
+  private static final Map<Object, List<Entry>> TABLE = new WeakHashMap<>();
+
+  /** The table from IDs to entries. */
+  private static final Map<Long, Entry> IDS = new HashMap<>();
+
+  /** The queue of entries whose objects have been collected. */
+  private static final ReferenceQueue<Object> QUEUE = new ReferenceQueue<>();
+
+  /** The last ID. */
+  private static long lastId;
+
+  /**
+   * Interns the given object.
+   *
+   * @param object the object
+   * @return the ID of the canonical object equal to the given one, negated if the given object
+   *     itself has become canonical
+   */
+  public static synchronized long intern(final Object object) {
+    expunge();
+    List<Entry> entries = TABLE.get(object);
+    if (entries == null) {
+      entries = new ArrayList<>(1);
+      TABLE.put(object, entries);
+    } else {
+      for (final Iterator<Entry> it = entries.iterator(); it.hasNext(); ) {
+        final Entry entry = it.next();
+        final Object canonical = entry.get();
+        if (canonical == null) {
+          it.remove();
+        } else if (haveSameVariables(canonical, object)) {
+          return entry.id;
+        }
+      }
+    }
+    final Entry newEntry = new Entry(object, ++lastId, QUEUE);
+    entries.add(newEntry);
+    IDS.put(newEntry.id, newEntry);
+    return -newEntry.id;
+  }
+
+  /**
+   * Returns the canonical object with the given ID.
+   *
+   * @param id the ID
+   * @return the canonical object, or {@code null} if it has been collected
+   */
+  public static synchronized Object get(final long id) {
+    final Entry entry = IDS.get(id);
+    return entry == null ? null : entry.get();
+  }
+
+  /**
+   * Returns the number of canonical objects.
+   *
+   * @return the number of canonical objects, which may include collected ones not yet removed
+   */
+  public static synchronized int size() {
+    expunge();
+    return IDS.size();
+  }
+
+  /** Removes all the canonical objects. */
+  public static synchronized void clear() {
+    expunge();
+    TABLE.clear();
+    IDS.clear();
+  }
+
+  private static boolean haveSameVariables(final Object a, final Object b) {
+    if (a instanceof Polynomial && b instanceof Polynomial) {
+      return ((Polynomial) a).getVariables().equals(((Polynomial) b).getVariables());
+    }
+    if (a instanceof RationalFunction && b instanceof RationalFunction) {
+      return ((RationalFunction) a).getVariables().equals(((RationalFunction) b).getVariables());
+    }
+    return true;
+  }
+
+  private static void expunge() {
+    for (Reference<?> ref = QUEUE.poll(); ref != null; ref = QUEUE.poll()) {
+      IDS.remove(((Entry) ref).id);
+    }
+  }
+}
@@ -0,0 +1,572 @@
+package com.github.tueda.donuts.python;
+
+import cc.redberry.rings.IntegersZp64;
+import cc.redberry.rings.bigint.BigInteger;
+import cc.redberry.rings.io.IStringifier;
+import cc.redberry.rings.poly.MachineArithmetic;
+import cc.redberry.rings.poly.PolynomialFactorDecomposition;
+import cc.redberry.rings.poly.PolynomialMethods;
+import cc.redberry.rings.poly.multivar.Monomial;
+import cc.redberry.rings.poly.multivar.MonomialOrder;
+import cc.redberry.rings.poly.multivar.MonomialZp64;
+import cc.redberry.rings.poly.multivar.MultivariateDivision;
+import cc.redberry.rings.poly.multivar.MultivariateFactorization;
+import cc.redberry.rings.poly.multivar.MultivariateGCD;
+import cc.redberry.rings.poly.multivar.MultivariatePolynomialZp64;
+import cc.redberry.rings.primes.BigPrimes;
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.Variable;
+import com.github.tueda.donuts.VariableSet;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+
+/**
+ * An immutable multivariate polynomial with coefficients in the integers modulo a word-size prime
+ * {@code p}, stored as machine words.
+ *
+ * <p>As for {@link Polynomial}, operands with different sets of variables are translated to the
+ * union of them. Operands must have the same modulus.
+ */
+public final class ModPolynomial {
+  /** The variables. */
+  private final VariableSet variables;
+
+  /** The raw polynomial. */
+  private final MultivariatePolynomialZp64 raw;
+
+  private ModPolynomial(final VariableSet variables, final MultivariatePolynomialZp64 raw) {
+    this.variables = variables;
+    this.raw = raw;
+  }
+
+  /**
+   * Reduces the given polynomial modulo the given prime.
+   *
+   * @param polynomial the polynomial
+   * @param modulus the modulus
+   * @return {@code polynomial mod modulus}
+   * @throws IllegalArgumentException when the modulus is not a prime less than {@code 2^62}
+   */
+  public static ModPolynomial of(final Polynomial polynomial, final long modulus) {
+    if (modulus < 2
+        || modulus > MachineArithmetic.MAX_SUPPORTED_MODULUS
+        || !BigPrimes.isPrime(modulus)) {
+      throw new IllegalArgumentException("invalid modulus: " + modulus);
+    }
+    return reduce(polynomial, new IntegersZp64(modulus));
+  }
+
+  private static ModPolynomial reduce(final Polynomial polynomial, final IntegersZp64 ring) {
+    final VariableSet variables = polynomial.getVariables();
+    final List<MonomialZp64> terms = new ArrayList<>(polynomial.size());
+    for (final Monomial<BigInteger> term : polynomial.getRawPolynomial()) {
+      final long c = reduce(term.coefficient, ring);
+      if (c != 0) {
+        terms.add(new MonomialZp64(term.exponents, c));
+      }
+    }
+    return new ModPolynomial(
+        variables,
+        MultivariatePolynomialZp64.create(variables.size(), ring, MonomialOrder.DEFAULT, terms));
+  }
+
+  private static long reduce(final BigInteger value, final IntegersZp64 ring) {
+    return value.isLong() ? ring.modulus(value.longValue()) : ring.modulus(value);
+  }
+
+  /**
+   * Reduces the given polynomial modulo the modulus of this polynomial.
+   *
+   * @param polynomial the polynomial
+   * @return {@code polynomial mod p}
+   */
+  public ModPolynomial reduce(final Polynomial polynomial) {
+    return reduce(polynomial, raw.ring);
+  }
+
+  /**
+   * Returns the modulus.
+   *
+   * @return the modulus
+   */
+  public long getModulus() {
+    return raw.ring.modulus;
+  }
+
+  /**
+   * Returns the set of variables.
+   *
+   * @return the variables
+   */
+  public VariableSet getVariables() {
+    return variables;
+  }
+
+  /**
+   * Returns the set of variables actually used in this polynomial.
+   *
+   * @return the minimal set of variables
+   */
+  public VariableSet getMinimalVariables() {
+    final String[] table = Internals.getRawTable(variables);
+    final int[] degrees = raw.degrees();
+    final List<String> names = new ArrayList<>();
+    for (int i = 0; i < table.length; i++) {
+      if (degrees[i] > 0) {
+        names.add(table[i]);
+      }
+    }
+    if (names.size() == table.length) {
+      return variables;
+    }
+    return Internals.createVariableSet(names.toArray(new String[0]));
+  }
+
+  /**
+   * Returns the number of terms.
+   *
+   * @return the number of terms
+   */
+  public int size() {
+    return raw.size();
+  }
+
+  /**
+   * Returns the total degree.
+   *
+   * @return the total degree
+   */
+  public int degree() {
+    return raw.degree();
+  }
+
+  /**
+   * Returns whether this polynomial is zero.
+   *
+   * @return {@code true} if this polynomial is zero
+   */
+  public boolean isZero() {
+    return raw.isZero();
+  }
+
+  /**
+   * Returns whether this polynomial is one.
+   *
+   * @return {@code true} if this polynomial is one
+   */
+  public boolean isOne() {
+    return raw.isOne();
+  }
+
+  /**
+   * Returns whether this polynomial is a constant.
+   *
+   * @return {@code true} if this polynomial is a constant
+   */
+  public boolean isConstant() {
+    return raw.isConstant();
+  }
+
+  /**
+   * Returns the constant term.
+   *
+   * @return the constant term in {@code [0, p)}
+   */
+  public long constantTerm() {
+    return raw.cc();
+  }
+
+  /**
+   * Lifts this polynomial to a polynomial over the integers.
+   *
+   * @param symmetric whether the coefficients are taken in {@code (-p/2, p/2]} instead of {@code
+   *     [0, p)}
+   * @return the polynomial
+   */
+  public Polynomial lift(final boolean symmetric) {
+    return Internals.createPolynomial(
+        variables, symmetric ? raw.asPolyZSymmetric() : raw.asPolyZ());
+  }
+
+  /**
+   * Returns the negation of this polynomial.
+   *
+   * @return {@code -this}
+   */
+  public ModPolynomial negate() {
+    return new ModPolynomial(variables, raw.copy().negate());
+  }
+
+  /**
+   * Returns the sum of this polynomial and the other.
+   *
+   * @param other the other polynomial
+   * @return {@code this + other}
+   */
+  public ModPolynomial add(final ModPolynomial other) {
+    final VariableSet newVariables = unify(other);
+    return new ModPolynomial(
+        newVariables, copyRaw(newVariables).add(other.translateRaw(newVariables)));
+  }
+
+  /**
+   * Returns the difference of this polynomial and the other.
+   *
+   * @param other the other polynomial
+   * @return {@code this - other}
+   */
+  public ModPolynomial subtract(final ModPolynomial other) {
+    final VariableSet newVariables = unify(other);
+    return new ModPolynomial(
+        newVariables, copyRaw(newVariables).subtract(other.translateRaw(newVariables)));
+  }
+
+  /**
+   * Returns the product of this polynomial and the other.
+   *
+   * @param other the other polynomial
+   * @return {@code this * other}
+   */
+  public ModPolynomial multiply(final ModPolynomial other) {
+    final VariableSet newVariables = unify(other);
+    return new ModPolynomial(
+        newVariables, copyRaw(newVariables).multiply(other.translateRaw(newVariables)));
+  }
+
+  /**
+   * Returns this polynomial raised to the given power.
+   *
+   * @param exponent the exponent
+   * @return {@code this^exponent}
+   * @throws IllegalArgumentException when the exponent is negative
+   */
+  public ModPolynomial pow(final int exponent) {
+    if (exponent < 0) {
+      throw new IllegalArgumentException("negative exponent: " + exponent);
+    }
+    return new ModPolynomial(variables, PolynomialMethods.polyPow(raw, exponent, true));
+  }
+
+  /**
+   * Returns the exact quotient of this polynomial and the other.
+   *
+   * @param other the divisor
+   * @return {@code this / other}
+   * @throws ArithmeticException when the division is not exact
+   */
+  public ModPolynomial divideExact(final ModPolynomial other) {
+    if (other.isZero()) {
+      throw new ArithmeticException("divide by zero");
+    }
+    final VariableSet newVariables = unify(other);
+    final MultivariatePolynomialZp64 quotient =
+        MultivariateDivision.divideOrNull(
+            translateRaw(newVariables), other.translateRaw(newVariables));
+    if (quotient == null) {
+      throw new ArithmeticException("not divisible");
+    }
+    return new ModPolynomial(newVariables, quotient);
+  }
+
+  /**
+   * Returns the monic greatest common divisor of this polynomial and the other.
+   *
+   * @param other the other polynomial
+   * @return {@code GCD(this, other)}
+   */
+  public ModPolynomial gcd(final ModPolynomial other) {
+    final VariableSet newVariables = unify(other);
+    return new ModPolynomial(
+        newVariables,
+        MultivariateGCD.PolynomialGCD(
+            translateRaw(newVariables), other.translateRaw(newVariables)));
+  }
+
+  /**
+   * Returns the factorization of this polynomial.
+   *
+   * @return the factors, starting with the leading coefficient unless it is one, with repeated
+   *     factors given as many times as their multiplicities
+   */
+  public ModPolynomial[] factors() {
+    if (raw.isConstant()) {
+      return new ModPolynomial[] {this};
+    }
+    final PolynomialFactorDecomposition<MultivariatePolynomialZp64> decomposition =
+        MultivariateFactorization.Factor(raw);
+    final List<ModPolynomial> result = new ArrayList<>();
+    if (!decomposition.unit.isOne()) {
+      result.add(new ModPolynomial(variables, decomposition.unit));
+    }
+    for (int i = 0; i < decomposition.size(); i++) {
+      final ModPolynomial factor = new ModPolynomial(variables, decomposition.get(i));
+      for (int j = 0; j < decomposition.getExponent(i); j++) {
+        result.add(factor);
+      }
+    }
+    return result.toArray(new ModPolynomial[0]);
+  }
+
+  /**
+   * Returns the result of setting the given variables to the specified values.
+   *
+   * @param variables the variables
+   * @param values the values, packed as in {@link PolynomialArrays}
+   * @param bigValues whether the values are packed as big integers
+   * @return the result
+   */
+  public ModPolynomial evaluate(
+      final Variable[] variables, final byte[] values, final boolean bigValues) {
+    final BigInteger[] unpacked =
+        PolynomialArrays.unpackIntegers(variables.length, values, bigValues);
+    final int[] indices =
+        PolynomialArrays.findIndices(Internals.getRawTable(this.variables), variables);
+    int n = 0;
+    for (final int k : indices) {
+      if (k >= 0) {
+        n++;
+      }
+    }
+    if (n == 0) {
+      return this;
+    }
+    final int[] rawIndices = new int[n];
+    final long[] rawValues = new long[n];
+    n = 0;
+    for (int i = 0; i < indices.length; i++) {
+      if (indices[i] >= 0) {
+        rawIndices[n] = indices[i];
+        rawValues[n] = raw.ring.modulus(unpacked[i]);
+        n++;
+      }
+    }
+    return new ModPolynomial(this.variables, raw.evaluate(rawIndices, rawValues));
+  }
+
+  /**
+   * Evaluates the ratio of the given polynomials at many points.
+   *
+   * <p>The result consists of the values as little-endian 64-bit integers in {@code [0, p)}, or
+   * -1 for points where the denominator vanishes.
+   *
+   * @param numerator the numerator
+   * @param denominator the denominator
+   * @param variables the variables corresponding to the columns of the point matrix
+   * @param npoints the number of points
+   * @param points the row-major {@code (npoints, nvars)} point matrix, packed as in {@link
+   *     PolynomialArrays}
+   * @param bigPoints whether the points are packed as big integers
+   * @param parallel whether to evaluate on multiple threads
+   * @return the packed values
+   * @throws IllegalArgumentException when the polynomials depend on other variables or have
+   *     different moduli, or the arrays are inconsistent
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static byte[] evaluateRatios(
+      final ModPolynomial numerator,
+      final ModPolynomial denominator,
+      final Variable[] variables,
+      final int npoints,
+      final byte[] points,
+      final boolean bigPoints,
+      final boolean parallel) {
+    numerator.checkModulus(denominator);
+    final int nvars = variables.length;
+    if (npoints < 0
+        || npoints > Integer.MAX_VALUE / Long.BYTES
+        || (long) npoints * nvars > Integer.MAX_VALUE) {
+      throw new IllegalArgumentException("invalid number of points");
+    }
+    if (new VariableSet(variables).size() != nvars) {
+      throw new IllegalArgumentException("duplicate variables");
+    }
+
+    final IntegersZp64 ring = numerator.raw.ring;
+    final Evaluator num = new Evaluator(numerator, variables);
+    final Evaluator den = new Evaluator(denominator, variables);
+    final BigInteger[] unpacked =
+        PolynomialArrays.unpackIntegers(npoints * nvars, points, bigPoints);
+    final long[] values = new long[unpacked.length];
+    for (int i = 0; i < values.length; i++) {
+      values[i] = reduce(unpacked[i], ring);
+    }
+
+    final long[] results = new long[npoints];
+    PythonUtils.indices(npoints, parallel)
+        .forEach(
+            i -> {
+              final long d = den.evaluate(values, i * nvars);
+              results[i] =
+                  d == 0 ? -1 : ring.multiply(num.evaluate(values, i * nvars), ring.reciprocal(d));
+            });
+
+    final ByteBuffer buf =
+        ByteBuffer.allocate(Long.BYTES * npoints).order(ByteOrder.LITTLE_ENDIAN);
+    for (final long x : results) {
+      buf.putLong(x);
+    }
+    return buf.array();
+  }
+
+  /** Evaluator of a polynomial with power tables of the values. */
+  private static final class Evaluator {
+    /** The ring. */
+    private final IntegersZp64 ring;
+
+    /** The exponents of the terms, for each column. */
+    private final int[][] exponents;
+
+    /** The coefficients of the terms. */
+    private final long[] coefficients;
+
+    /** The degrees for each column. */
+    private final int[] degrees;
+
+    /* default */ Evaluator(final ModPolynomial polynomial, final Variable[] variables) {
+      final String[] table = Internals.getRawTable(polynomial.variables);
+      final int[] indices = PolynomialArrays.findIndices(table, variables);
+      PolynomialArrays.checkColumns(table, polynomial.raw.degrees(), indices);
+
+      final int nterms = polynomial.raw.size();
+      final int nvars = indices.length;
+      ring = polynomial.raw.ring;
+      exponents = new int[nterms][nvars];
+      coefficients = new long[nterms];
+      degrees = new int[nvars];
+      int i = 0;
+      for (final MonomialZp64 term : polynomial.raw) {
+        for (int j = 0; j < nvars; j++) {
+          final int e = indices[j] >= 0 ? term.exponents[indices[j]] : 0;
+          exponents[i][j] = e;
+          degrees[j] = Math.max(degrees[j], e);
+        }
+        coefficients[i] = term.coefficient;
+        i++;
+      }
+    }
+
+    /** Returns the value at the point starting at the given offset. */
+    /* default */ long evaluate(final long[] values, final int offset) {
+      final long[][] powers = new long[degrees.length][];
+      for (int j = 0; j < degrees.length; j++) {
+        powers[j] = new long[degrees[j] + 1];
+        powers[j][0] = 1;
+        for (int e = 1; e <= degrees[j]; e++) {
+          powers[j][e] = ring.multiply(powers[j][e - 1], values[offset + j]);
+        }
+      }
+      long sum = 0;
+      for (int i = 0; i < exponents.length; i++) {
+        long t = coefficients[i];
+        for (int j = 0; j < degrees.length; j++) {
+          if (exponents[i][j] > 0) {
+            t = ring.multiply(t, powers[j][exponents[i][j]]);
+          }
+        }
+        sum = ring.add(sum, t);
+      }
+      return sum;
+    }
+  }
+
+  /**
+   * Returns the result of substituting the given polynomial for the given variable.
+   *
+   * @param variable the variable
+   * @param value the polynomial to be substituted
+   * @return the result
+   */
+  public ModPolynomial substitute(final Variable variable, final ModPolynomial value) {
+    // NOTE: MultivariatePolynomialZp64.substitute gives wrong results in some cases.
+    checkModulus(value);
+    final VariableSet newVariables =
+        variables.union(value.variables).union(new VariableSet(variable));
+    final int[] indices =
+        PolynomialArrays.findIndices(
+            Internals.getRawTable(newVariables), new Variable[] {variable});
+    return new ModPolynomial(
+        newVariables,
+        translateRaw(newVariables).composition(indices[0], value.translateRaw(newVariables)));
+  }
+
+  @Override
+  public boolean equals(final Object other) {
+    if (this == other) {
+      return true;
+    }
+    if (!(other instanceof ModPolynomial)) {
+      return false;
+    }
+    final ModPolynomial o = (ModPolynomial) other;
+    if (getModulus() != o.getModulus()) {
+      return false;
+    }
+    if (variables.equals(o.variables)) {
+      return raw.equals(o.raw);
+    }
+    final VariableSet newVariables = variables.union(o.variables);
+    return translateRaw(newVariables).equals(o.translateRaw(newVariables));
+  }
+
+  @Override
+  public int hashCode() {
+    return translateRaw(getMinimalVariables()).hashCode();
+  }
+
+  @Override
+  public String toString() {
+    return raw.toString(IStringifier.mkPolyStringifier(raw, Internals.getRawTable(variables)));
+  }
+
+  private void checkModulus(final ModPolynomial other) {
+    if (getModulus() != other.getModulus()) {
+      throw new IllegalArgumentException("different moduli");
+    }
+  }
+
+  private VariableSet unify(final ModPolynomial other) {
+    checkModulus(other);
+    return variables.equals(other.variables) ? variables : variables.union(other.variables);
+  }
+
+  /** Returns a copy of the raw polynomial, which may be modified, in the given variables. */
+  private MultivariatePolynomialZp64 copyRaw(final VariableSet newVariables) {
+    return variables.equals(newVariables) ? raw.copy() : translateRaw(newVariables);
+  }
+
+  /**
+   * Returns the raw polynomial in the given variables, which must not be modified. The given
+   * variables must be a superset of the variables of this polynomial, or a subset including all
+   * the variables actually used.
+   */
+  private MultivariatePolynomialZp64 translateRaw(final VariableSet newVariables) {
+    if (variables.equals(newVariables)) {
+      return raw;
+    }
+    final int nvars = newVariables.size();
+    // The old index for each new variable, or -1 for a new variable.
+    int[] indices = newVariables.map(variables);
+    if (indices == null) {
+      indices = new int[nvars];
+      Arrays.fill(indices, -1);
+      final int[] map = variables.map(newVariables);
+      for (int i = 0; i < map.length; i++) {
+        indices[map[i]] = i;
+      }
+    }
+    final List<MonomialZp64> terms = new ArrayList<>(raw.size());
+    for (final MonomialZp64 term : raw) {
+      final int[] exponents = new int[nvars];
+      for (int i = 0; i < nvars; i++) {
+        if (indices[i] >= 0) {
+          exponents[i] = term.exponents[indices[i]];
+        }
+      }
+      terms.add(new MonomialZp64(exponents, term.coefficient));
+    }
+    return MultivariatePolynomialZp64.create(nvars, raw.ring, raw.ordering, terms);
+  }
+}
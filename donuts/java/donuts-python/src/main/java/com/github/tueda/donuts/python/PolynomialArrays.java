@@ -0,0 +1,477 @@
+package com.github.tueda.donuts.python;
+
+import cc.redberry.rings.Rings;
+import cc.redberry.rings.bigint.BigInteger;
+import cc.redberry.rings.poly.multivar.Monomial;
+import cc.redberry.rings.poly.multivar.MonomialOrder;
+import cc.redberry.rings.poly.multivar.MultivariatePolynomial;
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.Variable;
+import com.github.tueda.donuts.VariableSet;
+import java.nio.BufferUnderflowException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.List;
+import java.util.Map;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class converts polynomials from/to packed arrays of exponents and coefficients, which can be
+ * transferred from/to Python in bulk.
+ *
+ * <p>Exponents are given as a row-major {@code (nterms, nvars)} matrix of little-endian 32-bit
+ * integers. Coefficients are given either as little-endian 64-bit integers, or, for big integers,
+ * as a sequence of a little-endian 32-bit length followed by the big-endian two's-complement
+ * representation of that length.
+ */
+@UtilityClass
+public class PolynomialArrays {
+  /**
+   * Constructs a polynomial from packed arrays. Terms with the same exponents are summed up.
+   *
+   * @param variables the variables corresponding to the columns of the exponent matrix
+   * @param nterms the number of terms
+   * @param exponents the packed exponent matrix
+   * @param coefficients the packed coefficients
+   * @param bigCoefficients whether the coefficients are packed as big integers
+   * @return the polynomial
+   * @throws IllegalArgumentException when the arrays are inconsistent
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial fromArrays(
+      final Variable[] variables,
+      final int nterms,
+      final byte[] exponents,
+      final byte[] coefficients,
+      final boolean bigCoefficients) {
+    final int nvars = variables.length;
+    if (nterms < 0 || exponents.length != 4L * nterms * nvars) {
+      throw new IllegalArgumentException("invalid size of exponents");
+    }
+
+    final VariableSet varset = new VariableSet(variables);
+    if (varset.size() != nvars) {
+      throw new IllegalArgumentException("duplicate variables");
+    }
+    final int[] indices = findIndices(Internals.getRawTable(varset), variables);
+
+    final BigInteger[] coeffs = unpackIntegers(nterms, coefficients, bigCoefficients);
+
+    final ByteBuffer buf = ByteBuffer.wrap(exponents).order(ByteOrder.LITTLE_ENDIAN);
+    final List<Monomial<BigInteger>> terms = new ArrayList<>(nterms);
+    for (int i = 0; i < nterms; i++) {
+      final int[] exps = new int[nvars];
+      for (int j = 0; j < nvars; j++) {
+        final int e = buf.getInt();
+        if (e < 0) {
+          throw new IllegalArgumentException("negative exponent: " + e);
+        }
+        exps[indices[j]] = e;
+      }
+      if (!coeffs[i].isZero()) {
+        terms.add(new Monomial<>(exps, coeffs[i]));
+      }
+    }
+
+    return Internals.createPolynomial(
+        varset, MultivariatePolynomial.create(nvars, Rings.Z, MonomialOrder.DEFAULT, terms));
+  }
+
+  /**
+   * Converts a polynomial to packed arrays.
+   *
+   * <p>The result consists of the number of terms, the number of variables and a flag whether the
+   * coefficients are packed as big integers (all little-endian 32-bit integers), followed by the
+   * packed exponent matrix and the packed coefficients. Variables not in the polynomial give zero
+   * columns.
+   *
+   * @param polynomial the polynomial
+   * @param variables the variables corresponding to the columns of the exponent matrix, or {@code
+   *     null} for the variables of the polynomial
+   * @return the packed arrays
+   * @throws IllegalArgumentException when the polynomial depends on other variables
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static byte[] toArrays(final Polynomial polynomial, final Variable[] variables) {
+    final int[] indices = findColumns(polynomial, variables);
+    final MultivariatePolynomial<BigInteger> raw = polynomial.getRawPolynomial();
+    return packTerms(raw, raw.size(), indices);
+  }
+
+  /**
+   * Returns chunks of the terms of a polynomial, packed in the same way as {@link #toArrays}.
+   *
+   * @param polynomial the polynomial
+   * @param variables the variables corresponding to the columns of the exponent matrix, or {@code
+   *     null} for the variables of the polynomial
+   * @return the chunks
+   * @throws IllegalArgumentException when the polynomial depends on other variables
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static TermChunks toChunks(final Polynomial polynomial, final Variable[] variables) {
+    return new TermChunks(polynomial, findColumns(polynomial, variables));
+  }
+
+  /** Chunks of the terms of a polynomial. */
+  public static final class TermChunks {
+    /** The iterator of the remaining terms. */
+    private final Iterator<Monomial<BigInteger>> iterator;
+
+    /** The number of the remaining terms. */
+    private int remaining;
+
+    /** The columns of the exponent matrix. */
+    private final int[] indices;
+
+    /* default */ TermChunks(final Polynomial polynomial, final int[] indices) {
+      final MultivariatePolynomial<BigInteger> raw = polynomial.getRawPolynomial();
+      this.iterator = raw.iterator();
+      this.remaining = raw.size();
+      this.indices = indices;
+    }
+
+    /**
+     * Returns the next chunk of terms, packed in the same way as {@link #toArrays}. After all terms
+     * are returned, the chunk contains no terms.
+     *
+     * @param maxTerms the maximum number of terms in the chunk
+     * @return the packed chunk
+     * @throws IllegalArgumentException when {@code maxTerms} is not positive
+     */
+    public byte[] next(final int maxTerms) {
+      if (maxTerms <= 0) {
+        throw new IllegalArgumentException("non-positive chunk size: " + maxTerms);
+      }
+      final int nterms = Math.min(maxTerms, remaining);
+      final List<Monomial<BigInteger>> terms = new ArrayList<>(nterms);
+      for (int i = 0; i < nterms; i++) {
+        terms.add(iterator.next());
+      }
+      remaining -= nterms;
+      return packTerms(terms, nterms, indices);
+    }
+  }
+
+  /**
+   * Evaluates a polynomial at many points.
+   *
+   * <p>The result consists of the number of points and a flag whether the values are packed as big
+   * integers (both little-endian 32-bit integers), followed by the values packed in the same way
+   * as coefficients.
+   *
+   * @param polynomial the polynomial
+   * @param variables the variables corresponding to the columns of the point matrix
+   * @param npoints the number of points
+   * @param points the row-major {@code (npoints, nvars)} point matrix, packed in the same way as
+   *     coefficients
+   * @param bigPoints whether the points are packed as big integers
+   * @param parallel whether to evaluate on multiple threads
+   * @return the packed values
+   * @throws IllegalArgumentException when the polynomial depends on other variables, or the
+   *     arrays are inconsistent
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static byte[] evaluateMany(
+      final Polynomial polynomial,
+      final Variable[] variables,
+      final int npoints,
+      final byte[] points,
+      final boolean bigPoints,
+      final boolean parallel) {
+    final int nvars = variables.length;
+    if (npoints < 0 || (long) npoints * nvars > Integer.MAX_VALUE) {
+      throw new IllegalArgumentException("invalid number of points");
+    }
+    if (new VariableSet(variables).size() != nvars) {
+      throw new IllegalArgumentException("duplicate variables");
+    }
+
+    final Evaluator evaluator = new Evaluator(polynomial, findColumns(polynomial, variables));
+    final BigInteger[] values = unpackIntegers(npoints * nvars, points, bigPoints);
+    final BigInteger[] results = new BigInteger[npoints];
+    PythonUtils.indices(npoints, parallel)
+        .forEach(i -> results[i] = evaluator.evaluate(values, i * nvars));
+    return packIntegers(results);
+  }
+
+  /** Evaluator of a polynomial with power tables of the values. */
+  private static final class Evaluator {
+    /** The exponents of the terms, for each column. */
+    private final int[][] exponents;
+
+    /** The coefficients of the terms. */
+    private final BigInteger[] coefficients;
+
+    /** The coefficients of the terms as machine words, or {@code null} if some do not fit. */
+    private final long[] longCoefficients;
+
+    /** The degrees for each column. */
+    private final int[] degrees;
+
+    /* default */ Evaluator(final Polynomial polynomial, final int[] indices) {
+      final MultivariatePolynomial<BigInteger> raw = polynomial.getRawPolynomial();
+      final int nterms = raw.size();
+      final int nvars = indices.length;
+      exponents = new int[nterms][nvars];
+      coefficients = new BigInteger[nterms];
+      degrees = new int[nvars];
+      long[] longs = new long[nterms];
+      int i = 0;
+      for (final Monomial<BigInteger> term : raw) {
+        for (int j = 0; j < nvars; j++) {
+          final int e = indices[j] >= 0 ? term.exponents[indices[j]] : 0;
+          exponents[i][j] = e;
+          degrees[j] = Math.max(degrees[j], e);
+        }
+        coefficients[i] = term.coefficient;
+        if (longs != null) {
+          if (term.coefficient.isLong()) {
+            longs[i] = term.coefficient.longValue();
+          } else {
+            longs = null;
+          }
+        }
+        i++;
+      }
+      longCoefficients = longs;
+    }
+
+    /** Returns the value at the point starting at the given offset. */
+    /* default */ BigInteger evaluate(final BigInteger[] values, final int offset) {
+      if (longCoefficients != null) {
+        try {
+          return BigInteger.valueOf(evaluateLong(values, offset));
+        } catch (ArithmeticException e) {
+          // Overflow: fall back to big integers.
+        }
+      }
+      return evaluateBig(values, offset);
+    }
+
+    private long evaluateLong(final BigInteger[] values, final int offset) {
+      final long[][] powers = new long[degrees.length][];
+      for (int j = 0; j < degrees.length; j++) {
+        final BigInteger x = values[offset + j];
+        if (!x.isLong()) {
+          throw new ArithmeticException("long overflow");
+        }
+        final long v = x.longValue();
+        powers[j] = new long[degrees[j] + 1];
+        powers[j][0] = 1;
+        for (int e = 1; e <= degrees[j]; e++) {
+          powers[j][e] = Math.multiplyExact(powers[j][e - 1], v);
+        }
+      }
+      long sum = 0;
+      for (int i = 0; i < exponents.length; i++) {
+        long t = longCoefficients[i];
+        for (int j = 0; j < degrees.length; j++) {
+          t = Math.multiplyExact(t, powers[j][exponents[i][j]]);
+        }
+        sum = Math.addExact(sum, t);
+      }
+      return sum;
+    }
+
+    private BigInteger evaluateBig(final BigInteger[] values, final int offset) {
+      final BigInteger[][] powers = new BigInteger[degrees.length][];
+      for (int j = 0; j < degrees.length; j++) {
+        powers[j] = new BigInteger[degrees[j] + 1];
+        powers[j][0] = BigInteger.ONE;
+        for (int e = 1; e <= degrees[j]; e++) {
+          powers[j][e] = powers[j][e - 1].multiply(values[offset + j]);
+        }
+      }
+      BigInteger sum = BigInteger.ZERO;
+      for (int i = 0; i < exponents.length; i++) {
+        BigInteger t = coefficients[i];
+        for (int j = 0; j < degrees.length; j++) {
+          if (exponents[i][j] > 0) {
+            t = t.multiply(powers[j][exponents[i][j]]);
+          }
+        }
+        sum = sum.add(t);
+      }
+      return sum;
+    }
+  }
+
+  /**
+   * Returns the columns of the exponent matrix, as indices in the variable table of the
+   * polynomial, or -1 for variables not in the polynomial.
+   */
+  private static int[] findColumns(final Polynomial polynomial, final Variable[] variables) {
+    final String[] table = Internals.getRawTable(polynomial.getVariables());
+    final int[] indices;
+    if (variables == null) {
+      indices = new int[table.length];
+      for (int k = 0; k < table.length; k++) {
+        indices[k] = k;
+      }
+    } else {
+      indices = findIndices(table, variables);
+    }
+    checkColumns(table, polynomial.getRawPolynomial().degrees(), indices);
+    return indices;
+  }
+
+  /**
+   * Checks that the given columns cover all the variables with non-zero degrees.
+   *
+   * @throws IllegalArgumentException when the polynomial depends on other variables
+   */
+  /* default */ static void checkColumns(
+      final String[] table, final int[] degrees, final int[] indices) {
+    final boolean[] covered = new boolean[table.length];
+    for (final int k : indices) {
+      if (k >= 0) {
+        covered[k] = true;
+      }
+    }
+    for (int k = 0; k < table.length; k++) {
+      if (!covered[k] && degrees[k] > 0) {
+        throw new IllegalArgumentException("polynomial depends on " + table[k]);
+      }
+    }
+  }
+
+  /** Packs the given terms. */
+  private static byte[] packTerms(
+      final Iterable<Monomial<BigInteger>> terms, final int nterms, final int[] indices) {
+    final int nvars = indices.length;
+    boolean bigCoefficients = false;
+    for (final Monomial<BigInteger> term : terms) {
+      if (term.coefficient.bitLength() > Long.SIZE - 1) {
+        bigCoefficients = true;
+        break;
+      }
+    }
+
+    final byte[][] bigValues = bigCoefficients ? new byte[nterms][] : null;
+    long size = 12 + 4L * nterms * nvars;
+    if (bigCoefficients) {
+      int i = 0;
+      for (final Monomial<BigInteger> term : terms) {
+        bigValues[i] = term.coefficient.toByteArray();
+        size += 4 + bigValues[i].length;
+        i++;
+      }
+    } else {
+      size += 8L * nterms;
+    }
+    if (size > Integer.MAX_VALUE) {
+      throw new IllegalArgumentException("polynomial too large");
+    }
+
+    final ByteBuffer buf = ByteBuffer.allocate((int) size).order(ByteOrder.LITTLE_ENDIAN);
+    buf.putInt(nterms);
+    buf.putInt(nvars);
+    buf.putInt(bigCoefficients ? 1 : 0);
+    for (final Monomial<BigInteger> term : terms) {
+      for (final int k : indices) {
+        buf.putInt(k >= 0 ? term.exponents[k] : 0);
+      }
+    }
+    if (bigCoefficients) {
+      for (final byte[] bytes : bigValues) {
+        buf.putInt(bytes.length);
+        buf.put(bytes);
+      }
+    } else {
+      for (final Monomial<BigInteger> term : terms) {
+        buf.putLong(term.coefficient.longValue());
+      }
+    }
+    return buf.array();
+  }
+
+  /** Packs the given integers, preceded by their number and the format flag. */
+  @SuppressWarnings("PMD.UseVarargs")
+  private static byte[] packIntegers(final BigInteger[] values) {
+    boolean big = false;
+    for (final BigInteger x : values) {
+      if (x.bitLength() > Long.SIZE - 1) {
+        big = true;
+        break;
+      }
+    }
+
+    final byte[][] bigValues = big ? new byte[values.length][] : null;
+    long size = 8;
+    if (big) {
+      for (int i = 0; i < values.length; i++) {
+        bigValues[i] = values[i].toByteArray();
+        size += 4 + bigValues[i].length;
+      }
+    } else {
+      size += 8L * values.length;
+    }
+    if (size > Integer.MAX_VALUE) {
+      throw new IllegalArgumentException("values too large");
+    }
+
+    final ByteBuffer buf = ByteBuffer.allocate((int) size).order(ByteOrder.LITTLE_ENDIAN);
+    buf.putInt(values.length);
+    buf.putInt(big ? 1 : 0);
+    if (big) {
+      for (final byte[] bytes : bigValues) {
+        buf.putInt(bytes.length);
+        buf.put(bytes);
+      }
+    } else {
+      for (final BigInteger x : values) {
+        buf.putLong(x.longValue());
+      }
+    }
+    return buf.array();
+  }
+
+  /** Returns the indices of the given variables in the table, or -1 for those not found. */
+  /* default */ static int[] findIndices(final String[] table, final Variable[] variables) {
+    final Map<String, Integer> map = new HashMap<>();
+    for (int i = 0; i < table.length; i++) {
+      map.put(table[i], i);
+    }
+    final int[] indices = new int[variables.length];
+    for (int i = 0; i < variables.length; i++) {
+      final Integer k = map.get(variables[i].getName());
+      indices[i] = k == null ? -1 : k;
+    }
+    return indices;
+  }
+
+  /**
+   * Unpacks integers, packed in the same way as coefficients.
+   *
+   * @param n the number of integers
+   * @param data the packed integers
+   * @param big whether the integers are packed as big integers
+   * @return the integers
+   * @throws IllegalArgumentException when the size of the data is inconsistent
+   */
+  /* default */ static BigInteger[] unpackIntegers(
+      final int n, final byte[] data, final boolean big) {
+    final BigInteger[] result = new BigInteger[n];
+    final ByteBuffer buf = ByteBuffer.wrap(data).order(ByteOrder.LITTLE_ENDIAN);
+    try {
+      for (int i = 0; i < n; i++) {
+        if (big) {
+          final byte[] bytes = new byte[buf.getInt()];
+          buf.get(bytes);
+          result[i] = new BigInteger(bytes);
+        } else {
+          result[i] = BigInteger.valueOf(buf.getLong());
+        }
+      }
+    } catch (BufferUnderflowException | NegativeArraySizeException | NumberFormatException e) {
+      throw new IllegalArgumentException("invalid size of integers", e);
+    }
+    if (buf.hasRemaining()) {
+      throw new IllegalArgumentException("invalid size of integers");
+    }
+    return result;
+  }
+}
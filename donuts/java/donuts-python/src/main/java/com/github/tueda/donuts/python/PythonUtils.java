@@ -1,13 +1,20 @@
 package com.github.tueda.donuts.python;
 
+import cc.redberry.rings.bigint.BigInteger;
 import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
 import com.github.tueda.donuts.Variable;
 import com.github.tueda.donuts.VariableSet;
 import java.io.IOException;
 import java.io.InputStream;
 import java.io.ObjectInputStream;
 import java.io.ObjectStreamClass;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.ArrayList;
+import java.util.List;
 import java.util.Map;
+import java.util.stream.IntStream;
 import lombok.experimental.UtilityClass;
 
 /** This class consists of static utility methods for Python binding. */
@@ -56,6 +63,263 @@ public class PythonUtils {
     return new VariableSet(variables);
   }
 
+  /**
+   * Construct a variable set from the given variable names.
+   *
+   * @param names the variable names separated by commas, as returned by {@link
+   *     #getVariableNames}
+   * @return the variable set
+   */
+  public static VariableSet variableSetOf(final String names) {
+    if (names.isEmpty()) {
+      return new VariableSet();
+    }
+    return Internals.createVariableSet(names.split(",", -1));
+  }
+
+  /**
+   * Returns the names of the variables in the given set.
+   *
+   * @param variables the variable set
+   * @return the variable names separated by commas
+   */
+  public static String getVariableNames(final VariableSet variables) {
+    return String.join(",", Internals.getRawTable(variables));
+  }
+
+  // The following methods transfer big integers as their two's-complement
+  // representations in big-endian byte order, which are much cheaper than the
+  // decimal strings to be parsed.
+
+  /**
+   * Construct an integer polynomial.
+   *
+   * @param value the two's-complement representation of the integer
+   * @return the polynomial
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial polynomialOf(final byte[] value) {
+    return new Polynomial(new BigInteger(value));
+  }
+
+  /**
+   * Construct a rational number as a rational function.
+   *
+   * @param numerator the two's-complement representation of the numerator
+   * @param denominator the two's-complement representation of the denominator
+   * @return the rational function
+   * @throws ArithmeticException when the denominator is zero
+   */
+  public static RationalFunction rationalFunctionOf(
+      final byte[] numerator, final byte[] denominator) {
+    return new RationalFunction(new BigInteger(numerator), new BigInteger(denominator));
+  }
+
+  /**
+   * Returns the integer value of the given polynomial.
+   *
+   * @param polynomial the polynomial, which must be an integer
+   * @return the two's-complement representation of the integer
+   */
+  public static byte[] getIntegerBytes(final Polynomial polynomial) {
+    return polynomial.getRawPolynomial().cc().toByteArray();
+  }
+
+  /**
+   * Returns the rational value of the given rational function.
+   *
+   * @param rationalFunction the rational function, which must be a rational number
+   * @return the length of the numerator part as a little-endian 32-bit integer, followed by the
+   *     two's-complement representations of the numerator and the denominator
+   */
+  public static byte[] getFractionBytes(final RationalFunction rationalFunction) {
+    final byte[] numerator = getIntegerBytes(rationalFunction.getNumerator());
+    final byte[] denominator = getIntegerBytes(rationalFunction.getDenominator());
+    return ByteBuffer.allocate(Integer.BYTES + numerator.length + denominator.length)
+        .order(ByteOrder.LITTLE_ENDIAN)
+        .putInt(numerator.length)
+        .put(numerator)
+        .put(denominator)
+        .array();
+  }
+
+  /**
+   * Returns the total number of terms in the numerator and the denominator of the given rational
+   * function.
+   *
+   * @param rationalFunction the rational function
+   * @return the number of terms
+   */
+  public static int countTerms(final RationalFunction rationalFunction) {
+    return rationalFunction.getNumerator().size() + rationalFunction.getDenominator().size();
+  }
+
+  /**
+   * Parses the given strings as polynomials.
+   *
+   * @param strings the strings
+   * @param parallel whether to parse the strings on multiple threads
+   * @return the polynomials, with {@code null} for invalid strings
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial[] parsePolynomials(final String[] strings, final boolean parallel) {
+    final Polynomial[] result = new Polynomial[strings.length];
+    indices(strings.length, parallel)
+        .forEach(
+            i -> {
+              try {
+                result[i] = Polynomial.of(strings[i]);
+              } catch (IllegalArgumentException | ArithmeticException e) {
+                // Invalid strings give null.
+              }
+            });
+    return result;
+  }
+
+  /**
+   * Parses each line in the given text as a polynomial.
+   *
+   * @param text the lines, where a line break at the end of the text is ignored
+   * @param parallel whether to parse the lines on multiple threads
+   * @return the polynomials, with {@code null} for invalid lines
+   */
+  public static Polynomial[] parsePolynomialLines(final String text, final boolean parallel) {
+    return parsePolynomials(splitLines(text), parallel);
+  }
+
+  /**
+   * Parses the given strings as rational functions.
+   *
+   * @param strings the strings
+   * @param parallel whether to parse the strings on multiple threads
+   * @return the rational functions, with {@code null} for invalid strings
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static RationalFunction[] parseRationalFunctions(
+      final String[] strings, final boolean parallel) {
+    final RationalFunction[] result = new RationalFunction[strings.length];
+    indices(strings.length, parallel)
+        .forEach(
+            i -> {
+              try {
+                result[i] = RationalFunction.of(strings[i]);
+              } catch (IllegalArgumentException | ArithmeticException e) {
+                // Invalid strings give null.
+              }
+            });
+    return result;
+  }
+
+  /**
+   * Parses each line in the given text as a rational function.
+   *
+   * @param text the lines, where a line break at the end of the text is ignored
+   * @param parallel whether to parse the lines on multiple threads
+   * @return the rational functions, with {@code null} for invalid lines
+   */
+  public static RationalFunction[] parseRationalFunctionLines(
+      final String text, final boolean parallel) {
+    return parseRationalFunctions(splitLines(text), parallel);
+  }
+
+  /** Returns the stream of indices, which is parallel if requested. */
+  /* default */ static IntStream indices(final int n, final boolean parallel) {
+    final IntStream stream = IntStream.range(0, n);
+    return parallel ? stream.parallel() : stream;
+  }
+
+  /** Splits the text into lines, without line breaks (LF or CRLF). */
+  private static String[] splitLines(final String text) {
+    final List<String> lines = new ArrayList<>();
+    int start = 0;
+    while (start < text.length()) {
+      int end = text.indexOf('\n', start);
+      if (end < 0) {
+        end = text.length();
+      }
+      final int next = end + 1;
+      if (end > start && text.charAt(end - 1) == '\r') {
+        end--;
+      }
+      lines.add(text.substring(start, end));
+      start = next;
+    }
+    return lines.toArray(new String[0]);
+  }
+
+  /**
+   * Returns the result of setting the given variables to the specified values.
+   *
+   * @param polynomial the polynomial
+   * @param variables the variables
+   * @param values the values, packed as in {@link PolynomialArrays}
+   * @param bigValues whether the values are packed as big integers
+   * @return the result
+   */
+  public static Polynomial evaluate(
+      final Polynomial polynomial,
+      final Variable[] variables,
+      final byte[] values,
+      final boolean bigValues) {
+    return polynomial.evaluate(
+        variables, PolynomialArrays.unpackIntegers(variables.length, values, bigValues));
+  }
+
+  /**
+   * Returns the result of setting the given variables to the specified values.
+   *
+   * @param rationalFunction the rational function
+   * @param variables the variables
+   * @param values the values, packed as in {@link PolynomialArrays}
+   * @param bigValues whether the values are packed as big integers
+   * @return the result
+   * @throws ArithmeticException when division by zero occurs
+   */
+  public static RationalFunction evaluate(
+      final RationalFunction rationalFunction,
+      final Variable[] variables,
+      final byte[] values,
+      final boolean bigValues) {
+    return rationalFunction.evaluate(
+        variables, PolynomialArrays.unpackIntegers(variables.length, values, bigValues));
+  }
+
+  /**
+   * Returns the result of the given variable shifts.
+   *
+   * @param polynomial the polynomial
+   * @param variables the variables
+   * @param values the shifts, packed as in {@link PolynomialArrays}
+   * @param bigValues whether the shifts are packed as big integers
+   * @return the result
+   */
+  public static Polynomial shift(
+      final Polynomial polynomial,
+      final Variable[] variables,
+      final byte[] values,
+      final boolean bigValues) {
+    return polynomial.shift(
+        variables, PolynomialArrays.unpackIntegers(variables.length, values, bigValues));
+  }
+
+  /**
+   * Returns the result of the given variable shifts.
+   *
+   * @param rationalFunction the rational function
+   * @param variables the variables
+   * @param values the shifts, packed as in {@link PolynomialArrays}
+   * @param bigValues whether the shifts are packed as big integers
+   * @return the result
+   */
+  public static RationalFunction shift(
+      final RationalFunction rationalFunction,
+      final Variable[] variables,
+      final byte[] values,
+      final boolean bigValues) {
+    return rationalFunction.shift(
+        variables, PolynomialArrays.unpackIntegers(variables.length, values, bigValues));
+  }
+
   /**
    * Returns the map from exponents to coefficients for the given polynomial.
    *
@@ -69,6 +333,72 @@ public class PythonUtils {
     return polynomial.getCoefficientMap(variables);
   }
 
+  // The following methods are defined in order to reduce the number of round trips
+  // between Python and Java, which are expensive in particular for Py4J. A result
+  // split into independent calls can be obtained in a pipelined way.
+
+  /**
+   * Returns the int array packed in the given bytes.
+   *
+   * @param data the little-endian 32-bit integers
+   * @return the int array
+   * @throws IllegalArgumentException when the size of the data is not a multiple of 4
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static int[] toIntArray(final byte[] data) {
+    if (data.length % Integer.BYTES != 0) {
+      throw new IllegalArgumentException("invalid size of data");
+    }
+    final int[] result = new int[data.length / Integer.BYTES];
+    ByteBuffer.wrap(data).order(ByteOrder.LITTLE_ENDIAN).asIntBuffer().get(result);
+    return result;
+  }
+
+  /**
+   * Returns the exponents in the given coefficient map.
+   *
+   * @param map the map from exponent vectors to coefficients
+   * @return the exponent vectors concatenated in the iteration order of the map
+   */
+  public static int[] getExponents(final Map<int[], Polynomial> map) {
+    if (map.isEmpty()) {
+      return new int[0];
+    }
+    final int n = map.keySet().iterator().next().length;
+    final int[] exponents = new int[map.size() * n];
+    int i = 0;
+    for (final int[] key : map.keySet()) {
+      System.arraycopy(key, 0, exponents, i, n);
+      i += n;
+    }
+    return exponents;
+  }
+
+  /**
+   * Returns the coefficients in the given coefficient map.
+   *
+   * @param map the map from exponent vectors to coefficients
+   * @return the coefficients in the iteration order of the map
+   */
+  public static Polynomial[] getCoefficients(final Map<int[], Polynomial> map) {
+    return map.values().toArray(new Polynomial[0]);
+  }
+
+  /**
+   * Returns the terms of the given polynomial.
+   *
+   * @param polynomial the polynomial
+   * @return the terms in the iteration order of the polynomial
+   */
+  public static Polynomial[] getTerms(final Polynomial polynomial) {
+    final Polynomial[] terms = new Polynomial[polynomial.size()];
+    int i = 0;
+    for (final Polynomial term : polynomial) {
+      terms[i++] = term;
+    }
+    return terms;
+  }
+
   /**
    * Returns the sum of the given polynomials.
    *
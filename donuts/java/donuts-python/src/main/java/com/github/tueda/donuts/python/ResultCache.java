@@ -0,0 +1,376 @@
+package com.github.tueda.donuts.python;
+
+import cc.redberry.rings.bigint.BigInteger;
+import cc.redberry.rings.poly.multivar.Monomial;
+import com.github.tueda.donuts.Polynomial;
+import java.nio.ByteBuffer;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.util.Arrays;
+import java.util.Comparator;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class memoizes expensive operations on polynomials, i.e., factorization, GCD, LCM and
+ * exact division, in a process-wide LRU cache keyed by the values of the operands.
+ *
+ * <p>The cache is bounded both by the number of entries and by the estimated memory usage of the
+ * operands and results.
+ */
+@UtilityClass
+public class ResultCache {
+  /**
+   * Key of a cache entry.
+   *
+   * <p>The variable sets of the operands are also compared, because they determine those of the
+   * results, while the equality of polynomials ignores them.
+   */
+  private static final class Key {
+    /** The operation. */
+    private final String op;
+
+    /** The operands. */
+    private final Polynomial[] args;
+
+    /** The hash code. */
+    private final int hash;
+
+    /* default */ Key(final String op, final Polynomial... args) {
+      this.op = op;
+      this.args = args;
+      int hash = 31 * op.hashCode() + Arrays.hashCode(args);
+      for (final Polynomial p : args) {
+        hash = 31 * hash + p.getVariables().hashCode();
+      }
+      this.hash = hash;
+    }
+
+    @Override
+    public int hashCode() {
+      return hash;
+    }
+
+    @Override
+    public boolean equals(final Object other) {
+      if (!(other instanceof Key)) {
+        return false;
+      }
+      final Key key = (Key) other;
+      return hash == key.hash
+          && op.equals(key.op)
+          && Arrays.equals(args, key.args)
+          && haveSameVariables(args, key.args);
+    }
+
+    @SuppressWarnings("PMD.UseVarargs")
+    private static boolean haveSameVariables(final Polynomial[] args1, final Polynomial[] args2) {
+      for (int i = 0; i < args1.length; i++) {
+        if (!args1[i].getVariables().equals(args2[i].getVariables())) {
+          return false;
+        }
+      }
+      return true;
+    }
+  }
+
+  /** Cache entry. */
+  private static final class Entry {
+    /** The results. */
+    /* default */ final Polynomial[] results;
+
+    /** The estimated memory usage in bytes. */
+    /* default */ final long bytes;
+
+    /* default */ Entry(final Polynomial[] results, final long bytes) {
+      this.results = results;
+      this.bytes = bytes;
+    }
+  }
+
+  /** The operation of factorization. */
+  private static final String FACTORS = "factors";
+
+  /** The operation of GCD. */
+  private static final String GCD = "gcd";
+
+  /** The operation of LCM. */
+  private static final String LCM = "lcm";
+
+  /** The operation of exact division. */
+  private static final String DIVIDE_EXACT = "divideExact";
+
+  /** Orders commutative operands by their hash codes. */
+  private static final Comparator<Polynomial> BY_HASH =
+      Comparator.comparingInt(Polynomial::hashCode);
+
+  /** The entries in access order. */
+  private static final LinkedHashMap<Key, Entry> ENTRIES = new LinkedHashMap<>(16, 0.75f, true);
+
+  /** The maximum number of entries. */
+  private static int maxSize = 1024;
+
+  /** The maximum memory usage in bytes. */
+  private static long maxBytes = 64L << 20;
+
+  /** The current memory usage in bytes. */
+  private static long bytes;
+
+  /** The number of hits. */
+  private static long hits;
+
+  /** The number of misses. */
+  private static long misses;
+
+  /**
+   * Returns the factorization of the given polynomial.
+   *
+   * @param polynomial the polynomial
+   * @return the factors
+   */
+  public static Polynomial[] factors(final Polynomial polynomial) {
+    return apply(FACTORS, polynomial);
+  }
+
+  /**
+   * Returns the greatest common divisor of the given polynomials.
+   *
+   * @param polynomial1 the first polynomial
+   * @param polynomial2 the second polynomial
+   * @return {@code GCD(polynomial1, polynomial2)}
+   */
+  public static Polynomial gcd(final Polynomial polynomial1, final Polynomial polynomial2) {
+    return apply(GCD, polynomial1, polynomial2)[0];
+  }
+
+  /**
+   * Returns the greatest common divisor of the given polynomials.
+   *
+   * @param polynomials the polynomials
+   * @return {@code GCD(polynomial1, ..., polynomialN)}
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial gcdOf(final Polynomial[] polynomials) {
+    return apply(GCD, polynomials)[0];
+  }
+
+  /**
+   * Returns the least common multiple of the given polynomials.
+   *
+   * @param polynomial1 the first polynomial
+   * @param polynomial2 the second polynomial
+   * @return {@code LCM(polynomial1, polynomial2)}
+   */
+  public static Polynomial lcm(final Polynomial polynomial1, final Polynomial polynomial2) {
+    return apply(LCM, polynomial1, polynomial2)[0];
+  }
+
+  /**
+   * Returns the least common multiple of the given polynomials.
+   *
+   * @param polynomials the polynomials
+   * @return {@code LCM(polynomial1, ..., polynomialN)}
+   * @throws IllegalArgumentException when no polynomial is given
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial lcmOf(final Polynomial[] polynomials) {
+    return apply(LCM, polynomials)[0];
+  }
+
+  /**
+   * Returns the exact quotient of the given polynomials.
+   *
+   * @param dividend the dividend
+   * @param divisor the divisor
+   * @return {@code dividend / divisor}
+   * @throws ArithmeticException when the division is not exact
+   */
+  public static Polynomial divideExact(final Polynomial dividend, final Polynomial divisor) {
+    return apply(DIVIDE_EXACT, dividend, divisor)[0];
+  }
+
+  /**
+   * Returns the cached results of the given operation.
+   *
+   * @param op the operation: {@code "factors"}, {@code "gcd"}, {@code "lcm"} or {@code
+   *     "divideExact"}
+   * @param args the operands
+   * @return the results, or {@code null} if not cached
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial[] get(final String op, final Polynomial[] args) {
+    final Polynomial[] results = lookup(newKey(op, args));
+    return results == null ? null : results.clone();
+  }
+
+  /**
+   * Computes the given operation without looking up the cache, and caches the results.
+   *
+   * @param op the operation
+   * @param args the operands
+   * @return the results
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static Polynomial[] compute(final String op, final Polynomial[] args) {
+    final Polynomial[] results = evaluate(op, args);
+    store(newKey(op, args), results);
+    return results.clone();
+  }
+
+  /**
+   * Caches the given results of the given operation, e.g., obtained from a persistent cache.
+   *
+   * @param op the operation
+   * @param args the operands
+   * @param results the results
+   */
+  public static void put(final String op, final Polynomial[] args, final Polynomial[] results) {
+    store(newKey(op, args), results.clone());
+  }
+
+  /**
+   * Returns a digest of the given operation, which is stable across processes and independent of
+   * the variable sets of the operands.
+   *
+   * @param op the operation
+   * @param args the operands
+   * @return the SHA-256 digest
+   */
+  @SuppressWarnings("PMD.UseVarargs")
+  public static byte[] digest(final String op, final Polynomial[] args) {
+    final MessageDigest md;
+    try {
+      md = MessageDigest.getInstance("SHA-256");
+    } catch (NoSuchAlgorithmException e) {
+      throw new IllegalStateException(e);
+    }
+    md.update(op.getBytes(StandardCharsets.UTF_8));
+    for (final Polynomial p : newKey(op, args).args) {
+      final byte[] data = BinaryFormat.encodePolynomial(p.translate(p.getMinimalVariables()));
+      md.update(ByteBuffer.allocate(4).putInt(data.length).array());
+      md.update(data);
+    }
+    return md.digest();
+  }
+
+  private static Polynomial[] apply(final String op, final Polynomial... args) {
+    final Polynomial[] results = lookup(newKey(op, args));
+    return results == null ? compute(op, args) : results.clone();
+  }
+
+  private static Polynomial[] evaluate(final String op, final Polynomial... args) {
+    switch (op) {
+      case FACTORS:
+        return args[0].factors();
+      case GCD:
+        return new Polynomial[] {Polynomial.gcdOf(args)};
+      case LCM:
+        return new Polynomial[] {Polynomial.lcmOf(args)};
+      case DIVIDE_EXACT:
+        return new Polynomial[] {args[0].divideExact(args[1])};
+      default:
+        throw new IllegalArgumentException("unknown operation: " + op);
+    }
+  }
+
+  private static Key newKey(final String op, final Polynomial... args) {
+    // GCD and LCM are commutative.
+    return new Key(op, GCD.equals(op) || LCM.equals(op) ? sortByHash(args) : args);
+  }
+
+  /**
+   * Sets the bounds of the cache, evicting entries as needed.
+   *
+   * @param maxSize the maximum number of entries, where zero disables the cache
+   * @param maxBytes the maximum memory usage in bytes
+   */
+  public static synchronized void configure(final int maxSize, final long maxBytes) {
+    if (maxSize < 0 || maxBytes < 0) {
+      throw new IllegalArgumentException("negative cache size");
+    }
+    ResultCache.maxSize = maxSize;
+    ResultCache.maxBytes = maxBytes;
+    evict();
+  }
+
+  /**
+   * Returns the statistics of the cache.
+   *
+   * @return the numbers of hits and misses, the maximum and current numbers of entries, and the
+   *     maximum and current memory usage in bytes
+   */
+  public static synchronized long[] getInfo() {
+    return new long[] {hits, misses, maxSize, ENTRIES.size(), maxBytes, bytes};
+  }
+
+  /** Removes all the entries and resets the statistics. */
+  public static synchronized void clear() {
+    ENTRIES.clear();
+    bytes = 0;
+    hits = 0;
+    misses = 0;
+  }
+
+  private static synchronized Polynomial[] lookup(final Key key) {
+    final Entry entry = ENTRIES.get(key);
+    if (entry == null) {
+      misses++;
+      return null;
+    }
+    hits++;
+    return entry.results;
+  }
+
+  private static void store(final Key key, final Polynomial[] results) {
+    // Estimate the size outside the lock.
+    long size = 0;
+    for (final Polynomial p : key.args) {
+      size += estimateBytes(p);
+    }
+    for (final Polynomial p : results) {
+      size += estimateBytes(p);
+    }
+    synchronized (ResultCache.class) {
+      if (size > maxBytes || maxSize == 0) {
+        return;
+      }
+      final Entry old = ENTRIES.put(key, new Entry(results, size));
+      if (old != null) {
+        bytes -= old.bytes;
+      }
+      bytes += size;
+      evict();
+    }
+  }
+
+  private static void evict() {
+    final Iterator<Entry> it = ENTRIES.values().iterator();
+    while (it.hasNext() && (ENTRIES.size() > maxSize || bytes > maxBytes)) {
+      bytes -= it.next().bytes;
+      it.remove();
+    }
+  }
+
+  @SuppressWarnings("PMD.UseVarargs")
+  private static Polynomial[] sortByHash(final Polynomial[] polynomials) {
+    final Polynomial[] sorted = polynomials.clone();
+    Arrays.sort(sorted, BY_HASH);
+    return sorted;
+  }
+
+  /**
+   * Returns a rough estimate of the memory usage of the given polynomial.
+   *
+   * @param polynomial the polynomial
+   * @return the estimated memory usage in bytes
+   */
+  /* default */ static long estimateBytes(final Polynomial polynomial) {
+    long size = 64;
+    for (final Monomial<BigInteger> term : polynomial.getRawPolynomial()) {
+      size += 64 + 4L * term.exponents.length + term.coefficient.bitLength() / 8;
+    }
+    return size;
+  }
+}
@@ -0,0 +1,534 @@
+package com.github.tueda.donuts.python;
+
+import cc.redberry.rings.bigint.BigInteger;
+import cc.redberry.rings.poly.multivar.Monomial;
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import java.io.IOException;
+import java.io.Reader;
+import java.io.Writer;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+import java.util.ArrayList;
+import java.util.Iterator;
+import java.util.List;
+import lombok.experimental.UtilityClass;
+
+/**
+ * This class reads and writes polynomials and rational functions as text without building the
+ * whole string at once.
+ *
+ * <p>The text is the same as {@code toString()}. It is written in chunks of terms, and read by
+ * parsing sums of terms in chunks, so that the memory usage is bounded by the chunk size rather
+ * than by the length of the text.
+ */
+@UtilityClass
+public class TextFormat {
+  /** The maximum number of terms in a chunk to be written. */
+  private static final int CHUNK_TERMS = 4096;
+
+  /** The number of characters in a chunk to be parsed at once. */
+  private static final int CHUNK_CHARS = 1 << 16;
+
+  /**
+   * Writes the given polynomial to a file.
+   *
+   * @param polynomial the polynomial
+   * @param path the path to the file
+   * @throws IOException when an I/O error occurs
+   */
+  public static void writePolynomial(final Polynomial polynomial, final String path)
+      throws IOException {
+    write(toChunks(polynomial), path);
+  }
+
+  /**
+   * Writes the given rational function to a file.
+   *
+   * @param rationalFunction the rational function
+   * @param path the path to the file
+   * @throws IOException when an I/O error occurs
+   */
+  public static void writeRationalFunction(
+      final RationalFunction rationalFunction, final String path) throws IOException {
+    write(toChunks(rationalFunction), path);
+  }
+
+  private static void write(final TextChunks chunks, final String path) throws IOException {
+    try (Writer out = Files.newBufferedWriter(Paths.get(path), StandardCharsets.UTF_8)) {
+      for (String s = chunks.next(); !s.isEmpty(); s = chunks.next()) {
+        out.write(s);
+      }
+    }
+  }
+
+  /**
+   * Returns chunks of the text of the given polynomial.
+   *
+   * @param polynomial the polynomial
+   * @return the chunks
+   */
+  public static TextChunks toChunks(final Polynomial polynomial) {
+    return new TextChunks(polynomial);
+  }
+
+  /**
+   * Returns chunks of the text of the given rational function.
+   *
+   * @param rationalFunction the rational function
+   * @return the chunks
+   */
+  public static TextChunks toChunks(final RationalFunction rationalFunction) {
+    final Polynomial numerator = rationalFunction.getNumerator();
+    final Polynomial denominator = rationalFunction.getDenominator();
+    if (denominator.isOne()) {
+      return new TextChunks(numerator);
+    }
+    final boolean numeratorParens = numerator.size() > 1;
+    final boolean denominatorParens = !isPower(denominator);
+    return new TextChunks(
+        numeratorParens ? "(" : "",
+        numerator,
+        (numeratorParens ? ")" : "") + (denominatorParens ? "/(" : "/"),
+        denominator,
+        denominatorParens ? ")" : "");
+  }
+
+  /** Returns {@code true} if the polynomial is an integer or a power of a variable. */
+  private static boolean isPower(final Polynomial polynomial) {
+    if (polynomial.isConstant()) {
+      return true;
+    }
+    if (!polynomial.isMonomial() || !polynomial.isMonic()) {
+      return false;
+    }
+    int n = 0;
+    for (final int e : polynomial.getRawPolynomial().degrees()) {
+      if (e > 0) {
+        n++;
+      }
+    }
+    return n == 1;
+  }
+
+  /** Chunks of text. */
+  public static final class TextChunks {
+    /** The parts of the text, each of which is either a string or a polynomial. */
+    private final Object[] parts;
+
+    /** The index of the current part. */
+    private int index;
+
+    /** The iterator of the remaining terms in the current part. */
+    private Iterator<Monomial<BigInteger>> terms;
+
+    /** The variable names of the current part. */
+    private String[] table;
+
+    /** Constructs chunks consisting of the given parts. */
+    /* default */ TextChunks(final Object... parts) {
+      this.parts = parts;
+    }
+
+    /**
+     * Returns the next chunk of text. After all chunks are returned, the result is empty.
+     *
+     * @return the chunk
+     */
+    public String next() {
+      final StringBuilder sb = new StringBuilder();
+      int nterms = 0;
+      while (index < parts.length && nterms < CHUNK_TERMS) {
+        if (parts[index] instanceof String) {
+          sb.append((String) parts[index++]);
+          continue;
+        }
+        final Polynomial polynomial = (Polynomial) parts[index];
+        if (terms == null) {
+          if (polynomial.isZero()) {
+            sb.append('0');
+            index++;
+            continue;
+          }
+          terms = polynomial.getRawPolynomial().iterator();
+          table = Internals.getRawTable(polynomial.getVariables());
+          appendTerm(sb, terms.next(), table, true);
+          nterms++;
+        }
+        while (nterms < CHUNK_TERMS && terms.hasNext()) {
+          appendTerm(sb, terms.next(), table, false);
+          nterms++;
+        }
+        if (!terms.hasNext()) {
+          terms = null;
+          index++;
+        }
+      }
+      return sb.toString();
+    }
+  }
+
+  /** Appends a term in the same format as {@code toString()}. */
+  @SuppressWarnings("PMD.UseVarargs")
+  private static void appendTerm(
+      final StringBuilder sb,
+      final Monomial<BigInteger> term,
+      final String[] table,
+      final boolean first) {
+    final BigInteger c = term.coefficient;
+    if (!first && c.signum() > 0) {
+      sb.append('+');
+    }
+    if (term.totalDegree == 0) {
+      sb.append(c);
+      return;
+    }
+    if (c.isMinusOne()) {
+      sb.append('-');
+    } else if (!c.isOne()) {
+      sb.append(c).append('*');
+    }
+    boolean firstFactor = true;
+    for (int k = 0; k < table.length; k++) {
+      final int e = term.exponents[k];
+      if (e == 0) {
+        continue;
+      }
+      if (!firstFactor) {
+        sb.append('*');
+      }
+      sb.append(table[k]);
+      if (e > 1) {
+        sb.append('^').append(e);
+      }
+      firstFactor = false;
+    }
+  }
+
+  /**
+   * Reads a polynomial from a file.
+   *
+   * @param path the path to the file
+   * @return the polynomial
+   * @throws IOException when an I/O error occurs
+   * @throws IllegalArgumentException when the text is not a polynomial
+   */
+  public static Polynomial readPolynomial(final String path) throws IOException {
+    try (Reader in = Files.newBufferedReader(Paths.get(path), StandardCharsets.UTF_8)) {
+      return new Parser(in, false).parse().toPolynomial();
+    }
+  }
+
+  /**
+   * Reads a rational function from a file.
+   *
+   * @param path the path to the file
+   * @return the rational function
+   * @throws IOException when an I/O error occurs
+   * @throws IllegalArgumentException when the text is not a rational function
+   */
+  public static RationalFunction readRationalFunction(final String path) throws IOException {
+    try (Reader in = Files.newBufferedReader(Paths.get(path), StandardCharsets.UTF_8)) {
+      return new Parser(in, true).parse().toRationalFunction();
+    }
+  }
+
+  /** Sum of terms. */
+  private static class Sum {
+    /** The polynomial summands. */
+    private final List<Polynomial> polynomials = new ArrayList<>();
+
+    /** The sum of rational summands. */
+    private RationalFunction rationalFunction;
+
+    /* default */ void add(final Polynomial p) {
+      polynomials.add(p);
+    }
+
+    /* default */ void add(final RationalFunction r) {
+      rationalFunction = rationalFunction == null ? r : rationalFunction.add(r);
+    }
+
+    /* default */ boolean isEmpty() {
+      return polynomials.isEmpty() && rationalFunction == null;
+    }
+
+    /* default */ Polynomial toPolynomial() {
+      final Polynomial p = Polynomial.sumOf(polynomials.toArray(new Polynomial[0]));
+      if (rationalFunction == null) {
+        return p;
+      }
+      final RationalFunction r = rationalFunction.add(new RationalFunction(p));
+      if (!r.isPolynomial()) {
+        throw new IllegalArgumentException("not a polynomial");
+      }
+      return r.getNumerator();
+    }
+
+    /* default */ RationalFunction toRationalFunction() {
+      final RationalFunction p =
+          new RationalFunction(Polynomial.sumOf(polynomials.toArray(new Polynomial[0])));
+      return rationalFunction == null ? p : rationalFunction.add(p);
+    }
+  }
+
+  /**
+   * Streaming parser. Summands without parentheses are passed to the parser of Donuts in chunks,
+   * while parenthesized subexpressions are parsed recursively.
+   */
+  private static class Parser {
+    /** The input. */
+    private final Reader in;
+
+    /** Whether the result is a rational function. */
+    private final boolean rational;
+
+    /** The buffer. */
+    private final char[] buf = new char[8192];
+
+    /** The number of characters in the buffer. */
+    private int size;
+
+    /** The current position in the buffer. */
+    private int pos;
+
+    /** Constructs a parser. */
+    /* default */ Parser(final Reader in, final boolean rational) {
+      this.in = in;
+      this.rational = rational;
+    }
+
+    /* default */ Sum parse() throws IOException {
+      final Sum result = parseSum();
+      if (peek() >= 0) {
+        throw new IllegalArgumentException("unbalanced parentheses");
+      }
+      return result;
+    }
+
+    /** Parses a sum until ')' or the end of the input. */
+    private Sum parseSum() throws IOException {
+      final Sum sum = new Sum();
+      final StringBuilder text = new StringBuilder();
+      while (true) {
+        if (text.length() >= CHUNK_CHARS) {
+          addText(sum, text.toString());
+          text.setLength(0);
+        }
+        // Scan a summand, including its sign.
+        final int start = text.length();
+        boolean operand = false;
+        int c;
+        while (true) {
+          c = peek();
+          if (c < 0 || c == ')' || c == '(' || (operand && (c == '+' || c == '-'))) {
+            break;
+          }
+          text.append((char) c);
+          pos++;
+          if (!Character.isWhitespace(c)) {
+            operand = "+-*/^".indexOf(c) < 0;
+          }
+        }
+        if (c == '(') {
+          // Parse the summand including parentheses.
+          final String prefix = text.substring(start);
+          text.setLength(start);
+          sum.add(parseSummand(prefix));
+          c = peek();
+        }
+        if (c < 0 || c == ')') {
+          break;
+        }
+      }
+      if (!text.toString().trim().isEmpty() || sum.isEmpty()) {
+        addText(sum, text.toString());
+      }
+      return sum;
+    }
+
+    /** Parses the rest of a summand, given the text before the first parenthesis. */
+    private RationalFunction parseSummand(final String prefix) throws IOException {
+      final String s = prefix.trim();
+      final char last = s.isEmpty() ? '\0' : s.charAt(s.length() - 1);
+      RationalFunction acc;
+      char op;
+      if (isSigns(s)) {
+        acc = parseProduct(s);
+        op = '*';
+      } else if (last == '*' || last == '/') {
+        acc = parseProduct(s.substring(0, s.length() - 1));
+        op = last;
+      } else if (last == '^') {
+        // The base of the power is the last factor in the prefix.
+        final String head = s.substring(0, s.length() - 1);
+        final int k = Math.max(head.lastIndexOf('*'), head.lastIndexOf('/'));
+        acc = parseProduct(k >= 0 ? head.substring(0, k) : "");
+        op = k >= 0 ? head.charAt(k) : '*';
+        final String base = head.substring(k + 1);
+        if (negative(base)) {
+          acc = acc.negate();
+        }
+        final RationalFunction factor = parseAtom(base.replaceFirst("^[\\s+-]*", ""));
+        acc = combine(acc, op, parsePowers(factor.pow(parseExponent())));
+        op = nextOperator();
+      } else {
+        throw new IllegalArgumentException("unexpected parenthesis");
+      }
+      while (op != 0) {
+        acc = combine(acc, op, parseFactor());
+        op = nextOperator();
+      }
+      return acc;
+    }
+
+    /** Returns the next '*' or '/' after skipping it, or 0 at the end of the summand. */
+    private char nextOperator() throws IOException {
+      final int c = skipWhitespace();
+      if (c == '*' || c == '/') {
+        pos++;
+        return (char) c;
+      }
+      if (c >= 0 && c != '+' && c != '-' && c != ')') {
+        throw new IllegalArgumentException("unexpected character: " + (char) c);
+      }
+      return 0;
+    }
+
+    /** Parses a factor, possibly raised to powers. */
+    private RationalFunction parseFactor() throws IOException {
+      final int c = skipWhitespace();
+      final RationalFunction base;
+      if (c == '(') {
+        pos++;
+        base = parseGroup();
+      } else {
+        final StringBuilder atom = new StringBuilder();
+        for (int d = peek(); d >= 0 && "+-*/^()".indexOf(d) < 0; d = peek()) {
+          atom.append((char) d);
+          pos++;
+        }
+        base = parseAtom(atom.toString());
+      }
+      return parsePowers(base);
+    }
+
+    private RationalFunction parsePowers(final RationalFunction base) throws IOException {
+      RationalFunction result = base;
+      while (skipWhitespace() == '^') {
+        pos++;
+        result = result.pow(parseExponent());
+      }
+      if (!rational && !result.isPolynomial()) {
+        throw new IllegalArgumentException("not a polynomial");
+      }
+      return result;
+    }
+
+    private int parseExponent() throws IOException {
+      final int c = skipWhitespace();
+      if (c == '(') {
+        pos++;
+        final RationalFunction e = parseGroup();
+        if (!e.isInteger()) {
+          throw new IllegalArgumentException("invalid exponent: " + e);
+        }
+        return e.getNumerator().asIntValue();
+      }
+      final StringBuilder digits = new StringBuilder();
+      for (int d = peek(); d >= '0' && d <= '9'; d = peek()) {
+        digits.append((char) d);
+        pos++;
+      }
+      return Integer.parseInt(digits.toString());
+    }
+
+    /** Parses a parenthesized sum after '('. */
+    private RationalFunction parseGroup() throws IOException {
+      final RationalFunction result = parseSum().toRationalFunction();
+      if (peek() != ')') {
+        throw new IllegalArgumentException("unbalanced parentheses");
+      }
+      pos++;
+      return result;
+    }
+
+    private RationalFunction parseProduct(final String s) {
+      if (isSigns(s)) {
+        return new RationalFunction(negative(s) ? -1 : 1);
+      }
+      return parseAtom(s);
+    }
+
+    private RationalFunction parseAtom(final String s) {
+      return rational ? RationalFunction.of(s) : new RationalFunction(Polynomial.of(s));
+    }
+
+    private void addText(final Sum sum, final String s) {
+      if (rational && s.indexOf('/') >= 0) {
+        sum.add(RationalFunction.of(s));
+      } else {
+        sum.add(Polynomial.of(s));
+      }
+    }
+
+    private RationalFunction combine(
+        final RationalFunction a, final char op, final RationalFunction b) {
+      if (op == '*') {
+        return a.multiply(b);
+      }
+      if (!rational) {
+        final Polynomial q = a.getNumerator().divideExact(b.getNumerator());
+        return new RationalFunction(q);
+      }
+      return a.divide(b);
+    }
+
+    /** Returns {@code true} if the string consists of only signs and whitespace. */
+    private static boolean isSigns(final String s) {
+      for (int i = 0; i < s.length(); i++) {
+        final char c = s.charAt(i);
+        if (c != '+' && c != '-' && !Character.isWhitespace(c)) {
+          return false;
+        }
+      }
+      return true;
+    }
+
+    /** Returns {@code true} if the leading signs give a minus sign. */
+    private static boolean negative(final String signs) {
+      int n = 0;
+      for (int i = 0; i < signs.length(); i++) {
+        final char c = signs.charAt(i);
+        if (c == '-') {
+          n++;
+        } else if (c != '+' && !Character.isWhitespace(c)) {
+          break;
+        }
+      }
+      return n % 2 != 0;
+    }
+
+    private int skipWhitespace() throws IOException {
+      int c = peek();
+      while (c >= 0 && Character.isWhitespace(c)) {
+        pos++;
+        c = peek();
+      }
+      return c;
+    }
+
+    private int peek() throws IOException {
+      if (pos >= size) {
+        size = in.read(buf, 0, buf.length);
+        pos = 0;
+        if (size <= 0) {
+          size = 0;
+          return -1;
+        }
+      }
+      return buf[pos];
+    }
+  }
+}
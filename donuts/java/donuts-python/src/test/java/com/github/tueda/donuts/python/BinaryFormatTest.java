@@ -0,0 +1,68 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import java.util.Arrays;
+import org.junit.jupiter.api.Test;
+
+public class BinaryFormatTest {
+  @Test
+  public void polynomial() {
+    String[] inputs = {
+      "0",
+      "1",
+      "-42",
+      "(1+x-y)^3",
+      "(123456789012345678901234567890-2^70*x)^3-y*z",
+      "-2^61+2^62*x^100-(2^61-1)*y^1000000",
+    };
+    for (String s : inputs) {
+      Polynomial p = Polynomial.of(s);
+      Polynomial q = BinaryFormat.decodePolynomial(BinaryFormat.encodePolynomial(p));
+      assertThat(q).isEqualTo(p);
+      assertThat(q.getVariables()).isEqualTo(p.getVariables());
+    }
+
+    // Unused variables are kept.
+    Polynomial p = Polynomial.of("x*y-x*y+z");
+    Polynomial q = BinaryFormat.decodePolynomial(BinaryFormat.encodePolynomial(p));
+    assertThat(q.getVariables()).isEqualTo(p.getVariables());
+  }
+
+  @Test
+  public void rationalFunction() {
+    String[] inputs = {
+      "0", "1", "-1/2", "(1+x)/(1-y)", "-(1-2^100*x)/(1+x+y)^2/3^50",
+    };
+    for (String s : inputs) {
+      RationalFunction r = RationalFunction.of(s);
+      RationalFunction q =
+          BinaryFormat.decodeRationalFunction(BinaryFormat.encodeRationalFunction(r));
+      assertThat(q).isEqualTo(r);
+    }
+  }
+
+  @Test
+  public void malformedData() {
+    byte[] p = BinaryFormat.encodePolynomial(Polynomial.of("(1+x)^2"));
+    byte[] r = BinaryFormat.encodeRationalFunction(RationalFunction.of("1/(1+x)"));
+
+    assertThrows(IllegalArgumentException.class, () -> BinaryFormat.decodePolynomial(new byte[0]));
+    assertThrows(IllegalArgumentException.class, () -> BinaryFormat.decodePolynomial(r));
+    assertThrows(IllegalArgumentException.class, () -> BinaryFormat.decodeRationalFunction(p));
+
+    byte[] truncated = Arrays.copyOf(p, p.length - 1);
+    assertThrows(IllegalArgumentException.class, () -> BinaryFormat.decodePolynomial(truncated));
+
+    byte[] trailing = Arrays.copyOf(p, p.length + 1);
+    assertThrows(IllegalArgumentException.class, () -> BinaryFormat.decodePolynomial(trailing));
+
+    byte[] unknownVersion = p.clone();
+    unknownVersion[1] = 99;
+    assertThrows(
+        IllegalArgumentException.class, () -> BinaryFormat.decodePolynomial(unknownVersion));
+  }
+}
@@ -0,0 +1,25 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+import org.junit.jupiter.api.Test;
+
+public class CdsTrainingTest {
+  @Test
+  public void main() throws ClassNotFoundException, IOException {
+    PrintStream stdout = System.out;
+    ByteArrayOutputStream bstream = new ByteArrayOutputStream();
+    try {
+      System.setOut(new PrintStream(bstream, true, "UTF-8"));
+      CdsTraining.main(new String[0]);
+    } finally {
+      System.setOut(stdout);
+    }
+    String output = new String(bstream.toByteArray(), StandardCharsets.UTF_8);
+    assertThat(output.trim()).isEqualTo(System.getProperty("java.home"));
+  }
+}
@@ -0,0 +1,44 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import org.junit.jupiter.api.Test;
+
+public class InternerTest {
+  @Test
+  public void intern() {
+    Interner.clear();
+
+    Polynomial a = Polynomial.of("(1+x)^2");
+    Polynomial b = Polynomial.of("1+2*x+x^2");
+    RationalFunction c = RationalFunction.of("(1+x)^2");
+
+    long ida = Interner.intern(a);
+    assertThat(ida).isLessThan(0);
+    assertThat(Interner.intern(a)).isEqualTo(-ida);
+    assertThat(Interner.intern(b)).isEqualTo(-ida);
+    assertThat(Interner.get(-ida)).isSameInstanceAs(a);
+
+    long idc = Interner.intern(c);
+    assertThat(idc).isLessThan(0);
+    assertThat(idc).isNotEqualTo(ida);
+    assertThat(Interner.get(-idc)).isSameInstanceAs(c);
+    assertThat(Interner.size()).isEqualTo(2);
+
+    // Equal but with different sets of variables.
+    Polynomial d = Polynomial.of("(1+x)^2+y-y");
+    long idd = Interner.intern(d);
+    assertThat(idd).isLessThan(0);
+    assertThat(idd).isNotEqualTo(ida);
+    assertThat(Interner.intern(Polynomial.of("1+2*x+x^2+y-y"))).isEqualTo(-idd);
+    assertThat(Interner.intern(b)).isEqualTo(-ida);
+    assertThat(Interner.size()).isEqualTo(3);
+
+    Interner.clear();
+    assertThat(Interner.size()).isEqualTo(0);
+    assertThat(Interner.get(-ida)).isNull();
+    assertThat(Interner.intern(b)).isLessThan(0);
+  }
+}
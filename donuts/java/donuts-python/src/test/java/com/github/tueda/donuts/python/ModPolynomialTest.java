@@ -0,0 +1,115 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.Variable;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import org.junit.jupiter.api.Test;
+
+public class ModPolynomialTest {
+  private static ModPolynomial mod(final String s, final long p) {
+    return ModPolynomial.of(Polynomial.of(s), p);
+  }
+
+  private static byte[] packLongs(long... values) {
+    ByteBuffer buf = ByteBuffer.allocate(8 * values.length).order(ByteOrder.LITTLE_ENDIAN);
+    for (long x : values) {
+      buf.putLong(x);
+    }
+    return buf.array();
+  }
+
+  @Test
+  public void of() {
+    ModPolynomial a = mod("-3*x+10*y^2-7", 7);
+    assertThat(a.toString()).isEqualTo("4*x+3*y^2");
+    assertThat(a.size()).isEqualTo(2);
+    assertThat(a.getModulus()).isEqualTo(7);
+    assertThat(a.lift(false)).isEqualTo(Polynomial.of("4*x+3*y^2"));
+    assertThat(a.lift(true)).isEqualTo(Polynomial.of("-3*x+3*y^2"));
+    assertThat(mod("2^100", 1000003).constantTerm()).isEqualTo(253109);
+
+    assertThrows(IllegalArgumentException.class, () -> mod("1", 1));
+    assertThrows(IllegalArgumentException.class, () -> mod("1", 4));
+    assertThrows(IllegalArgumentException.class, () -> mod("1", (1L << 62) + 135));
+  }
+
+  @Test
+  public void arithmetic() {
+    Polynomial p1 = Polynomial.of("(1+x)^3-y");
+    Polynomial p2 = Polynomial.of("2*x-3*z+5");
+    ModPolynomial a = ModPolynomial.of(p1, 7);
+    ModPolynomial b = ModPolynomial.of(p2, 7);
+
+    assertThat(a.add(b)).isEqualTo(ModPolynomial.of(p1.add(p2), 7));
+    assertThat(a.subtract(b)).isEqualTo(ModPolynomial.of(p1.subtract(p2), 7));
+    assertThat(a.multiply(b)).isEqualTo(ModPolynomial.of(p1.multiply(p2), 7));
+    assertThat(a.negate()).isEqualTo(ModPolynomial.of(p1.negate(), 7));
+    assertThat(a.pow(3)).isEqualTo(ModPolynomial.of(p1.pow(3), 7));
+    assertThat(a.multiply(b).divideExact(b)).isEqualTo(a);
+
+    // The operands are not modified.
+    assertThat(a).isEqualTo(ModPolynomial.of(p1, 7));
+
+    assertThrows(IllegalArgumentException.class, () -> a.add(mod("1", 11)));
+    assertThrows(ArithmeticException.class, () -> a.divideExact(mod("7", 7)));
+    assertThrows(ArithmeticException.class, () -> a.divideExact(b));
+  }
+
+  @Test
+  public void equality() {
+    ModPolynomial a = mod("x+y-y", 7);
+    ModPolynomial b = mod("x", 7);
+    assertThat(a).isEqualTo(b);
+    assertThat(a.hashCode()).isEqualTo(b.hashCode());
+    assertThat(a).isNotEqualTo(mod("x", 11));
+    assertThat(a.getMinimalVariables()).isEqualTo(b.getVariables());
+  }
+
+  @Test
+  public void gcdAndFactors() {
+    ModPolynomial a = mod("(1+x+2*y*z)*(3-x)*(1-z)", 1000003);
+    ModPolynomial b = mod("(1+x+2*y*z)*(3+x)*(1+y)^2", 1000003);
+    assertThat(a.gcd(b).multiply(mod("2", 1000003))).isEqualTo(mod("1+x+2*y*z", 1000003));
+
+    ModPolynomial[] factors = mod("3*(x^2+1)", 5).factors();
+    assertThat(factors).hasLength(3);
+    assertThat(factors[0]).isEqualTo(mod("3", 5));
+    assertThat(mod("3", 5).factors()).asList().containsExactly(mod("3", 5));
+  }
+
+  @Test
+  public void substitute() {
+    Polynomial p = Polynomial.of("(1+x)^3*(2-y)");
+    ModPolynomial a = ModPolynomial.of(p, 7);
+    assertThat(a.substitute(new Variable("x"), mod("y+z", 7)))
+        .isEqualTo(ModPolynomial.of(p.substitute(Polynomial.of("x"), Polynomial.of("y+z")), 7));
+  }
+
+  @Test
+  public void evaluateRatios() {
+    ModPolynomial num = mod("x+1", 7);
+    ModPolynomial den = mod("x-y+7*z", 7);
+    Variable[] vars = {new Variable("y"), new Variable("x")};
+    for (boolean parallel : new boolean[] {false, true}) {
+      byte[] data =
+          ModPolynomial.evaluateRatios(
+              num, den, vars, 3, packLongs(2, 1, 2, 2, -7, 3), false, parallel);
+      assertThat(data).isEqualTo(packLongs(5, -1, 6));
+    }
+
+    assertThrows(
+        IllegalArgumentException.class,
+        () ->
+            ModPolynomial.evaluateRatios(
+                num, mod("z", 7), vars, 1, packLongs(1, 1), false, false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () ->
+            ModPolynomial.evaluateRatios(
+                num, mod("1", 5), vars, 1, packLongs(1, 1), false, false));
+  }
+}
@@ -0,0 +1,207 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.Variable;
+import com.github.tueda.donuts.VariableSet;
+import java.math.BigInteger;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.Arrays;
+import org.junit.jupiter.api.Test;
+
+public class PolynomialArraysTest {
+  private static byte[] packInts(int... values) {
+    ByteBuffer buf = ByteBuffer.allocate(4 * values.length).order(ByteOrder.LITTLE_ENDIAN);
+    for (int x : values) {
+      buf.putInt(x);
+    }
+    return buf.array();
+  }
+
+  private static byte[] packLongs(long... values) {
+    ByteBuffer buf = ByteBuffer.allocate(8 * values.length).order(ByteOrder.LITTLE_ENDIAN);
+    for (long x : values) {
+      buf.putLong(x);
+    }
+    return buf.array();
+  }
+
+  private static byte[] packBigIntegers(String... values) {
+    ByteBuffer buf = ByteBuffer.allocate(1024).order(ByteOrder.LITTLE_ENDIAN);
+    for (String s : values) {
+      byte[] bytes = new BigInteger(s).toByteArray();
+      buf.putInt(bytes.length);
+      buf.put(bytes);
+    }
+    byte[] result = new byte[buf.position()];
+    buf.rewind();
+    buf.get(result);
+    return result;
+  }
+
+  private static byte[] concat(byte[] a, byte[] b) {
+    byte[] result = Arrays.copyOf(a, a.length + b.length);
+    System.arraycopy(b, 0, result, a.length, b.length);
+    return result;
+  }
+
+  private static Variable[] variables(String... names) {
+    Variable[] result = new Variable[names.length];
+    for (int i = 0; i < names.length; i++) {
+      result[i] = new Variable(names[i]);
+    }
+    return result;
+  }
+
+  @Test
+  public void fromArrays() {
+    Polynomial p =
+        PolynomialArrays.fromArrays(
+            variables("y", "x"), 3, packInts(0, 2, 1, 1, 0, 0), packLongs(3, -2, 1), false);
+    assertThat(p).isEqualTo(Polynomial.of("3*x^2-2*x*y+1"));
+
+    // Terms with the same exponents are summed up.
+    p =
+        PolynomialArrays.fromArrays(
+            variables("x"), 3, packInts(1, 0, 1), packLongs(1, 1, -1), false);
+    assertThat(p).isEqualTo(Polynomial.of("1"));
+
+    // Big coefficients.
+    p =
+        PolynomialArrays.fromArrays(
+            variables("x"),
+            2,
+            packInts(1, 0),
+            packBigIntegers("1267650600228229401496703205377", "-1"),
+            true);
+    assertThat(p).isEqualTo(Polynomial.of("(2^100+1)*x-1"));
+
+    // Unused variables are kept.
+    p = PolynomialArrays.fromArrays(variables("z", "x"), 1, packInts(0, 3), packLongs(1), false);
+    assertThat(p.getVariables()).isEqualTo(new VariableSet(variables("x", "z")));
+  }
+
+  @Test
+  public void invalidArrays() {
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.fromArrays(variables("x"), 2, packInts(1), packLongs(1, 2), false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.fromArrays(variables("x"), 1, packInts(1), packLongs(1, 2), false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.fromArrays(variables("x"), 1, packInts(-1), packLongs(1), false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () ->
+            PolynomialArrays.fromArrays(
+                variables("x", "x"), 1, packInts(1, 1), packLongs(1), false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.fromArrays(variables("x"), 1, packInts(1), packInts(1, 1), true));
+  }
+
+  @Test
+  public void toArrays() {
+    String[] inputs = {"0", "-7", "(1+x-2*y)^3", "(2^70+x)^2-3", "-2^63+x*z^10"};
+    for (String s : inputs) {
+      Polynomial p = Polynomial.of(s);
+      Variable[] vars = variables("z", "w", "y", "x");
+      ByteBuffer buf =
+          ByteBuffer.wrap(PolynomialArrays.toArrays(p, vars)).order(ByteOrder.LITTLE_ENDIAN);
+      int nterms = buf.getInt();
+      assertThat(nterms).isEqualTo(p.size());
+      assertThat(buf.getInt()).isEqualTo(vars.length);
+      boolean big = buf.getInt() != 0;
+      byte[] exponents = new byte[4 * nterms * vars.length];
+      buf.get(exponents);
+      byte[] coefficients = new byte[buf.remaining()];
+      buf.get(coefficients);
+      Polynomial q = PolynomialArrays.fromArrays(vars, nterms, exponents, coefficients, big);
+      assertThat(q).isEqualTo(p);
+    }
+
+    byte[] data = PolynomialArrays.toArrays(Polynomial.of("x*y^2"), null);
+    assertThat(data).isEqualTo(concat(packInts(1, 2, 0, 1, 2), packLongs(1)));
+
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.toArrays(Polynomial.of("x+y"), variables("x")));
+  }
+
+  @Test
+  public void toChunks() {
+    Polynomial p = Polynomial.of("(1+x-2*y)^3+2^70*z");
+    Variable[] vars = variables("z", "y", "x");
+    byte[] all = PolynomialArrays.toArrays(p, vars);
+    PolynomialArrays.TermChunks chunks = PolynomialArrays.toChunks(p, vars);
+    Polynomial sum = Polynomial.of("0");
+    int n = 0;
+    while (true) {
+      byte[] data = chunks.next(3);
+      ByteBuffer buf = ByteBuffer.wrap(data).order(ByteOrder.LITTLE_ENDIAN);
+      int nterms = buf.getInt();
+      assertThat(buf.getInt()).isEqualTo(vars.length);
+      boolean big = buf.getInt() != 0;
+      if (nterms == 0) {
+        break;
+      }
+      assertThat(nterms).isAtMost(3);
+      byte[] exponents = new byte[4 * nterms * vars.length];
+      buf.get(exponents);
+      byte[] coefficients = new byte[buf.remaining()];
+      buf.get(coefficients);
+      sum = sum.add(PolynomialArrays.fromArrays(vars, nterms, exponents, coefficients, big));
+      n += nterms;
+    }
+    assertThat(n).isEqualTo(p.size());
+    assertThat(sum).isEqualTo(p);
+
+    // A single chunk is the same as the whole arrays.
+    assertThat(PolynomialArrays.toChunks(p, vars).next(100)).isEqualTo(all);
+
+    assertThrows(IllegalArgumentException.class, () -> chunks.next(0));
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.toChunks(Polynomial.of("x+y"), variables("x")));
+  }
+
+  @Test
+  public void evaluateMany() {
+    Polynomial p = Polynomial.of("(1+x-2*y)^3+5*z*x");
+    Variable[] vars = variables("z", "y", "x");
+    for (boolean parallel : new boolean[] {false, true}) {
+      byte[] data =
+          PolynomialArrays.evaluateMany(
+              p, vars, 3, packLongs(3, 2, 1, 0, 0, 0, 1L << 40, 1, -4), false, parallel);
+      assertThat(data)
+          .isEqualTo(concat(packInts(3, 0), packLongs(7, 1, -125L - (20L << 40))));
+    }
+
+    // Big values.
+    byte[] data =
+        PolynomialArrays.evaluateMany(
+            p, vars, 1, packBigIntegers("0", "0", "1180591620717411303424"), true, false);
+    BigInteger x = new BigInteger("1180591620717411303425");
+    assertThat(data).isEqualTo(concat(packInts(1, 1), packBigIntegers(x.pow(3).toString())));
+
+    assertThat(PolynomialArrays.evaluateMany(p, vars, 0, new byte[0], false, false))
+        .isEqualTo(packInts(0, 0));
+
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.evaluateMany(p, variables("x"), 1, packLongs(1), false, false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () ->
+            PolynomialArrays.evaluateMany(
+                p, variables("x", "x", "y", "z"), 1, packLongs(1, 1, 1, 1), false, false));
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PolynomialArrays.evaluateMany(p, vars, 2, packLongs(1, 2, 3), false, false));
+  }
+}
@@ -1,8 +1,10 @@
 package com.github.tueda.donuts.python;
 
 import static com.google.common.truth.Truth.assertThat;
+import static org.junit.jupiter.api.Assertions.assertThrows;
 
 import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
 import com.github.tueda.donuts.Variable;
 import com.github.tueda.donuts.VariableSet;
 import java.io.ByteArrayInputStream;
@@ -10,6 +12,10 @@ import java.io.ByteArrayOutputStream;
 import java.io.IOException;
 import java.io.ObjectInputStream;
 import java.io.ObjectOutputStream;
+import java.math.BigInteger;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.Arrays;
 import java.util.Map;
 import org.junit.jupiter.api.Test;
 
@@ -48,6 +54,45 @@ public class PythonUtilsTest {
     assertThat(PythonUtils.variableSet(vars)).isEqualTo(new VariableSet(vars));
   }
 
+  @Test
+  public void variableNames() {
+    VariableSet vars = new VariableSet(Variable.of("x", "y", "z10", "z2"));
+    String names = PythonUtils.getVariableNames(vars);
+    assertThat(PythonUtils.variableSetOf(names)).isEqualTo(vars);
+
+    VariableSet empty = new VariableSet();
+    assertThat(PythonUtils.getVariableNames(empty)).isEmpty();
+    assertThat(PythonUtils.variableSetOf("")).isEqualTo(empty);
+  }
+
+  @Test
+  public void toIntArray() {
+    byte[] data = {1, 0, 0, 0, -2, -1, -1, -1, -1, -1, -1, 127};
+    assertThat(PythonUtils.toIntArray(data)).isEqualTo(new int[] {1, -2, Integer.MAX_VALUE});
+    assertThat(PythonUtils.toIntArray(new byte[0])).isEmpty();
+    assertThrows(IllegalArgumentException.class, () -> PythonUtils.toIntArray(new byte[3]));
+  }
+
+  @Test
+  public void bigIntegers() {
+    String[] inputs = {"0", "1", "-1", "127", "128", "-129", "2^63", "-2^1000-1"};
+    for (String s : inputs) {
+      Polynomial p = Polynomial.of(s);
+      byte[] bytes = PythonUtils.getIntegerBytes(p);
+      assertThat(new BigInteger(bytes).toString()).isEqualTo(p.toString());
+      assertThat(PythonUtils.polynomialOf(bytes)).isEqualTo(p);
+    }
+
+    RationalFunction r = RationalFunction.of("-2^100/3^50");
+    byte[] data = PythonUtils.getFractionBytes(r);
+    int n = ByteBuffer.wrap(data).order(ByteOrder.LITTLE_ENDIAN).getInt();
+    byte[] num = Arrays.copyOfRange(data, 4, 4 + n);
+    byte[] den = Arrays.copyOfRange(data, 4 + n, data.length);
+    assertThat(new BigInteger(num)).isEqualTo(BigInteger.ONE.shiftLeft(100).negate());
+    assertThat(new BigInteger(den)).isEqualTo(BigInteger.valueOf(3).pow(50));
+    assertThat(PythonUtils.rationalFunctionOf(num, den)).isEqualTo(r);
+  }
+
   @Test
   public void getCoefficientMap() {
     Polynomial p = Polynomial.of("(1+x-y)^2");
@@ -63,6 +108,33 @@ public class PythonUtilsTest {
     assertThat(ret1.get(new int[] {2, 0})).isEqualTo(Polynomial.of("1"));
   }
 
+  @Test
+  public void getExponentsAndCoefficients() {
+    Polynomial p = Polynomial.of("(1+x-y)^2+z");
+    Variable[] vars = Variable.of("x", "y");
+    Map<int[], Polynomial> map = PythonUtils.getCoefficientMap(p, vars);
+    int[] exponents = PythonUtils.getExponents(map);
+    Polynomial[] coefficients = PythonUtils.getCoefficients(map);
+    assertThat(exponents).hasLength(12);
+    assertThat(coefficients).hasLength(6);
+    for (int i = 0; i < coefficients.length; i++) {
+      int[] key = {exponents[2 * i], exponents[2 * i + 1]};
+      assertThat(map.get(key)).isEqualTo(coefficients[i]);
+    }
+
+    Map<int[], Polynomial> empty = PythonUtils.getCoefficientMap(new Polynomial(), vars);
+    assertThat(PythonUtils.getExponents(empty)).isEmpty();
+    assertThat(PythonUtils.getCoefficients(empty)).isEmpty();
+  }
+
+  @Test
+  public void getTerms() {
+    Polynomial p = Polynomial.of("(1+x-y)^2");
+    Polynomial[] terms = PythonUtils.getTerms(p);
+    assertThat(terms).hasLength(p.size());
+    assertThat(Polynomial.sumOf(terms)).isEqualTo(p);
+  }
+
   @Test
   public void sumOf() {
     Polynomial a = Polynomial.of("1+x+y");
@@ -110,4 +182,79 @@ public class PythonUtilsTest {
     assertThat(lcm1).isEqualTo(lcm2);
     assertThat(lcm1).isEqualTo(res);
   }
+
+  @Test
+  public void evaluateWithPackedValues() {
+    Variable[] vars = {new Variable("x"), new Variable("y")};
+    byte[] longs =
+        ByteBuffer.allocate(16)
+            .order(ByteOrder.LITTLE_ENDIAN)
+            .putLong(1L << 40)
+            .putLong(-3)
+            .array();
+    byte[] bigs = new BigInteger("1267650600228229401496703205376").toByteArray();
+    bigs =
+        ByteBuffer.allocate(4 + bigs.length)
+            .order(ByteOrder.LITTLE_ENDIAN)
+            .putInt(bigs.length)
+            .put(bigs)
+            .array();
+
+    Polynomial p = Polynomial.of("(1+x+y)^2*z");
+    assertThat(PythonUtils.evaluate(p, vars, longs, false))
+        .isEqualTo(Polynomial.of("(2^40-2)^2*z"));
+    assertThat(PythonUtils.shift(p, Arrays.copyOf(vars, 1), bigs, true))
+        .isEqualTo(Polynomial.of("(1+x+2^100+y)^2*z"));
+
+    RationalFunction r = RationalFunction.of("(1+x)/(1+y)/z");
+    assertThat(PythonUtils.evaluate(r, vars, longs, false))
+        .isEqualTo(RationalFunction.of("(1+2^40)/(-2)/z"));
+    assertThat(PythonUtils.shift(r, Arrays.copyOf(vars, 1), bigs, true))
+        .isEqualTo(RationalFunction.of("(1+x+2^100)/(1+y)/z"));
+
+    assertThrows(
+        IllegalArgumentException.class,
+        () -> PythonUtils.evaluate(p, vars, Arrays.copyOf(longs, 8), false));
+  }
+
+  @Test
+  public void countTerms() {
+    assertThat(PythonUtils.countTerms(RationalFunction.of("0"))).isEqualTo(1);
+    assertThat(PythonUtils.countTerms(RationalFunction.of("(1+x)^2/(1-y)"))).isEqualTo(5);
+  }
+
+  @Test
+  public void parseMany() {
+    String[] strings = {"1+x", "x/2", "(1+x+y)^3", "1/0"};
+    for (boolean parallel : new boolean[] {false, true}) {
+      assertThat(PythonUtils.parsePolynomials(strings, parallel))
+          .asList()
+          .containsExactly(Polynomial.of("1+x"), null, Polynomial.of("(1+x+y)^3"), null)
+          .inOrder();
+      assertThat(PythonUtils.parseRationalFunctions(strings, parallel))
+          .asList()
+          .containsExactly(
+              RationalFunction.of("1+x"),
+              RationalFunction.of("x/2"),
+              RationalFunction.of("(1+x+y)^3"),
+              null)
+          .inOrder();
+    }
+
+    assertThat(PythonUtils.parsePolynomialLines("", false)).isEmpty();
+    assertThat(PythonUtils.parsePolynomialLines("\n", false))
+        .asList()
+        .containsExactly((Object) null);
+    assertThat(PythonUtils.parsePolynomialLines("x
+y", true))
+        .asList()
+        .containsExactly(Polynomial.of("x"), Polynomial.of("y"))
+        .inOrder();
+    assertThat(PythonUtils.parseRationalFunctionLines("1/x
+
+", false))
+        .asList()
+        .containsExactly(RationalFunction.of("1/x"), null)
+        .inOrder();
+  }
 }
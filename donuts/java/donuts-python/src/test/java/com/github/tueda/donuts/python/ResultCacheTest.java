@@ -0,0 +1,98 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+
+import com.github.tueda.donuts.Polynomial;
+import org.junit.jupiter.api.Test;
+
+public class ResultCacheTest {
+  @Test
+  public void cache() {
+    ResultCache.clear();
+
+    Polynomial a = Polynomial.of("(1+x)^3*(1-y)");
+    Polynomial b = Polynomial.of("(1+x)*(2-y)");
+
+    Polynomial g = ResultCache.gcd(a, b);
+    assertThat(g).isEqualTo(Polynomial.of("1+x"));
+    assertThat(ResultCache.gcd(b, a)).isSameInstanceAs(g);
+    assertThat(ResultCache.lcm(a, b)).isEqualTo(Polynomial.of("(1+x)^3*(1-y)*(2-y)"));
+    assertThat(ResultCache.divideExact(a, g)).isEqualTo(Polynomial.of("(1+x)^2*(1-y)"));
+    assertThat(ResultCache.factors(a)).asList().containsExactlyElementsIn(a.factors());
+    assertThrows(ArithmeticException.class, () -> ResultCache.divideExact(a, b));
+
+    long[] info = ResultCache.getInfo();
+    assertThat(info[0]).isEqualTo(1);
+    assertThat(info[1]).isEqualTo(5);
+    assertThat(info[3]).isEqualTo(4);
+
+    ResultCache.configure(1, 1L << 20);
+    assertThat(ResultCache.getInfo()[3]).isEqualTo(1);
+    ResultCache.configure(1024, 64L << 20);
+
+    ResultCache.clear();
+    assertThat(ResultCache.getInfo()[3]).isEqualTo(0);
+    assertThrows(IllegalArgumentException.class, () -> ResultCache.configure(-1, 0));
+  }
+
+  @Test
+  public void getAndPut() {
+    ResultCache.clear();
+
+    Polynomial[] args = {Polynomial.of("(1+x)*(1-y)"), Polynomial.of("(1+x)*(1+z)")};
+    assertThat(ResultCache.get("gcd", args)).isNull();
+    assertThat(ResultCache.compute("gcd", args)).asList().containsExactly(Polynomial.of("1+x"));
+    assertThat(ResultCache.get("gcd", new Polynomial[] {args[1], args[0]}))
+        .asList()
+        .containsExactly(Polynomial.of("1+x"));
+
+    Polynomial[] factors = {Polynomial.of("1+x"), Polynomial.of("1-y")};
+    ResultCache.put("factors", new Polynomial[] {args[0]}, factors);
+    assertThat(ResultCache.factors(args[0])).asList().containsExactlyElementsIn(factors);
+
+    assertThrows(IllegalArgumentException.class, () -> ResultCache.compute("unknown", args));
+    ResultCache.clear();
+  }
+
+  @Test
+  public void variables() {
+    ResultCache.clear();
+
+    // Equal polynomials with different sets of variables.
+    Polynomial a = Polynomial.of("(1+x)*(1-x)");
+    Polynomial b = Polynomial.of("(1+x)*(1-x)+y-y");
+    assertThat(ResultCache.factors(a)[1].getVariables()).isEqualTo(a.getVariables());
+    for (Polynomial f : ResultCache.factors(b)) {
+      assertThat(f.getVariables()).isEqualTo(b.getVariables());
+    }
+    assertThat(ResultCache.gcd(a, Polynomial.of("1+x")).getVariables())
+        .isEqualTo(a.getVariables());
+    assertThat(ResultCache.gcd(b, Polynomial.of("1+x")).getVariables())
+        .isEqualTo(b.getVariables());
+
+    ResultCache.clear();
+  }
+
+  @Test
+  public void digest() {
+    Polynomial a = Polynomial.of("1+x");
+    Polynomial b = Polynomial.of("1+x+y-y");
+    Polynomial c = Polynomial.of("1-y");
+    assertThat(a.getVariables()).isNotEqualTo(b.getVariables());
+
+    byte[] d = ResultCache.digest("factors", new Polynomial[] {a});
+    assertThat(d).hasLength(32);
+    assertThat(ResultCache.digest("factors", new Polynomial[] {b})).isEqualTo(d);
+    assertThat(ResultCache.digest("factors", new Polynomial[] {c})).isNotEqualTo(d);
+    assertThat(ResultCache.digest("gcd", new Polynomial[] {a})).isNotEqualTo(d);
+    assertThat(ResultCache.digest("divideExact", new Polynomial[] {a, c}))
+        .isNotEqualTo(ResultCache.digest("divideExact", new Polynomial[] {c, a}));
+  }
+
+  @Test
+  public void estimateBytes() {
+    assertThat(ResultCache.estimateBytes(Polynomial.of("(1+x+y)^10")))
+        .isGreaterThan(ResultCache.estimateBytes(Polynomial.of("(1+x+y)^5")));
+  }
+}
@@ -0,0 +1,77 @@
+package com.github.tueda.donuts.python;
+
+import static com.google.common.truth.Truth.assertThat;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+
+import com.github.tueda.donuts.Polynomial;
+import com.github.tueda.donuts.RationalFunction;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+public class TextFormatTest {
+  private static String join(final TextFormat.TextChunks chunks) {
+    StringBuilder sb = new StringBuilder();
+    for (String s = chunks.next(); !s.isEmpty(); s = chunks.next()) {
+      sb.append(s);
+    }
+    return sb.toString();
+  }
+
+  private static void writeString(final Path path, final String s) throws IOException {
+    Files.write(path, s.getBytes(StandardCharsets.UTF_8));
+  }
+
+  @Test
+  public void chunks() {
+    String[] inputs = {"0", "1", "-2^70", "-x", "(1+x-2*y)^3-z^10", "(1+x+y+z)^30"};
+    for (String s : inputs) {
+      Polynomial p = Polynomial.of(s);
+      assertThat(join(TextFormat.toChunks(p))).isEqualTo(p.toString());
+    }
+
+    inputs =
+        new String[] {
+          "0", "-3/4", "x/2", "-x/y^2", "2*x/(3*y)", "x/(y*z)", "(1+x)/(2-y)", "(1+x)^20/(1-x)^5"
+        };
+    for (String s : inputs) {
+      RationalFunction r = RationalFunction.of(s);
+      assertThat(join(TextFormat.toChunks(r))).isEqualTo(r.toString());
+    }
+  }
+
+  @Test
+  public void writeAndRead(@TempDir final Path dir) throws IOException {
+    String path = dir.resolve("a.txt").toString();
+
+    Polynomial p = Polynomial.of("(1+x+y+z+w)^20");
+    TextFormat.writePolynomial(p, path);
+    assertThat(TextFormat.readPolynomial(path)).isEqualTo(p);
+
+    RationalFunction r = RationalFunction.of("(1+x+y)^10/(1-x-z)^5/2");
+    TextFormat.writeRationalFunction(r, path);
+    assertThat(TextFormat.readRationalFunction(path)).isEqualTo(r);
+  }
+
+  @Test
+  public void parse(@TempDir final Path dir) throws IOException {
+    Path path = dir.resolve("a.txt");
+
+    writeString(path, "-2*x*(1+y)^2 - (x^2-1)/(x-1)*(y)^(1+1)\n");
+    assertThat(TextFormat.readPolynomial(path.toString()))
+        .isEqualTo(Polynomial.of("-2*x*(1+y)^2-(x+1)*y^2"));
+
+    writeString(path, "1/(1+x) + 1/(1-x) - 2^3^2");
+    assertThat(TextFormat.readRationalFunction(path.toString()))
+        .isEqualTo(RationalFunction.of("2/(1-x^2)-64"));
+
+    String[] invalid = {"", "1+", "(1+x", "1+x)", "x/2", "2*(1+x)y", "(x)(y)"};
+    for (String s : invalid) {
+      writeString(path, s);
+      assertThrows(RuntimeException.class, () -> TextFormat.readPolynomial(path.toString()));
+    }
+  }
+}
@@ -1,7 +1,16 @@
 """Interface to Java virtual machine."""
 
+from __future__ import annotations
+
+import array
+import io
 import os
-from typing import Any
+import shlex
+import shutil
+import socket
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # NOTE: using import aliases hits an isort bug,
 #       see https://github.com/PyCQA/isort/issues/1839.
@@ -16,8 +25,121 @@ except AttributeError:
 
 # XXX: we assume that the Traversable object is indeed a Path.
 _JAR_FILE = str(_res_files("donuts").joinpath("java").joinpath("donuts-all.jar"))
-
-_BACKEND = os.getenv("DONUTS_PYTHON_BACKEND", "pyjnius")
+_CDS_FILE = str(_res_files("donuts").joinpath("java").joinpath("donuts-all.jsa"))
+_CDS_RELEASE_FILE = _CDS_FILE + ".release"
+
+_GC_OPTIONS = {
+    "g1": "-XX:+UseG1GC",
+    "parallel": "-XX:+UseParallelGC",
+    "serial": "-XX:+UseSerialGC",
+    "shenandoah": "-XX:+UseShenandoahGC",
+    "z": "-XX:+UseZGC",
+    "zgc": "-XX:+UseZGC",
+}
+
+# Linux only.
+_TCP_QUICKACK: Optional[int] = getattr(socket, "TCP_QUICKACK", None)
+
+_config: Dict[str, Any] = {}
+
+
+def configure(
+    *,
+    heap: Optional[str] = None,
+    gc: Optional[str] = None,
+    options: Optional[Sequence[str]] = None,
+    classpath: Optional[Sequence[str]] = None,
+    cds: Optional[bool] = None,
+) -> None:
+    """Configure the JVM to be started.
+
+    This function must be called before the JVM is started. Only the given settings
+    are updated; the others are left unchanged.
+
+    Args:
+        heap: The maximum heap size, e.g., ``"8g"`` (``-Xmx``).
+        gc: The garbage collector: ``"g1"``, ``"parallel"``, ``"serial"``,
+            ``"shenandoah"`` or ``"zgc"``.
+        options: Extra JVM options, e.g., ``["-XX:TieredStopAtLevel=1"]``.
+        classpath: Extra class paths.
+        cds: Whether the CDS archive generated by ``invoke build --cds`` is used
+            when it is compatible with the JDK (default: `True`).
+
+    The options in the environment variable ``DONUTS_PYTHON_JVM_OPTS`` are appended
+    to those given by this function, so they take precedence. Similarly,
+    ``DONUTS_PYTHON_CDS=0`` disables the CDS archive.
+    """
+    if jvm.is_started:
+        raise RuntimeError("JVM already started")
+    if gc is not None and gc.lower() not in _GC_OPTIONS:
+        raise ValueError(f"unknown garbage collector: `{gc}`")
+    if heap is not None:
+        _config["heap"] = heap
+    if gc is not None:
+        _config["gc"] = gc.lower()
+    if options is not None:
+        _config["options"] = list(options)
+    if classpath is not None:
+        _config["classpath"] = list(classpath)
+    if cds is not None:
+        _config["cds"] = cds
+
+
+def _java_home() -> Optional[str]:
+    """Return the Java home directory expected to be used."""
+    java_home = os.getenv("JAVA_HOME")
+    if java_home:
+        return java_home
+    java_cmd = shutil.which("java")
+    if java_cmd:
+        # JAVA_HOME/bin/java
+        return os.path.dirname(os.path.dirname(os.path.realpath(java_cmd)))
+    return None
+
+
+def _cds_options() -> List[str]:
+    """Return the JVM options to use the CDS archive if available."""
+    env = os.getenv("DONUTS_PYTHON_CDS")
+    if env is not None:
+        enabled = env.lower() not in ("0", "false", "no", "off")
+    else:
+        enabled = _config.get("cds", True)
+    if not enabled or not os.path.isfile(_CDS_FILE):
+        return []
+
+    # The archive must have been generated by the same JDK.
+    java_home = _java_home()
+    if not java_home:
+        return []
+    try:
+        with open(_CDS_RELEASE_FILE) as f:
+            expected = f.read()
+        with open(os.path.join(java_home, "release")) as f:
+            actual = f.read()
+    except OSError:
+        return []
+    if actual != expected:
+        return []
+
+    # Silently fall back to the normal class loading when the archive is unusable.
+    return [f"-XX:SharedArchiveFile={_CDS_FILE}", "-Xshare:auto", "-Xlog:cds*=off"]
+
+
+def _jvm_options() -> List[str]:
+    """Return the JVM options."""
+    options = _cds_options()
+    if "heap" in _config:
+        options.append(f"-Xmx{_config['heap']}")
+    if "gc" in _config:
+        options.append(_GC_OPTIONS[_config["gc"]])
+    options.extend(_config.get("options", []))
+    options.extend(shlex.split(os.getenv("DONUTS_PYTHON_JVM_OPTS", "")))
+    return options
+
+
+def _classpath() -> List[str]:
+    """Return the class paths."""
+    return [_JAR_FILE, *_config.get("classpath", [])]
 
 
 class BackendMixin:
@@ -29,6 +151,10 @@ class BackendMixin:
     - `_ObjectOutputStream`
     - `_ByteArrayInputStream`
     - `_ObjectInputStream`
+
+    It also implements `to_bytes`, `call_many`, `get_array_items`,
+    `set_array_items`, `create_array` and `create_int_array` in a plain way, which
+    backends may override for speed.
     """
 
     def serialize(self, java_obj: Any) -> bytes:
@@ -38,7 +164,7 @@ class BackendMixin:
             byte_stream
         )
         object_stream.writeObject(java_obj)
-        return bytes(byte_stream.toByteArray())
+        return self.to_bytes(byte_stream.toByteArray())
 
     def deserialize(self, data: bytes) -> Any:
         """Deserialize a Java object."""
@@ -48,25 +174,201 @@ class BackendMixin:
         )
         return object_stream.readObject()
 
+    def to_bytes(self, array: Any) -> bytes:
+        """Convert the given Java byte array to bytes."""
+        return bytes(array)
+
+    def call_many(self, calls: Sequence[Tuple[Any, Sequence[Any]]]) -> List[Any]:
+        """Call the given Java methods with the given arguments.
+
+        The calls must be independent of each other.
+        """
+        return [method(*args) for method, args in calls]
+
+    def get_array_items(self, array: Any) -> List[Any]:
+        """Return the elements of the given Java array."""
+        return list(array)
+
+    def set_array_items(self, array: Any, values: Sequence[Any]) -> None:
+        """Set the elements of the given Java array."""
+        for i, x in enumerate(values):
+            array[i] = x
+
+    def create_array(self, java_class: Any, values: Sequence[Any]) -> Any:
+        """Create a Java array with the given elements."""
+        new_array = self.new_array  # type: ignore[attr-defined]
+        java_array = new_array(java_class, len(values))
+        self.set_array_items(java_array, values)
+        return java_array
+
+    def create_int_array(self, values: array.array[int]) -> Any:
+        """Create a Java int array with the given elements."""
+        java_array = self.new_int_array(len(values))  # type: ignore[attr-defined]
+        self.set_array_items(java_array, values)
+        return java_array
+
+
+class _QuickAckSocketIO(io.RawIOBase):
+    """Socket reader that does not delay ACKs.
+
+    The Py4J Java side does not disable Nagle's algorithm, so an answer split into
+    several segments stalls until the first segment is acknowledged, which takes
+    tens of milliseconds with delayed ACKs.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        """Construct a reader for the given socket."""
+        super().__init__()
+        self._sock = sock
+
+    def readable(self) -> bool:
+        """Return True."""
+        return True
+
+    def readinto(self, b: Any) -> int:
+        """Read bytes into the given buffer."""
+        if _TCP_QUICKACK is not None:
+            self._sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        return self._sock.recv_into(b)
+
+
+def _has_py4j_internals() -> bool:
+    """Return `True` if the Py4J internals used for pipelining are available.
+
+    They are not a public API of Py4J, so we check them and otherwise fall back to
+    plain calls.
+    """
+    try:
+        from py4j import protocol
+        from py4j.java_gateway import (
+            GatewayClient,
+            GatewayConnection,
+            JavaGateway,
+            JavaMember,
+        )
+    except ImportError:  # pragma: no cover
+        return False
+    return all(
+        hasattr(obj, name)
+        for obj, names in (
+            (
+                protocol,
+                (
+                    "ARRAY_COMMAND_NAME",
+                    "ARRAY_GET_SUB_COMMAND_NAME",
+                    "ARRAY_SET_SUB_COMMAND_NAME",
+                    "CALL_COMMAND_NAME",
+                    "EMPTY_RESPONSE",
+                    "END_COMMAND_PART",
+                    "RETURN_MESSAGE",
+                    "get_command_part",
+                    "get_return_value",
+                    "smart_decode",
+                ),
+            ),
+            (
+                GatewayClient,
+                ("_create_connection", "_get_connection", "_give_back_connection"),
+            ),
+            (GatewayConnection, ("start",)),
+            (JavaGateway, ("_create_gateway_client",)),
+            (JavaMember, ("_build_args",)),
+        )
+        for name in names
+    )
+
+
+def _create_py4j_gateway(parameters: Any) -> Any:
+    """Create a Py4J gateway, with connections reading answers without delay."""
+    from py4j.java_gateway import GatewayClient, GatewayConnection, JavaGateway
+
+    if not _has_py4j_internals():
+        return JavaGateway(gateway_parameters=parameters)  # pragma: no cover
+
+    class Connection(GatewayConnection):  # type: ignore[misc]
+        def start(self) -> None:
+            super().start()
+            if _TCP_QUICKACK is not None and hasattr(self, "stream"):
+                self.stream = io.BufferedReader(_QuickAckSocketIO(self.socket))
+
+    class Client(GatewayClient):  # type: ignore[misc]
+        def _create_connection(self) -> Any:
+            connection = Connection(self.gateway_parameters, self.gateway_property)
+            connection.start()
+            return connection
+
+    class Gateway(JavaGateway):  # type: ignore[misc]
+        def _create_gateway_client(self) -> Any:
+            return Client(gateway_parameters=self.gateway_parameters)
+
+    return Gateway(gateway_parameters=parameters)
+
+
+def _launch_py4j_gateway(port: int = 0) -> Tuple[int, str, Any]:
+    """Launch a Py4J gateway and return its port, token and process."""
+    from py4j.java_gateway import find_jar_path, launch_gateway
+
+    # Check if the jar file exists.
+    with open(_JAR_FILE, "rb"):
+        pass
+
+    # Put our JAR file first, which must be consistent with the CDS archive.
+    classpath = _classpath()
+    classpath.insert(1, find_jar_path())
+
+    (port, token, proc) = launch_gateway(
+        port=port,
+        jarpath=classpath[0],
+        classpath=os.pathsep.join(classpath[1:]),
+        javaopts=_jvm_options(),
+        # Honor JAVA_HOME, as assumed in checking the CDS archive.
+        java_path=None,
+        enable_auth=True,
+        die_on_exit=True,
+        return_proc=True,
+    )
+    # The token is read from the binary pipe.
+    if isinstance(token, bytes):
+        token = token.decode()
+    return (port, token, proc)
+
 
 class Py4JBackend(BackendMixin):
-    """JVM wrapper with py4 backend."""
+    """JVM wrapper with py4 backend.
+
+    If the environment variable ``DONUTS_PYTHON_PY4J_PORT`` is set, it attaches to
+    the gateway running at the port (see `donuts.gateway`) instead of launching
+    a new JVM. ``DONUTS_PYTHON_PY4J_ADDRESS`` and ``DONUTS_PYTHON_PY4J_TOKEN``
+    give the address and the authentication token.
+
+    Independent commands are pipelined: they are sent at once and then their
+    answers are read, which saves socket round trips. This relies on internals of
+    Py4J; if they are missing, plain calls are used instead.
+    """
+
+    # The maximum number of commands sent at once, small enough for the answers not
+    # to fill up the socket buffer while we are still sending.
+    _PIPELINE_SIZE = 512
 
     def __init__(self) -> None:
         """Create a JVM."""
-        from py4j.java_gateway import GatewayParameters, JavaGateway, launch_gateway
+        from py4j.java_gateway import GatewayParameters
 
-        # Check if the jar file exists.
-        with open(_JAR_FILE, "rb"):
-            pass
+        shared_port = os.getenv("DONUTS_PYTHON_PY4J_PORT")
+        if shared_port:
+            # Attach to a gateway that is already running.
+            parameters = GatewayParameters(
+                address=os.getenv("DONUTS_PYTHON_PY4J_ADDRESS", "127.0.0.1"),
+                port=int(shared_port),
+                auth_token=os.getenv("DONUTS_PYTHON_PY4J_TOKEN") or None,
+            )
+        else:
+            (port, token, _) = _launch_py4j_gateway()
+            parameters = GatewayParameters(port=port, auth_token=token)
 
-        (port, token) = launch_gateway(
-            classpath=_JAR_FILE, enable_auth=True, die_on_exit=True
-        )
+        gateway = _create_py4j_gateway(parameters)
 
-        gateway = JavaGateway(
-            gateway_parameters=GatewayParameters(port=port, auth_token=token),
-        )
+        self._pipelined = _has_py4j_internals()
 
         self._gateway = gateway
         self._jvm = gateway.jvm
@@ -76,10 +378,129 @@ class Py4JBackend(BackendMixin):
         self._ByteArrayInputStream = self.find_class("java.io.ByteArrayInputStream")
         self._ObjectInputStream = self.find_class("java.io.ObjectInputStream")
 
+        self._PythonUtils = self.find_class(
+            "com.github.tueda.donuts.python.PythonUtils"
+        )
+
     def find_class(self, class_name: str) -> Any:
         """Return a Java class."""
         return self._jvm.__getattr__(class_name)
 
+    def _send_commands(self, commands: Sequence[str]) -> List[str]:
+        """Send the given commands in a pipelined way and return the answers."""
+        from py4j.protocol import (
+            EMPTY_RESPONSE,
+            RETURN_MESSAGE,
+            Py4JNetworkError,
+            smart_decode,
+        )
+
+        client = self._gateway._gateway_client
+        connection = client._get_connection()
+        answers = []
+        try:
+            for i in range(0, len(commands), self._PIPELINE_SIZE):
+                chunk = commands[i : i + self._PIPELINE_SIZE]
+                connection.socket.sendall("".join(chunk).encode("utf-8"))
+                for _ in chunk:
+                    answer = smart_decode(connection.stream.readline()[:-1])
+                    if answer.startswith(RETURN_MESSAGE):
+                        answer = answer[1:]
+                    if answer.strip() == "":
+                        raise Py4JNetworkError(
+                            "Answer from Java side is empty", when=EMPTY_RESPONSE
+                        )
+                    answers.append(answer)
+        except BaseException:
+            # The connection may be in an inconsistent state.
+            connection.close()
+            raise
+        client._give_back_connection(connection)
+        return answers
+
+    def call_many(self, calls: Sequence[Tuple[Any, Sequence[Any]]]) -> List[Any]:
+        """Call the given Java methods with the given arguments.
+
+        The calls must be independent of each other.
+        """
+        if not self._pipelined or not all(
+            hasattr(method, "command_header") for method, _ in calls
+        ):
+            return super().call_many(calls)
+
+        from py4j.protocol import CALL_COMMAND_NAME, END_COMMAND_PART, get_return_value
+
+        commands = []
+        temp_args = []
+        for method, args in calls:
+            args_command, method_temp_args = method._build_args(*args)
+            commands.append(
+                CALL_COMMAND_NAME
+                + method.command_header
+                + args_command
+                + END_COMMAND_PART
+            )
+            temp_args.extend(method_temp_args)
+
+        try:
+            answers = self._send_commands(commands)
+            client = self._gateway._gateway_client
+            return [
+                get_return_value(answer, client, method.target_id, method.name)
+                for answer, (method, _) in zip(answers, calls)
+            ]
+        finally:
+            for temp_arg in temp_args:
+                if hasattr(temp_arg, "_detach"):
+                    temp_arg._detach()
+
+    def get_array_items(self, array: Any) -> List[Any]:
+        """Return the elements of the given Java array."""
+        from py4j.java_collections import JavaArray
+        from py4j.protocol import (
+            ARRAY_COMMAND_NAME,
+            ARRAY_GET_SUB_COMMAND_NAME,
+            END_COMMAND_PART,
+            get_command_part,
+            get_return_value,
+        )
+
+        if not isinstance(array, JavaArray) or not self._pipelined:
+            # Already converted, e.g., byte[] to bytes, or no pipelining.
+            return list(array)
+
+        header = ARRAY_COMMAND_NAME + ARRAY_GET_SUB_COMMAND_NAME + array._target_id
+        commands = [
+            header + "\n" + get_command_part(i) + END_COMMAND_PART
+            for i in range(len(array))
+        ]
+        client = self._gateway._gateway_client
+        return [get_return_value(x, client) for x in self._send_commands(commands)]
+
+    def set_array_items(self, array: Any, values: Sequence[Any]) -> None:
+        """Set the elements of the given Java array."""
+        if not self._pipelined:
+            super().set_array_items(array, values)
+            return
+
+        from py4j.protocol import (
+            ARRAY_COMMAND_NAME,
+            ARRAY_SET_SUB_COMMAND_NAME,
+            END_COMMAND_PART,
+            get_command_part,
+            get_return_value,
+        )
+
+        header = ARRAY_COMMAND_NAME + ARRAY_SET_SUB_COMMAND_NAME + array._target_id
+        commands = [
+            header + "\n" + get_command_part(i) + get_command_part(x) + END_COMMAND_PART
+            for i, x in enumerate(values)
+        ]
+        client = self._gateway._gateway_client
+        for answer in self._send_commands(commands):
+            # Raise an error if any.
+            get_return_value(answer, client)
+
     def new_array(self, java_class: Any, size: int) -> Any:
         """Create a Java array."""
         return self._gateway.new_array(java_class, size)
@@ -88,6 +509,14 @@ class Py4JBackend(BackendMixin):
         """Create a Java int array."""
         return self._gateway.new_array(self._gateway.jvm.int, size)
 
+    def create_int_array(self, values: array.array[int]) -> Any:
+        """Create a Java int array with the given elements."""
+        # Ship the packed integers at once, instead of setting them one by one.
+        if sys.byteorder == "big":
+            values = array.array("i", values)  # pragma: no cover
+            values.byteswap()  # pragma: no cover
+        return self._PythonUtils.toIntArray(values.tobytes())
+
     @property
     def java_error_class(self) -> Any:
         """Return the error class indicating exceptions in Java client code."""
@@ -112,7 +541,8 @@ class JniusBackend(BackendMixin):
         with open(_JAR_FILE, "rb"):
             pass
 
-        jnius_config.set_classpath(_JAR_FILE)
+        jnius_config.set_classpath(*_classpath())
+        jnius_config.add_options(*_jvm_options())
 
         from jnius import autoclass
 
@@ -141,6 +571,20 @@ class JniusBackend(BackendMixin):
         """Create a Java int array."""
         return [0] * size
 
+    def create_array(self, java_class: Any, values: Sequence[Any]) -> Any:
+        """Create a Java array with the given elements."""
+        # A list is converted to a Java array when passed to a method.
+        return list(values)
+
+    def create_int_array(self, values: array.array[int]) -> Any:
+        """Create a Java int array with the given elements."""
+        return values.tolist()
+
+    def to_bytes(self, array: Any) -> bytes:
+        """Convert the given Java byte array to bytes."""
+        # Much faster than bytes(array) for jnius.ByteArray.
+        return array.tostring()  # type: ignore[no-any-return]
+
     @property
     def java_error_class(self) -> Any:
         """Return the error class indicating exceptions in Java client code."""
@@ -165,12 +609,13 @@ class JPypeBackend(BackendMixin):
         with open(_JAR_FILE, "rb"):
             pass
 
-        jpype.addClassPath(_JAR_FILE)
-        jpype.startJVM()
+        for path in _classpath():
+            jpype.addClassPath(path)
+        jpype.startJVM(*_jvm_options())
 
         self._JClass = jpype.JClass
         self._JArray = jpype.JArray
-        self._JInt = jpype.JInt
+        self._JIntArray = jpype.JArray(jpype.JInt)
 
         self._ByteArrayOutputStream = self.find_class("java.io.ByteArrayOutputStream")
         self._ObjectOutputStream = self.find_class("java.io.ObjectOutputStream")
@@ -189,7 +634,16 @@ class JPypeBackend(BackendMixin):
 
     def new_int_array(self, size: int) -> Any:
         """Create a Java int array."""
-        return self._JArray(self._JInt)(size)
+        return self._JIntArray(size)
+
+    def create_array(self, java_class: Any, values: Sequence[Any]) -> Any:
+        """Create a Java array with the given elements."""
+        return self._JArray(java_class)(values)
+
+    def create_int_array(self, values: array.array[int]) -> Any:
+        """Create a Java int array with the given elements."""
+        # Copied via the buffer protocol.
+        return self._JIntArray(values)
 
     @property
     def java_error_class(self) -> Any:
@@ -204,11 +658,111 @@ class JPypeBackend(BackendMixin):
         return str(error.getMessage())
 
 
-if _BACKEND == "py4j":
-    jvm = Py4JBackend()
-elif _BACKEND == "pyjnius":
-    jvm = JniusBackend()  # type: ignore[assignment]
-elif _BACKEND == "jpype":
-    jvm = JPypeBackend()  # type: ignore[assignment]
-else:
-    raise ValueError(f"unknown backend: DONUTS_PYTHON_BACKEND = '{_BACKEND}'")
+def _create_backend() -> Any:
+    """Create the backend specified by `DONUTS_PYTHON_BACKEND`."""
+    backend = os.getenv("DONUTS_PYTHON_BACKEND", "pyjnius")
+    if backend == "py4j":
+        return Py4JBackend()
+    elif backend == "pyjnius":
+        return JniusBackend()
+    elif backend == "jpype":
+        return JPypeBackend()
+    raise ValueError(f"unknown backend: DONUTS_PYTHON_BACKEND = '{backend}'")
+
+
+class LazyJavaClass:
+    """Java class that is looked up when it is used for the first time."""
+
+    def __init__(self, backend: LazyBackend, class_name: str) -> None:
+        """Construct a proxy to a Java class."""
+        self._backend = backend
+        self._class_name = class_name
+        self._java_class: Any = None
+
+    def resolve(self) -> Any:
+        """Return the Java class, starting the JVM if needed."""
+        java_class = self._java_class
+        if java_class is None:
+            java_class = self._backend.start().find_class(self._class_name)
+            self._java_class = java_class
+        return java_class
+
+    def __call__(self, *args: Any) -> Any:
+        """Construct a Java object."""
+        return self.resolve()(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return a static member of the Java class."""
+        if name.startswith("_"):
+            # Introspection, e.g., by doctest or copy, must not start the JVM.
+            raise AttributeError(name)
+        value = getattr(self.resolve(), name)
+        # Cache it so that the next lookup does not come here.
+        self.__dict__[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        """Return the "official" string representation."""
+        return f"LazyJavaClass('{self._class_name}')"
+
+
+class LazyBackend:
+    """JVM backend that is started when it is used for the first time."""
+
+    def __init__(self) -> None:
+        """Construct a proxy to a JVM backend."""
+        self._backend: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_started(self) -> bool:
+        """Return `True` if the JVM has been started."""
+        return self._backend is not None
+
+    def start(self) -> Any:
+        """Start the JVM if not started yet and return the backend."""
+        backend = self._backend
+        if backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = _create_backend()
+                backend = self._backend
+        return backend
+
+    def find_class(self, class_name: str) -> LazyJavaClass:
+        """Return a Java class, which is looked up lazily."""
+        return LazyJavaClass(self, class_name)
+
+    def new_array(self, java_class: Any, size: int) -> Any:
+        """Create a Java array."""
+        if isinstance(java_class, LazyJavaClass):
+            java_class = java_class.resolve()
+        return self.start().new_array(java_class, size)
+
+    def create_array(self, java_class: Any, values: Sequence[Any]) -> Any:
+        """Create a Java array with the given elements."""
+        if isinstance(java_class, LazyJavaClass):
+            java_class = java_class.resolve()
+        return self.start().create_array(java_class, values)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the backend."""
+        if name.startswith("_"):
+            # Introspection, e.g., by doctest or copy, must not start the JVM.
+            raise AttributeError(name)
+        value = getattr(self.start(), name)
+        # Cache it so that the next lookup does not come here.
+        self.__dict__[name] = value
+        return value
+
+
+jvm = LazyBackend()
+
+
+def start() -> None:
+    """Start the JVM.
+
+    The JVM is automatically started when it is needed for the first time. This
+    function starts it explicitly, e.g., in order to pay the startup cost up front.
+    """
+    jvm.start()
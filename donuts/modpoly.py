@@ -0,0 +1,313 @@
+"""Polynomial over a prime field."""
+
+from __future__ import annotations
+
+from typing import Any, FrozenSet, Sequence, Union, overload
+
+from .array import _create_raw_var_array, _is_int_array_like, _pack_integers
+from .jvm import jvm
+from .poly import Polynomial
+from .var import Variable
+from .varset import VariableSet
+
+_RawModPolynomial = jvm.find_class("com.github.tueda.donuts.python.ModPolynomial")
+
+_MAX_MODULUS = 2**62 - 1
+
+
+class ModPolynomial:
+    """Polynomial with coefficients in the integers modulo a prime.
+
+    The modulus must be a prime less than ``2**62``, so that coefficients are stored
+    as machine words, which is much faster than arbitrary-precision arithmetic.
+    Integers, variables and polynomials in operations are reduced modulo the prime.
+    """
+
+    __slots__ = ("_raw", "_modulus")
+
+    def __init__(
+        self, value: Union[ModPolynomial, Polynomial, Variable, int, str], modulus: int
+    ) -> None:
+        """Construct a polynomial modulo the given prime."""
+        if not isinstance(modulus, int):
+            raise TypeError("modulus must be an integer")
+        self._modulus: int = modulus
+        if isinstance(value, ModPolynomial):
+            if value._modulus != modulus:
+                raise ValueError("different moduli")
+            self._raw: Any = value._raw
+        elif isinstance(value, (Polynomial, Variable, int, str)):
+            if modulus < 2 or modulus > _MAX_MODULUS:
+                raise ValueError("modulus must be a prime less than 2**62")
+            if isinstance(value, int):
+                value %= modulus
+            try:
+                self._raw = _RawModPolynomial.of(Polynomial(value)._raw, modulus)
+            except jvm.java_error_class as e:
+                raise ValueError("modulus must be a prime less than 2**62") from e
+        else:
+            raise TypeError(f"invalid value for polynomial: `{value}`")
+
+    @staticmethod
+    def _new(raw: Any, modulus: int) -> ModPolynomial:
+        """Construct a polynomial from a raw object."""
+        obj = ModPolynomial.__new__(ModPolynomial)
+        obj._raw = raw
+        obj._modulus = modulus
+        return obj
+
+    def _reduce(self, other: Union[Polynomial, Variable, int]) -> ModPolynomial:
+        """Reduce the given value modulo the modulus of this polynomial."""
+        if isinstance(other, int):
+            other %= self._modulus
+        return ModPolynomial._new(
+            self._raw.reduce(Polynomial(other)._raw), self._modulus
+        )
+
+    def _check_modulus(self, other: ModPolynomial) -> None:
+        if self._modulus != other._modulus:
+            raise ValueError("different moduli")
+
+    def __getstate__(self) -> Any:
+        """Get the object state."""
+        return (self.lift().__getstate__(), self._modulus)
+
+    def __setstate__(self, state: Any) -> None:
+        """Set the object state."""
+        p = Polynomial.__new__(Polynomial)
+        p.__setstate__(state[0])
+        self._raw = _RawModPolynomial.of(p._raw, state[1])
+        self._modulus = state[1]
+
+    def __str__(self) -> str:
+        """Return the string representation."""
+        return str(self._raw.toString())
+
+    def __repr__(self) -> str:
+        """Return the "official" string representation."""
+        return f"ModPolynomial('{str(self)}', {self._modulus})"
+
+    def __hash__(self) -> int:
+        """Return the hash code."""
+        return self._raw.hashCode()  # type: ignore[no-any-return]
+
+    def __len__(self) -> int:
+        """Return the number of terms in this polynomial."""
+        return self._raw.size()  # type: ignore[no-any-return]
+
+    def __pos__(self) -> ModPolynomial:
+        """Return ``+ self``."""
+        return self
+
+    def __neg__(self) -> ModPolynomial:
+        """Return ``- self``."""
+        return ModPolynomial._new(self._raw.negate(), self._modulus)
+
+    def __add__(
+        self, other: Union[ModPolynomial, Polynomial, Variable, int]
+    ) -> ModPolynomial:
+        """Return ``self + other``."""
+        if isinstance(other, ModPolynomial):
+            self._check_modulus(other)
+            return ModPolynomial._new(self._raw.add(other._raw), self._modulus)
+        elif isinstance(other, (Polynomial, Variable, int)):
+            return self + self._reduce(other)
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __radd__(self, other: Union[Polynomial, Variable, int]) -> ModPolynomial:
+        """Return ``other + self``."""
+        if isinstance(other, (Polynomial, Variable, int)):
+            return self._reduce(other) + self
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __sub__(
+        self, other: Union[ModPolynomial, Polynomial, Variable, int]
+    ) -> ModPolynomial:
+        """Return ``self - other``."""
+        if isinstance(other, ModPolynomial):
+            self._check_modulus(other)
+            return ModPolynomial._new(self._raw.subtract(other._raw), self._modulus)
+        elif isinstance(other, (Polynomial, Variable, int)):
+            return self - self._reduce(other)
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __rsub__(self, other: Union[Polynomial, Variable, int]) -> ModPolynomial:
+        """Return ``other - self``."""
+        if isinstance(other, (Polynomial, Variable, int)):
+            return self._reduce(other) - self
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __mul__(
+        self, other: Union[ModPolynomial, Polynomial, Variable, int]
+    ) -> ModPolynomial:
+        """Return ``self * other``."""
+        if isinstance(other, ModPolynomial):
+            self._check_modulus(other)
+            return ModPolynomial._new(self._raw.multiply(other._raw), self._modulus)
+        elif isinstance(other, (Polynomial, Variable, int)):
+            return self * self._reduce(other)
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __rmul__(self, other: Union[Polynomial, Variable, int]) -> ModPolynomial:
+        """Return ``other * self``."""
+        if isinstance(other, (Polynomial, Variable, int)):
+            return self._reduce(other) * self
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __pow__(self, other: int) -> ModPolynomial:
+        """Return ``self ** other``."""
+        if isinstance(other, int):
+            if other <= -1:
+                raise ValueError("negative power given for polynomial")
+            return ModPolynomial._new(self._raw.pow(other), self._modulus)
+        return NotImplemented  # type: ignore[unreachable]
+
+    def __eq__(self, other: object) -> bool:
+        """Return ``self == other``."""
+        if isinstance(other, ModPolynomial):
+            return self._raw.equals(other._raw)  # type: ignore[no-any-return]
+        elif isinstance(other, (Polynomial, Variable, int)):
+            return self == self._reduce(other)
+        return NotImplemented
+
+    @property
+    def modulus(self) -> int:
+        """Return the modulus."""
+        return self._modulus
+
+    @property
+    def is_zero(self) -> bool:
+        """Return `True` if the polynomial is zero."""
+        return self._raw.isZero()  # type: ignore[no-any-return]
+
+    @property
+    def is_one(self) -> bool:
+        """Return `True` if the polynomial is one."""
+        return self._raw.isOne()  # type: ignore[no-any-return]
+
+    @property
+    def is_integer(self) -> bool:
+        """Return `True` if the polynomial is an integer."""
+        return self._raw.isConstant()  # type: ignore[no-any-return]
+
+    @property
+    def as_integer(self) -> int:
+        """Cast the polynomial to an integer in ``[0, modulus)``."""
+        if self.is_integer:
+            return self._raw.constantTerm()  # type: ignore[no-any-return]
+        raise ValueError("not an integer")
+
+    @property
+    def variables(self) -> FrozenSet[Variable]:
+        """Return the set of variables."""
+        return VariableSet._frozenset_from_raw(self._raw.getVariables())
+
+    @property
+    def min_variables(self) -> FrozenSet[Variable]:
+        """Return the set of actually used variables in this polynomial."""
+        return VariableSet._frozenset_from_raw(self._raw.getMinimalVariables())
+
+    @property
+    def factors(self) -> Sequence[ModPolynomial]:
+        """Return the factorization of this polynomial."""
+        return tuple(
+            ModPolynomial._new(x, self._modulus)
+            for x in jvm.get_array_items(self._raw.factors())
+        )
+
+    def degree(self) -> int:
+        """Return the total degree."""
+        return self._raw.degree()  # type: ignore[no-any-return]
+
+    def lift(self, symmetric: bool = False) -> Polynomial:
+        """Lift this polynomial to a polynomial over the integers.
+
+        The coefficients are taken in ``[0, modulus)``, or in
+        ``(-modulus/2, modulus/2]`` if `symmetric` is `True`.
+        """
+        return Polynomial._new(self._raw.lift(symmetric))
+
+    def divide_exact(
+        self, other: Union[ModPolynomial, Polynomial, Variable, int]
+    ) -> ModPolynomial:
+        """Return ```self / other``` if divisible."""
+        if isinstance(other, (Polynomial, Variable, int)):
+            return self.divide_exact(self._reduce(other))
+        if not isinstance(other, ModPolynomial):
+            raise TypeError("other must be a ModPolynomial")
+        self._check_modulus(other)
+        try:
+            return ModPolynomial._new(self._raw.divideExact(other._raw), self._modulus)
+        except jvm.java_error_class as e:
+            error = jvm.get_error_message(e)
+            if error == "divide by zero":
+                raise ZeroDivisionError("division by zero") from e
+            elif error == "not divisible":
+                raise ValueError("not divisible") from e
+            raise e  # pragma: no cover
+
+    def gcd(
+        self, other: Union[ModPolynomial, Polynomial, Variable, int]
+    ) -> ModPolynomial:
+        """Return the monic ``GCD(self, other)``."""
+        if isinstance(other, (Polynomial, Variable, int)):
+            return self.gcd(self._reduce(other))
+        if not isinstance(other, ModPolynomial):
+            raise TypeError("other must be a ModPolynomial")
+        self._check_modulus(other)
+        return ModPolynomial._new(self._raw.gcd(other._raw), self._modulus)
+
+    def subs(
+        self,
+        lhs: Union[Variable, str],
+        rhs: Union[ModPolynomial, Polynomial, Variable, int, str],
+    ) -> ModPolynomial:
+        """Return the result of substituting `rhs` for the variable `lhs`."""
+        if isinstance(lhs, str):
+            lhs = Variable(lhs)
+        if not isinstance(lhs, Variable):
+            raise TypeError("lhs is not a Variable")
+        if isinstance(rhs, str):
+            rhs = Polynomial(rhs)
+        if isinstance(rhs, (Polynomial, Variable, int)):
+            rhs = self._reduce(rhs)
+        if not isinstance(rhs, ModPolynomial):
+            raise TypeError("rhs is not a ModPolynomial")
+        self._check_modulus(rhs)
+        return ModPolynomial._new(
+            self._raw.substitute(lhs._raw, rhs._raw), self._modulus
+        )
+
+    @overload
+    def evaluate(self, variable: Union[Variable, str], value: int) -> ModPolynomial:
+        """Return the result of setting the given variable to the specified value."""
+        ...
+
+    @overload
+    def evaluate(
+        self, variables: Sequence[Union[Variable, str]], values: Sequence[int]
+    ) -> ModPolynomial:
+        """Return the result of setting the given variables to the specified values."""
+        ...
+
+    def evaluate(  # type: ignore[misc,no-untyped-def]
+        self, variables, values
+    ) -> ModPolynomial:
+        """Return the result of setting the given variables to the specified values."""
+        if isinstance(variables, Sequence) and not isinstance(variables, str):
+            if not _is_int_array_like(values):
+                raise TypeError("values must be a sequence")
+            if len(variables) != len(values):
+                raise ValueError("variables and values have different sizes")
+            raw_variables = _create_raw_var_array(tuple(variables))
+            _, data, big = _pack_integers(values)
+            return ModPolynomial._new(
+                self._raw.evaluate(raw_variables, data, big), self._modulus
+            )
+
+        if isinstance(variables, (Variable, str)):
+            if not isinstance(values, int):
+                raise TypeError("value must be an integer")
+            return self.evaluate((variables,), (values,))
+
+        raise TypeError("invalid variables")
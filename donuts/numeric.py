@@ -0,0 +1,182 @@
+"""Compilation of polynomials and rational functions for numerical evaluation."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+from .poly import Polynomial, PolynomialLike
+from .rat import RationalFunction
+from .var import Variable, VariableLike
+
+_Term = Tuple[Tuple[int, ...], float]
+
+_BACKENDS = ("numpy",)
+
+
+def compile_many(
+    expressions: Sequence[Union[RationalFunction, PolynomialLike, str]],
+    variables: Sequence[VariableLike],
+    backend: str = "numpy",
+) -> Callable[..., Tuple[Any, ...]]:
+    """Compile polynomials and rational functions into one numerical function.
+
+    The returned function takes arrays of floating-point or complex numbers
+    corresponding to the given variables, and returns a tuple of the values of the
+    expressions, broadcast over the arrays. The expressions are evaluated by the
+    Horner scheme, and powers of the variables are computed only once for all the
+    expressions. Currently, the only supported backend is ``"numpy"``.
+    """
+    return _compile(expressions, variables, backend, False)
+
+
+def _compile(
+    expressions: Sequence[Union[RationalFunction, PolynomialLike, str]],
+    variables: Sequence[VariableLike],
+    backend: str,
+    single: bool,
+) -> Callable[..., Any]:
+    """Compile the expressions, returning one value if `single` is `True`."""
+    if backend not in _BACKENDS:
+        raise ValueError(f"unknown backend: `{backend}`")
+
+    import numpy as np
+
+    xs = tuple(Variable(x) if isinstance(x, str) else x for x in variables)
+    if not all(isinstance(x, Variable) for x in xs):
+        raise TypeError("variables must be Variables")
+    if len(set(xs)) != len(xs):
+        raise ValueError("duplicate variables")
+
+    generator = _CodeGenerator(len(xs))
+    results = []
+    for a in expressions:
+        if isinstance(a, RationalFunction):
+            if not a.min_variables <= set(xs):
+                raise ValueError("rational function depends on other variables")
+            num = generator.horner(_terms_of(a.numerator, xs), 0)
+            if a.denominator.is_one:
+                results.append(num)
+            else:
+                den = generator.horner(_terms_of(a.denominator, xs), 0)
+                results.append(generator.temp(f"{num} / {den}"))
+        else:
+            p = Polynomial(a)
+            if not p.min_variables <= set(xs):
+                raise ValueError("polynomial depends on other variables")
+            results.append(generator.horner(_terms_of(p, xs), 0))
+
+    namespace: Dict[str, Any] = {"_np": np}
+    exec(generator.source(results, single), namespace)  # noqa: S102
+    return namespace["_compiled"]  # type: ignore[no-any-return]
+
+
+def _terms_of(p: Polynomial, variables: Tuple[Variable, ...]) -> List[_Term]:
+    """Return the terms of the given polynomial with floating-point coefficients."""
+    if p.is_zero:
+        return []
+    exponents, coefficients = p.to_arrays(variables)
+    return [
+        (tuple(e), float(c)) for e, c in zip(exponents.tolist(), coefficients.tolist())
+    ]
+
+
+class _CodeGenerator:
+    """Generator of straight-line code evaluating polynomials."""
+
+    def __init__(self, nvars: int) -> None:
+        self._nvars = nvars
+        self._lines: List[str] = []
+        self._powers: Dict[Tuple[int, int], str] = {}
+        self._temps: Dict[str, str] = {}
+        self._ntemps = 0
+
+    def temp(self, expr: str) -> str:
+        """Return a temporary variable assigned the given expression."""
+        if expr.startswith("_x") and " " not in expr:
+            # Already a variable.
+            return expr
+        name = self._temps.get(expr)
+        if name is None:
+            # Common subexpressions are computed only once.
+            name = f"_t{self._ntemps}"
+            self._ntemps += 1
+            self._lines.append(f"    {name} = {expr}")
+            self._temps[expr] = name
+        return name
+
+    def power(self, v: int, k: int) -> str:
+        """Return the variable holding the `k`-th power of the `v`-th variable."""
+        if k == 1:
+            return f"_x{v}"
+        name = self._powers.get((v, k))
+        if name is None:
+            h = k // 2
+            expr = f"{self.power(v, h)} * {self.power(v, k - h)}"
+            name = f"_x{v}_{k}"
+            self._lines.append(f"    {name} = {expr}")
+            self._powers[(v, k)] = name
+        return name
+
+    def horner(self, terms: List[_Term], v: int) -> str:
+        """Generate the Horner scheme in the `v`-th and later variables.
+
+        Return the expression of the result.
+        """
+        if not terms:
+            return "0.0"
+        if v == self._nvars:
+            # Only the constant term remains.
+            return repr(terms[0][1])
+
+        groups: Dict[int, List[_Term]] = {}
+        for t in terms:
+            groups.setdefault(t[0][v], []).append(t)
+
+        acc = ""
+        prev = 0
+        for d in sorted(groups, reverse=True):
+            sub = self.horner(groups[d], v + 1)
+            if acc:
+                acc = self.temp(f"{_mul(acc, self.power(v, prev - d))} + {sub}")
+            else:
+                acc = sub
+            prev = d
+        if prev > 0:
+            acc = self.temp(_mul(acc, self.power(v, prev)))
+        return acc
+
+    def source(self, results: List[str], single: bool) -> str:
+        """Return the source code of the function returning the given results."""
+        args = ", ".join(f"_x{v}" for v in range(self._nvars))
+        lines = [f"def _compiled({args}):"]
+        lines.extend(f"    _x{v} = _np.asarray(_x{v})" for v in range(self._nvars))
+        if not all(r.startswith("_") for r in results):
+            # Constants must be broadcast as well.
+            lines.append("    _shape = ()")
+            for i in range(0, self._nvars, 31):
+                # NumPy broadcasts at most 32 arrays at once.
+                chunk = "".join(f", _x{v}" for v in range(i, min(i + 31, self._nvars)))
+                lines.append(
+                    f"    _shape = _np.broadcast(_np.empty(_shape){chunk}).shape"
+                )
+            results = [
+                r if r.startswith("_") else f"_np.full(_shape, {r})" for r in results
+            ]
+        lines.extend(self._lines)
+        # Never return the arguments themselves.
+        inputs = {f"_x{v}" for v in range(self._nvars)}
+        results = [f"{r}.copy()" if r in inputs else r for r in results]
+        if single:
+            lines.append(f"    return {results[0]}")
+        else:
+            lines.append(f"    return ({''.join(r + ', ' for r in results)})")
+        return "\n".join(lines) + "\n"
+
+
+def _mul(a: str, b: str) -> str:
+    """Return the product of the given expressions, omitting unit factors."""
+    if a == "1.0":
+        return b
+    if a == "-1.0":
+        return f"-{b}"
+    return f"{a} * {b}"
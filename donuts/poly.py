@@ -3,61 +3,89 @@
 from __future__ import annotations
 
 import functools
+import os
 from fractions import Fraction
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Iterable,
     Iterator,
+    List,
     Optional,
     Sequence,
+    Tuple,
     Union,
     overload,
 )
 
-from .array import _create_raw_int_array, _create_raw_poly_array, _create_raw_var_array
+from .array import (
+    _create_raw_int_array,
+    _create_raw_int_values,
+    _create_raw_poly_array,
+    _create_raw_str_array,
+    _create_raw_var_array,
+    _int_from_bytes,
+    _int_to_bytes,
+    _is_int32,
+    _is_int_array_like,
+    _pack_exponent_matrix,
+    _pack_integer_matrix,
+    _pack_integers,
+    _unpack_integer_array,
+    _unpack_term_arrays,
+    _unpack_terms,
+)
+from .cache import _disk_cache, _lru_cache, _ParseCache, _RawResultCache
+from .intern import _interner
 from .jvm import jvm
+from .textio import TextFile, _read_text, _write_text
 from .var import Variable, VariableLike
 from .varset import VariableSet, VariableSetLike
 
 if TYPE_CHECKING:
+    from .modpoly import ModPolynomial
     from .rat import RationalFunction
 
 _RawPolynomial = jvm.find_class("com.github.tueda.donuts.Polynomial")
 _RawPythonUtils = jvm.find_class("com.github.tueda.donuts.python.PythonUtils")
-_JavaError = jvm.java_error_class
-
-_RAW_ZERO = _RawPolynomial()
-_RAW_ONE = _RawPolynomial(1)
-_RAW_MINUS_ONE = _RawPolynomial(-1)
+_RawBinaryFormat = jvm.find_class("com.github.tueda.donuts.python.BinaryFormat")
+_RawPolynomialArrays = jvm.find_class("com.github.tueda.donuts.python.PolynomialArrays")
 
 
 def _raw_polynomial_from_short_int(value: int) -> Any:
-    if value == 0:
-        return _RAW_ZERO
-    if value == 1:
-        return _RAW_ONE
-    if value == -1:
-        return _RAW_MINUS_ONE
+    if -1 <= value <= 1:
+        return _raw_polynomial_from_unit_int(value)
     return _raw_polynomial_from_short_int_impl(value)
 
 
-@functools.lru_cache(maxsize=1024)
+@functools.lru_cache(maxsize=None)
+def _raw_polynomial_from_unit_int(value: int) -> Any:
+    # Zero, one and minus one, which are created lazily and never evicted.
+    if value == 0:
+        return _RawPolynomial()
+    return _RawPolynomial(value)
+
+
+@_lru_cache("polynomial_int", maxsize=1024)
 def _raw_polynomial_from_short_int_impl(value: int) -> Any:
     return _RawPolynomial(value)
 
 
-@functools.lru_cache(maxsize=1024)
+@_lru_cache("polynomial_variable", maxsize=1024)
 def _raw_polynomial_from_str(value: str) -> Any:
     return _RawPolynomial(value)
 
 
+_polynomial_parse_cache = _ParseCache(_RawPolynomial, lambda raw: raw.size())
+
+
 class Polynomial:
     """Polynomial."""
 
-    __slots__ = ("_raw", "_cache_factors")
+    __slots__ = ("_raw", "_cache_factors", "__weakref__")
 
     def __init__(
         self, value: Union[Polynomial, Variable, int, str, None] = None
@@ -66,16 +94,16 @@ class Polynomial:
         self._cache_factors: Optional[Sequence[Polynomial]] = None
 
         if value is None:
-            self._raw = _RAW_ZERO
+            self._raw = _raw_polynomial_from_unit_int(0)
         elif isinstance(value, int):
             if Polynomial._is_short_int(value):
                 self._raw = _raw_polynomial_from_short_int(value)
             else:
-                self._raw = _RawPolynomial(str(value))
+                self._raw = _RawPythonUtils.polynomialOf(_int_to_bytes(value))
         elif isinstance(value, str):
             try:
-                self._raw = _RawPolynomial(value)
-            except _JavaError as e:
+                self._raw = _polynomial_parse_cache.parse(value)
+            except jvm.java_error_class as e:
                 raise ValueError("invalid string for polynomial") from e
         elif isinstance(value, Variable):
             self._raw = _raw_polynomial_from_str(value._name)
@@ -88,11 +116,79 @@ class Polynomial:
     @staticmethod
     def _new(raw: Any) -> Polynomial:
         """Construct a polynomial from a raw object."""
+        if _interner.enabled:
+            return _interner.intern(raw, Polynomial._new_impl)
+        return Polynomial._new_impl(raw)
+
+    @staticmethod
+    def _new_impl(raw: Any) -> Polynomial:
+        """Construct a polynomial from a raw object without interning."""
         obj = Polynomial()
         obj._raw = raw
         obj._cache_factors = None
         return obj
 
+    @staticmethod
+    def from_arrays(
+        variables: Sequence[VariableLike], exponents: Any, coefficients: Any
+    ) -> Polynomial:
+        """Construct a polynomial from arrays of exponents and coefficients.
+
+        The exponents are given as an ``(nterms, nvars)`` matrix of integers, e.g.,
+        a NumPy array, whose columns correspond to the given variables.
+        The coefficients are given as ``nterms`` integers, either a NumPy integer array
+        or Python integers of any size. Terms with the same exponents are summed up.
+        """
+        variables = tuple(variables)
+        nterms, raw_exponents = _pack_exponent_matrix(exponents, len(variables))
+        ncoeffs, raw_coefficients, big = _pack_integers(coefficients)
+        if nterms != ncoeffs:
+            raise ValueError("exponents and coefficients differ in the number of terms")
+        try:
+            raw = _RawPolynomialArrays.fromArrays(
+                _create_raw_var_array(variables),
+                nterms,
+                raw_exponents,
+                raw_coefficients,
+                big,
+            )
+        except jvm.java_error_class as e:
+            raise ValueError("invalid arrays for polynomial") from e
+        return Polynomial._new(raw)
+
+    @staticmethod
+    def parse_many(
+        strings: Union[str, Iterable[str]],
+        errors: str = "strict",
+        parallel: bool = False,
+    ) -> List[Optional[Polynomial]]:
+        """Parse many strings as polynomials in one call.
+
+        The strings are given as an iterable or as a single string with one
+        expression per line. Invalid strings raise :class:`ValueError` unless
+        ``errors="ignore"``, which gives ``None`` for them instead. With
+        ``parallel=True``, the strings are parsed on multiple threads.
+        """
+        return [
+            None if raw is None else Polynomial._new(raw)
+            for raw in _parse_many(
+                strings,
+                errors,
+                parallel,
+                _RawPythonUtils.parsePolynomials,
+                _RawPythonUtils.parsePolynomialLines,
+                "polynomial",
+            )
+        ]
+
+    @staticmethod
+    def read(path: Union[str, os.PathLike[str]]) -> Polynomial:
+        """Read a polynomial from a text file, e.g., written by :meth:`write`.
+
+        The text is parsed in chunks, without reading the whole file into a string.
+        """
+        return Polynomial._new(_read_text(path, False))
+
     @staticmethod
     def _is_short_int(n: int) -> bool:
         """Return `True` if the given integer is *short* enough (64 bits)."""
@@ -100,11 +196,15 @@ class Polynomial:
 
     def __getstate__(self) -> Any:
         """Get the object state."""
-        return str(self._raw.toString())
+        return jvm.to_bytes(_RawBinaryFormat.encodePolynomial(self._raw))
 
     def __setstate__(self, state: Any) -> None:
         """Set the object state."""
-        self._raw = _RawPolynomial(state)
+        if isinstance(state, str):
+            # Older versions pickled the string representation.
+            self._raw = _RawPolynomial(state)
+        else:
+            self._raw = _RawBinaryFormat.decodePolynomial(state)
         self._cache_factors = None
 
     def __str__(self) -> str:
@@ -129,9 +229,8 @@ class Polynomial:
 
     def __iter__(self) -> Iterator[Polynomial]:
         """Return an iterator to iterate terms in this polynomial."""
-        raw_it = self._raw.iterator()
-        while raw_it.hasNext():
-            yield Polynomial._new(raw_it.next())  # noqa: B305
+        for raw in jvm.get_array_items(_RawPythonUtils.getTerms(self._raw)):
+            yield Polynomial._new(raw)
 
     def __pos__(self) -> Polynomial:
         """Return ``+ self``."""
@@ -263,7 +362,8 @@ class Polynomial:
             if self._raw.isLongValue():
                 return self._raw.asLongValue()  # type: ignore[no-any-return]
             else:
-                return int(str(self))
+                data = _RawPythonUtils.getIntegerBytes(self._raw)
+                return _int_from_bytes(jvm.to_bytes(data))
         raise ValueError("not an integer")
 
     @property
@@ -292,7 +392,11 @@ class Polynomial:
     def factors(self) -> Sequence[Polynomial]:
         """Return the factorization of this polynomial."""
         if self._cache_factors is None:
-            self._cache_factors = tuple(Polynomial._new(x) for x in self._raw.factors())
+            if _disk_cache.enabled:
+                raw_factors = _disk_cache.apply("factors", (self._raw,))
+            else:
+                raw_factors = _RawResultCache.factors(self._raw)
+            self._cache_factors = tuple(Polynomial._new(x) for x in raw_factors)
         return self._cache_factors
 
     @overload
@@ -351,18 +455,19 @@ class Polynomial:
         self, variables, exponents
     ) -> Polynomial:
         """Return the coefficient specified by `variables` and `exponents`."""
-        # TODO: integer overflow occurs >= 2^31.
-
         if isinstance(variables, Sequence) and not isinstance(variables, str):
-            if not (isinstance(exponents, Sequence) and not isinstance(exponents, str)):
+            if not _is_int_array_like(exponents):
                 raise TypeError("exponents must be a sequence")
             if len(variables) != len(exponents):
                 raise ValueError("variables and exponents have different sizes")
+            raw_variables = _create_raw_var_array(tuple(variables))
+            try:
+                raw_exponents = _create_raw_int_array(exponents)
+            except OverflowError:
+                # No terms have such exponents.
+                return Polynomial()
             return Polynomial._new(
-                self._raw.coefficientOf(
-                    _create_raw_var_array(tuple(variables)),
-                    _create_raw_int_array(tuple(exponents)),
-                )
+                self._raw.coefficientOf(raw_variables, raw_exponents)
             )
 
         x = variables
@@ -372,6 +477,9 @@ class Polynomial:
         if isinstance(x, Variable):
             if not isinstance(n, int):
                 raise TypeError("exponent must be an integer")
+            if not _is_int32(n):
+                # No terms have such an exponent.
+                return Polynomial()
             return Polynomial._new(self._raw.coefficientOf(x._raw, n))
 
         raise TypeError("invalid variables")
@@ -395,15 +503,73 @@ class Polynomial:
     ) -> Dict[Sequence[int], Polynomial]:
         """Cast this polynomial to a map from exponents to coefficients."""
         array = _create_raw_var_array(variables)
-        it = _RawPythonUtils.getCoefficientMap(self._raw, array).entrySet().iterator()
+        raw_map = _RawPythonUtils.getCoefficientMap(self._raw, array)
+        raw_exponents, raw_coefficients = jvm.call_many(
+            (
+                (_RawPythonUtils.getExponents, (raw_map,)),
+                (_RawPythonUtils.getCoefficients, (raw_map,)),
+            )
+        )
+        exponents = jvm.get_array_items(raw_exponents)
+        coefficients = jvm.get_array_items(raw_coefficients)
         result: Dict[Sequence[int], Polynomial] = {}
-        while it.hasNext():
-            entry = it.next()  # noqa: B305
-            exponents = tuple(entry.getKey())
-            coefficient = Polynomial._new(entry.getValue())
-            result[exponents] = coefficient
+        if coefficients:
+            n = len(exponents) // len(coefficients)
+            for i, raw in enumerate(coefficients):
+                result[tuple(exponents[i * n : (i + 1) * n])] = Polynomial._new(raw)
         return result
 
+    def to_arrays(
+        self, variables: Optional[Sequence[VariableLike]] = None
+    ) -> Tuple[Any, Any]:
+        """Return the arrays of exponents and coefficients of this polynomial.
+
+        The exponents are returned as an ``(nterms, nvars)`` NumPy array of 32-bit
+        integers, whose columns correspond to the given variables (by default, the
+        variables of this polynomial in sorted order). The coefficients are returned as
+        a NumPy array of 64-bit integers, or of Python integers if some of them do not
+        fit. This is the inverse of :meth:`from_arrays`.
+        """
+        raw_variables = None
+        if variables is not None:
+            raw_variables = _create_raw_var_array(tuple(variables))
+        try:
+            data = _RawPolynomialArrays.toArrays(self._raw, raw_variables)
+        except jvm.java_error_class as e:
+            raise ValueError("polynomial depends on other variables") from e
+        return _unpack_term_arrays(jvm.to_bytes(data))
+
+    def iter_terms(
+        self,
+        variables: Optional[Sequence[VariableLike]] = None,
+        chunk_size: int = 4096,
+    ) -> Iterator[Tuple[Tuple[int, ...], int]]:
+        """Return an iterator to iterate terms as pairs of exponents and coefficients.
+
+        The exponents are given as a tuple whose elements correspond to the given
+        variables (by default, the variables of this polynomial in sorted order). Terms
+        are fetched in chunks of at most `chunk_size` terms, which keeps the memory
+        usage bounded for huge polynomials.
+        """
+        if chunk_size <= 0 or not _is_int32(chunk_size):
+            raise ValueError("invalid chunk_size")
+        raw_variables = None
+        if variables is not None:
+            raw_variables = _create_raw_var_array(tuple(variables))
+        try:
+            raw_chunks = _RawPolynomialArrays.toChunks(self._raw, raw_variables)
+        except jvm.java_error_class as e:
+            raise ValueError("polynomial depends on other variables") from e
+        return _iter_term_chunks(raw_chunks, chunk_size)
+
+    def write(self, file: TextFile) -> None:
+        """Write this polynomial to a text file, given by a path or a file object.
+
+        The text is the same as ``str(self)`` but written in chunks, without building
+        the whole string.
+        """
+        _write_text(self._raw, file, False)
+
     @overload
     def translate(self, *variables: VariableLike) -> Polynomial:
         """Translate the polynomial in terms of the given set of variables."""
@@ -431,10 +597,16 @@ class Polynomial:
     def _translate_impl(self, raw_varset: Any) -> Polynomial:
         try:
             raw = self._raw.translate(raw_varset)
-        except _JavaError as e:
+        except jvm.java_error_class as e:
             raise ValueError("invalid set of variables") from e
         return Polynomial._new(raw)
 
+    def mod(self, modulus: int) -> ModPolynomial:
+        """Return this polynomial reduced modulo the given prime."""
+        from .modpoly import ModPolynomial
+
+        return ModPolynomial(self, modulus)
+
     def divide_exact(self, other: Union[Polynomial, Variable, int]) -> Polynomial:
         """Return ```self / other``` if divisible."""
         if isinstance(other, (Variable, int)):
@@ -442,8 +614,12 @@ class Polynomial:
         if not isinstance(other, Polynomial):
             raise TypeError("other must be a Polynomial")
         try:
-            return Polynomial._new(self._raw.divideExact(other._raw))
-        except _JavaError as e:
+            if _disk_cache.enabled:
+                raw = _disk_cache.apply("divideExact", (self._raw, other._raw))[0]
+            else:
+                raw = _RawResultCache.divideExact(self._raw, other._raw)
+            return Polynomial._new(raw)
+        except jvm.java_error_class as e:
             error = jvm.get_error_message(e)
             if error == "divide by zero":
                 raise ZeroDivisionError("division by zero") from e
@@ -457,7 +633,9 @@ class Polynomial:
             return self.gcd(Polynomial(other))
         if not isinstance(other, Polynomial):
             raise TypeError("other must be a Polynomial")
-        return Polynomial._new(self._raw.gcd(other._raw))
+        if _disk_cache.enabled:
+            return Polynomial._new(_disk_cache.apply("gcd", (self._raw, other._raw))[0])
+        return Polynomial._new(_RawResultCache.gcd(self._raw, other._raw))
 
     def lcm(self, other: Union[Polynomial, Variable, int]) -> Polynomial:
         """Return ``LCM(self, other)``."""
@@ -465,7 +643,9 @@ class Polynomial:
             return self.lcm(Polynomial(other))
         if not isinstance(other, Polynomial):
             raise TypeError("other must be a Polynomial")
-        return Polynomial._new(self._raw.lcm(other._raw))
+        if _disk_cache.enabled:
+            return Polynomial._new(_disk_cache.apply("lcm", (self._raw, other._raw))[0])
+        return Polynomial._new(_RawResultCache.lcm(self._raw, other._raw))
 
     def subs(
         self,
@@ -477,7 +657,7 @@ class Polynomial:
             if isinstance(rhs, Polynomial):
                 try:
                     return Polynomial._new(self._raw.substitute(lhs._raw, rhs._raw))
-                except _JavaError as e:
+                except jvm.java_error_class as e:
                     raise ValueError("invalid lhs for substitution") from e
             elif isinstance(rhs, (Variable, int, str)):
                 return self.subs(lhs, Polynomial(rhs))
@@ -504,25 +684,27 @@ class Polynomial:
         self, variables, values
     ) -> Polynomial:
         """Return the result of setting the given variables to the specified values."""
-        # TODO: integer overflow occurs >= 2^31.
-
         if isinstance(variables, Sequence) and not isinstance(variables, str):
-            if not (isinstance(values, Sequence) and not isinstance(values, str)):
+            if not _is_int_array_like(values):
                 raise TypeError("values must be a sequence")
             if len(variables) != len(values):
                 raise ValueError("variables and values have different sizes")
-            return Polynomial._new(
-                self._raw.evaluate(
-                    _create_raw_var_array(tuple(variables)),
-                    _create_raw_int_array(tuple(values)),
+            raw_variables = _create_raw_var_array(tuple(variables))
+            raw_values = _create_raw_int_values(values)
+            if isinstance(raw_values, tuple):
+                # Beyond 32 bits.
+                return Polynomial._new(
+                    _RawPythonUtils.evaluate(self._raw, raw_variables, *raw_values)
                 )
-            )
+            return Polynomial._new(self._raw.evaluate(raw_variables, raw_values))
 
         if isinstance(variables, Variable):
             x = variables
             if not isinstance(values, int):
                 raise TypeError("value must be an integer")
             n = values
+            if not _is_int32(n):
+                return self.evaluate((x,), (n,))
             return Polynomial._new(self._raw.evaluate(x._raw, n))
 
         if isinstance(variables, str):
@@ -530,6 +712,50 @@ class Polynomial:
 
         raise TypeError("invalid variables")
 
+    def evaluate_many(
+        self, variables: Sequence[VariableLike], points: Any, parallel: bool = False
+    ) -> Any:
+        """Return the values of this polynomial at many points.
+
+        The points are given as an ``(npoints, nvars)`` matrix of integers, e.g.,
+        a NumPy array, whose columns correspond to the given variables. The polynomial
+        must not depend on other variables. The values are returned as a NumPy array of
+        64-bit integers, or of Python integers if some of them do not fit. If
+        ``parallel=True``, the points are evaluated on multiple threads.
+        """
+        variables = tuple(variables)
+        npoints, data, big = _pack_integer_matrix(points, len(variables))
+        try:
+            result = _RawPolynomialArrays.evaluateMany(
+                self._raw,
+                _create_raw_var_array(variables),
+                npoints,
+                data,
+                big,
+                parallel,
+            )
+        except jvm.java_error_class as e:
+            if jvm.get_error_message(e) == "duplicate variables":
+                raise ValueError("duplicate variables") from e
+            raise ValueError("polynomial depends on other variables") from e
+        result = jvm.to_bytes(result)
+        n = int.from_bytes(result[0:4], "little")
+        big = bool(int.from_bytes(result[4:8], "little"))
+        return _unpack_integer_array(result, n, big, 8)
+
+    def compile(  # noqa: A003
+        self, variables: Sequence[VariableLike], backend: str = "numpy"
+    ) -> Callable[..., Any]:
+        """Compile this polynomial into a numerical function.
+
+        The returned function takes arrays of floating-point or complex numbers
+        corresponding to the given variables, and returns the values broadcast over
+        the arrays. See :func:`donuts.compile_many` for compiling many expressions.
+        """
+        from .numeric import _compile
+
+        return _compile((self,), variables, backend, True)
+
     @overload
     def evaluate_at_zero(self, *variables: VariableLike) -> Polynomial:
         """Return the result of setting all the given variables to zero."""
@@ -612,25 +838,27 @@ class Polynomial:
         self, variables, values
     ) -> Polynomial:
         """Return the result of the given variable shifts."""
-        # TODO: integer overflow occurs >= 2^31.
-
         if isinstance(variables, Sequence) and not isinstance(variables, str):
-            if not (isinstance(values, Sequence) and not isinstance(values, str)):
+            if not _is_int_array_like(values):
                 raise TypeError("values must be a sequence")
             if len(variables) != len(values):
                 raise ValueError("variables and values have different sizes")
-            return Polynomial._new(
-                self._raw.shift(
-                    _create_raw_var_array(tuple(variables)),
-                    _create_raw_int_array(tuple(values)),
+            raw_variables = _create_raw_var_array(tuple(variables))
+            raw_values = _create_raw_int_values(values)
+            if isinstance(raw_values, tuple):
+                # Beyond 32 bits.
+                return Polynomial._new(
+                    _RawPythonUtils.shift(self._raw, raw_variables, *raw_values)
                 )
-            )
+            return Polynomial._new(self._raw.shift(raw_variables, raw_values))
 
         if isinstance(variables, Variable):
             x = variables
             if not isinstance(values, int):
                 raise TypeError("value must be an integer")
             n = values
+            if not _is_int32(n):
+                return self.shift((x,), (n,))
             return Polynomial._new(self._raw.shift(x._raw, n))
 
         if isinstance(variables, str):
@@ -653,6 +881,50 @@ class Polynomial:
         return Polynomial._new(self._raw.derivative(x._raw, n))
 
 
+def _parse_many(
+    strings: Union[str, Iterable[str]],
+    errors: str,
+    parallel: bool,
+    parse_array: Any,
+    parse_lines: Any,
+    kind: str,
+) -> List[Any]:
+    """Parse strings by the given Java methods and return raw objects or `None`."""
+    if errors not in ("strict", "ignore"):
+        raise ValueError(f"invalid errors: `{errors}`")
+
+    if isinstance(strings, str):
+        raw_results = parse_lines(strings, parallel)
+    else:
+        strings = tuple(strings)
+        for s in strings:
+            if not isinstance(s, str):
+                raise TypeError(f"not str: `{s}`")
+        if any("\n" in s or "\r" in s for s in strings):
+            raw_results = parse_array(_create_raw_str_array(strings), parallel)
+        else:
+            # Sending one string is much faster than an array of many strings.
+            raw_results = parse_lines("".join(s + "\n" for s in strings), parallel)
+
+    results: List[Any] = jvm.get_array_items(raw_results)
+    if errors == "strict":
+        for i, raw in enumerate(results):
+            if raw is None:
+                raise ValueError(f"invalid string for {kind} at index {i}")
+    return results
+
+
+def _iter_term_chunks(
+    raw_chunks: Any, chunk_size: int
+) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """Yield terms from chunks given by ``PolynomialArrays.toChunks``."""
+    while True:
+        terms = _unpack_terms(jvm.to_bytes(raw_chunks.next(chunk_size)))
+        yield from terms
+        if len(terms) < chunk_size:
+            break
+
+
 @overload  # noqa: A001
 def sum(*polynomials: Union[Polynomial, Variable, int]) -> Polynomial:  # noqa: A001
     """Return the sum of the given polynomials."""
@@ -706,7 +978,9 @@ def gcd(polynomials: Iterable[Union[Polynomial, Variable, int]]) -> Polynomial:
 def gcd(*polynomials) -> Polynomial:  # type: ignore[misc,no-untyped-def]
     """Return the GCD of the given polynomials."""
     array = _create_raw_poly_array(polynomials)
-    return Polynomial._new(_RawPythonUtils.gcdOf(array))
+    if _disk_cache.enabled:
+        return Polynomial._new(_disk_cache.apply("gcd", jvm.get_array_items(array))[0])
+    return Polynomial._new(_RawResultCache.gcdOf(array))
 
 
 @overload
@@ -726,7 +1000,9 @@ def lcm(*polynomials) -> Polynomial:  # type: ignore[misc,no-untyped-def]
     array = _create_raw_poly_array(polynomials)
     if len(polynomials) == 0:
         raise ValueError("lcm with no arguments")
-    return Polynomial._new(_RawPythonUtils.lcmOf(array))
+    if _disk_cache.enabled:
+        return Polynomial._new(_disk_cache.apply("lcm", jvm.get_array_items(array))[0])
+    return Polynomial._new(_RawResultCache.lcmOf(array))
 
 
 # For static typing.
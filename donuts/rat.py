@@ -3,48 +3,82 @@
 from __future__ import annotations
 
 import functools
+import os
 from fractions import Fraction
-from typing import Any, FrozenSet, Iterable, Sequence, Union, overload
-
-from .array import _create_raw_int_array, _create_raw_var_array
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from .array import (
+    _create_raw_int_values,
+    _create_raw_var_array,
+    _int_from_bytes,
+    _int_to_bytes,
+    _is_int32,
+    _is_int_array_like,
+    _pack_integer_matrix,
+)
+from .cache import _lru_cache, _ParseCache
+from .intern import _interner
 from .jvm import jvm
-from .poly import Polynomial
+from .modpoly import ModPolynomial, _RawModPolynomial
+from .poly import Polynomial, _parse_many
+from .textio import TextFile, _read_text, _write_text
 from .var import Variable, VariableLike
 from .varset import VariableSet, VariableSetLike
 
 _RawRationalFunction = jvm.find_class("com.github.tueda.donuts.RationalFunction")
-_JavaError = jvm.java_error_class
+_RawBinaryFormat = jvm.find_class("com.github.tueda.donuts.python.BinaryFormat")
+_RawPythonUtils = jvm.find_class("com.github.tueda.donuts.python.PythonUtils")
 
 
-_RAW_ZERO = _RawRationalFunction()
-_RAW_ONE = _RawRationalFunction(1)
-_RAW_MINUS_ONE = _RawRationalFunction(-1)
+def _raw_rationalfunction_from_short_int(value: int) -> Any:
+    if -1 <= value <= 1:
+        return _raw_rationalfunction_from_unit_int(value)
+    return _raw_rationalfunction_from_short_int_impl(value)
 
 
-def _raw_rationalfunction_from_short_int(value: int) -> Any:
+@functools.lru_cache(maxsize=None)
+def _raw_rationalfunction_from_unit_int(value: int) -> Any:
+    # Zero, one and minus one, which are created lazily and never evicted.
     if value == 0:
-        return _RAW_ZERO
-    if value == 1:
-        return _RAW_ONE
-    if value == -1:
-        return _RAW_MINUS_ONE
-    return _raw_rationalfunction_from_short_int_impl(value)
+        return _RawRationalFunction()
+    return _RawRationalFunction(value)
 
 
-@functools.lru_cache(maxsize=1024)
+@_lru_cache("rational_function_int", maxsize=1024)
 def _raw_rationalfunction_from_short_int_impl(value: int) -> Any:
     return _RawRationalFunction(value)
 
 
-@functools.lru_cache(maxsize=1024)
+@_lru_cache("rational_function_variable", maxsize=1024)
 def _raw_rationalfunction_from_str(value: str) -> Any:
     return _RawRationalFunction(value)
 
 
+_rationalfunction_parse_cache = _ParseCache(
+    _RawRationalFunction, lambda raw: _RawPythonUtils.countTerms(raw)
+)
+
+
+def _raw_rationalfunction_from_big_ints(numerator: int, denominator: int) -> Any:
+    return _RawPythonUtils.rationalFunctionOf(
+        _int_to_bytes(numerator), _int_to_bytes(denominator)
+    )
+
+
 class RationalFunction:
     """Rational function."""
 
-    __slots__ = ("_raw",)
+    __slots__ = ("_raw", "__weakref__")
 
     def __init__(
         self,
@@ -56,16 +90,16 @@ class RationalFunction:
         """Construct a rational function."""
         if denominator is None:
             if numerator is None:
-                self._raw = _RAW_ZERO
+                self._raw = _raw_rationalfunction_from_unit_int(0)
             elif isinstance(numerator, int):
                 if Polynomial._is_short_int(numerator):
                     self._raw = _raw_rationalfunction_from_short_int(numerator)
                 else:
-                    self._raw = _RawRationalFunction(str(numerator))
+                    self._raw = _raw_rationalfunction_from_big_ints(numerator, 1)
             elif isinstance(numerator, str):
                 try:
-                    self._raw = _RawRationalFunction(numerator)
-                except _JavaError as e:
+                    self._raw = _rationalfunction_parse_cache.parse(numerator)
+                except jvm.java_error_class as e:
                     raise ValueError("invalid string for rational function") from e
             elif isinstance(numerator, Fraction):
                 if Polynomial._is_short_int(
@@ -75,9 +109,8 @@ class RationalFunction:
                         numerator.numerator, numerator.denominator
                     )
                 else:
-                    self._raw = _RawRationalFunction(
-                        Polynomial(numerator.numerator)._raw,
-                        Polynomial(numerator.denominator)._raw,
+                    self._raw = _raw_rationalfunction_from_big_ints(
+                        numerator.numerator, numerator.denominator
                     )
             elif isinstance(numerator, Variable):
                 self._raw = _raw_rationalfunction_from_str(numerator._name)
@@ -92,15 +125,17 @@ class RationalFunction:
                 raise TypeError(
                     f"invalid numerator as denominator is given: `{numerator}`"
                 )
-            if (
-                isinstance(numerator, int)
-                and isinstance(denominator, int)
-                and Polynomial._is_short_int(numerator)
-                and Polynomial._is_short_int(denominator)
-            ):
+            if isinstance(numerator, int) and isinstance(denominator, int):
                 if denominator == 0:
                     raise ZeroDivisionError("division by zero")
-                self._raw = _RawRationalFunction(numerator, denominator)
+                if Polynomial._is_short_int(numerator) and Polynomial._is_short_int(
+                    denominator
+                ):
+                    self._raw = _RawRationalFunction(numerator, denominator)
+                else:
+                    self._raw = _raw_rationalfunction_from_big_ints(
+                        numerator, denominator
+                    )
             else:
                 num = Polynomial(numerator)
                 den = Polynomial(denominator)
@@ -111,17 +146,66 @@ class RationalFunction:
     @staticmethod
     def _new(raw: Any) -> RationalFunction:
         """Construct a rational function from a raw object."""
+        if _interner.enabled:
+            return _interner.intern(raw, RationalFunction._new_impl)
+        return RationalFunction._new_impl(raw)
+
+    @staticmethod
+    def _new_impl(raw: Any) -> RationalFunction:
+        """Construct a rational function from a raw object without interning."""
         obj = RationalFunction()
         obj._raw = raw
         return obj
 
+    @staticmethod
+    def parse_many(
+        strings: Union[str, Iterable[str]],
+        errors: str = "strict",
+        parallel: bool = False,
+    ) -> List[Optional[RationalFunction]]:
+        """Parse many strings as rational functions in one call.
+
+        See :meth:`Polynomial.parse_many` for the arguments.
+        """
+        return [
+            None if raw is None else RationalFunction._new(raw)
+            for raw in _parse_many(
+                strings,
+                errors,
+                parallel,
+                _RawPythonUtils.parseRationalFunctions,
+                _RawPythonUtils.parseRationalFunctionLines,
+                "rational function",
+            )
+        ]
+
+    @staticmethod
+    def read(path: Union[str, os.PathLike[str]]) -> RationalFunction:
+        """Read a rational function from a text file, e.g., written by :meth:`write`.
+
+        The text is parsed in chunks, without reading the whole file into a string.
+        """
+        return RationalFunction._new(_read_text(path, True))
+
     def __getstate__(self) -> Any:
         """Get the object state."""
-        return str(self._raw.toString())
+        return jvm.to_bytes(_RawBinaryFormat.encodeRationalFunction(self._raw))
 
     def __setstate__(self, state: Any) -> None:
         """Set the object state."""
-        self._raw = _RawRationalFunction(state)
+        if isinstance(state, str):
+            # Older versions pickled the string representation.
+            self._raw = _RawRationalFunction(state)
+        else:
+            self._raw = _RawBinaryFormat.decodeRationalFunction(state)
+
+    def write(self, file: TextFile) -> None:
+        """Write this rational function to a text file, given by a path or a file.
+
+        The text is the same as ``str(self)`` but written in chunks, without building
+        the whole string.
+        """
+        _write_text(self._raw, file, True)
 
     def __str__(self) -> str:
         """Return the string representation."""
@@ -297,7 +381,9 @@ class RationalFunction:
     def as_fraction(self) -> Fraction:
         """Cast the rational function to a rational number."""
         if self.is_fraction:
-            return Fraction(self.numerator.as_integer, self.denominator.as_integer)
+            data = jvm.to_bytes(_RawPythonUtils.getFractionBytes(self._raw))
+            n = int.from_bytes(data[:4], "little") + 4
+            return Fraction(_int_from_bytes(data[4:n]), _int_from_bytes(data[n:]))
         raise ValueError("not a rational number")
 
     @property
@@ -353,7 +439,7 @@ class RationalFunction:
     def _translate_impl(self, raw_varset: Any) -> RationalFunction:
         try:
             raw = self._raw.translate(raw_varset)
-        except _JavaError as e:
+        except jvm.java_error_class as e:
             raise ValueError("invalid set of variables") from e
         return RationalFunction._new(raw)
 
@@ -367,7 +453,7 @@ class RationalFunction:
             if isinstance(rhs, RationalFunction):
                 try:
                     r = RationalFunction._new(self._raw.substitute(lhs._raw, rhs._raw))
-                except _JavaError as e:
+                except jvm.java_error_class as e:
                     if jvm.get_error_message(e) == "division by zero":
                         raise ZeroDivisionError("division by zero") from e
                     else:
@@ -399,21 +485,23 @@ class RationalFunction:
         self, variables, values
     ) -> RationalFunction:
         """Return the result of setting the given variables to the specified values."""
-        # TODO: integer overflow occurs >= 2^31.
-
         if isinstance(variables, Sequence) and not isinstance(variables, str):
-            if not (isinstance(values, Sequence) and not isinstance(values, str)):
+            if not _is_int_array_like(values):
                 raise TypeError("values must be a sequence")
             if len(variables) != len(values):
                 raise ValueError("variables and values have different sizes")
+            raw_variables = _create_raw_var_array(tuple(variables))
+            raw_values = _create_raw_int_values(values)
             try:
-                return RationalFunction._new(
-                    self._raw.evaluate(
-                        _create_raw_var_array(tuple(variables)),
-                        _create_raw_int_array(tuple(values)),
+                if isinstance(raw_values, tuple):
+                    # Beyond 32 bits.
+                    return RationalFunction._new(
+                        _RawPythonUtils.evaluate(self._raw, raw_variables, *raw_values)
                     )
+                return RationalFunction._new(
+                    self._raw.evaluate(raw_variables, raw_values)
                 )
-            except _JavaError as e:
+            except jvm.java_error_class as e:
                 if jvm.get_error_message(e) == "division by zero":
                     raise ZeroDivisionError("division by zero") from e
                 raise e  # pragma: no cover
@@ -423,9 +511,11 @@ class RationalFunction:
             if not isinstance(values, int):
                 raise TypeError("value must be an integer")
             n = values
+            if not _is_int32(n):
+                return self.evaluate((x,), (n,))
             try:
                 return RationalFunction._new(self._raw.evaluate(x._raw, n))
-            except _JavaError as e:
+            except jvm.java_error_class as e:
                 if jvm.get_error_message(e) == "division by zero":
                     raise ZeroDivisionError("division by zero") from e
                 raise e  # pragma: no cover
@@ -435,6 +525,60 @@ class RationalFunction:
 
         raise TypeError("invalid variables")
 
+    def evaluate_mod(
+        self,
+        modulus: int,
+        variables: Sequence[VariableLike],
+        points: Any,
+        parallel: bool = False,
+    ) -> Any:
+        """Return the values of this rational function at many points modulo a prime.
+
+        The modulus must be a prime less than ``2**62``. The points are given as an
+        ``(npoints, nvars)`` matrix of integers, e.g., a NumPy array, whose columns
+        correspond to the given variables. The rational function must not depend on
+        other variables. The values are returned as a NumPy masked array of 64-bit
+        unsigned integers in ``[0, modulus)``, where the points at which the
+        denominator vanishes modulo the prime are masked. If ``parallel=True``, the
+        points are evaluated on multiple threads.
+        """
+        import numpy as np
+
+        num = ModPolynomial(self.numerator, modulus)
+        den = ModPolynomial(self.denominator, modulus)
+        variables = tuple(variables)
+        npoints, data, big = _pack_integer_matrix(points, len(variables))
+        try:
+            result = _RawModPolynomial.evaluateRatios(
+                num._raw,
+                den._raw,
+                _create_raw_var_array(variables),
+                npoints,
+                data,
+                big,
+                parallel,
+            )
+        except jvm.java_error_class as e:
+            if jvm.get_error_message(e) == "duplicate variables":
+                raise ValueError("duplicate variables") from e
+            raise ValueError("rational function depends on other variables") from e
+        values = np.frombuffer(jvm.to_bytes(result), dtype="<i8")
+        mask = values < 0
+        return np.ma.MaskedArray(np.where(mask, 0, values).astype(np.uint64), mask)
+
+    def compile(  # noqa: A003
+        self, variables: Sequence[VariableLike], backend: str = "numpy"
+    ) -> Callable[..., Any]:
+        """Compile this rational function into a numerical function.
+
+        The returned function takes arrays of floating-point or complex numbers
+        corresponding to the given variables, and returns the values broadcast over
+        the arrays. See :func:`donuts.compile_many` for compiling many expressions.
+        """
+        from .numeric import _compile
+
+        return _compile((self,), variables, backend, True)
+
     @overload
     def evaluate_at_zero(self, *variables: VariableLike) -> RationalFunction:
         """Return the result of setting all the given variables to zero."""
@@ -454,7 +598,7 @@ class RationalFunction:
             if isinstance(x, (Variable, VariableSet)):
                 try:
                     return RationalFunction._new(self._raw.evaluateAtZero(x._raw))
-                except _JavaError as e:
+                except jvm.java_error_class as e:
                     if jvm.get_error_message(e) == "division by zero":
                         raise ZeroDivisionError("division by zero") from e
                     raise e  # pragma: no cover
@@ -492,7 +636,7 @@ class RationalFunction:
             if isinstance(x, (Variable, VariableSet)):
                 try:
                     return RationalFunction._new(self._raw.evaluateAtOne(x._raw))
-                except _JavaError as e:
+                except jvm.java_error_class as e:
                     if jvm.get_error_message(e) == "division by zero":
                         raise ZeroDivisionError("division by zero") from e
                     raise e  # pragma: no cover
@@ -527,25 +671,27 @@ class RationalFunction:
         self, variables, values
     ) -> RationalFunction:
         """Return the result of the given variable shifts."""
-        # TODO: integer overflow occurs >= 2^31.
-
         if isinstance(variables, Sequence) and not isinstance(variables, str):
-            if not (isinstance(values, Sequence) and not isinstance(values, str)):
+            if not _is_int_array_like(values):
                 raise TypeError("values must be a sequence")
             if len(variables) != len(values):
                 raise ValueError("variables and values have different sizes")
-            return RationalFunction._new(
-                self._raw.shift(
-                    _create_raw_var_array(tuple(variables)),
-                    _create_raw_int_array(tuple(values)),
+            raw_variables = _create_raw_var_array(tuple(variables))
+            raw_values = _create_raw_int_values(values)
+            if isinstance(raw_values, tuple):
+                # Beyond 32 bits.
+                return RationalFunction._new(
+                    _RawPythonUtils.shift(self._raw, raw_variables, *raw_values)
                 )
-            )
+            return RationalFunction._new(self._raw.shift(raw_variables, raw_values))
 
         if isinstance(variables, Variable):
             x = variables
             if not isinstance(values, int):
                 raise TypeError("value must be an integer")
             n = values
+            if not _is_int32(n):
+                return self.shift((x,), (n,))
             return RationalFunction._new(self._raw.shift(x._raw, n))
 
         if isinstance(variables, str):
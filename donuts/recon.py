@@ -0,0 +1,649 @@
+"""Reconstruction of rational functions from their values in finite fields."""
+
+from __future__ import annotations
+
+import functools
+import math
+import operator
+import random
+from concurrent.futures import Executor
+from fractions import Fraction
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .poly import Polynomial
+from .rat import RationalFunction
+from .var import Variable, VariableLike
+
+_Exponents = Tuple[int, ...]
+_Point = Tuple[int, ...]
+
+# Dense univariate polynomial modulo a prime, lowest degree first.
+_UniPoly = List[int]
+
+_MAX_ATTEMPTS = 5
+
+_NCHECKS = 2
+
+
+class _UnluckyError(Exception):
+    """Raised when random choices turn out to be unlucky."""
+
+
+class _ShiftError(Exception):
+    """Raised when the denominator vanishes at the origin."""
+
+
+def reconstruct(
+    blackbox: Callable[..., Any],
+    variables: Sequence[VariableLike],
+    *,
+    batch: bool = False,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+    max_degree: int = 200,
+    max_primes: int = 100,
+    seed: Optional[int] = None,
+) -> RationalFunction:
+    """Reconstruct a rational function from its values modulo primes.
+
+    The black box is called as ``blackbox(values, prime)``, where `values` is a tuple
+    of integers in ``[0, prime)`` corresponding to the given variables, and must
+    return the value of the rational function modulo the prime. If `batch` is `True`,
+    it is called as ``blackbox(points, prime)`` with a list of such tuples instead,
+    and must return a sequence of values. The primes are less than ``2**62``.
+
+    Samples are taken in chunks of at most `chunk_size` points, which are mapped
+    over `executor` if given, e.g., a :class:`concurrent.futures.ProcessPoolExecutor`
+    to evaluate a picklable black box in parallel.
+
+    The total degrees are found by Thiele interpolation along a random line, and the
+    sparse numerator and denominator by Zippel's algorithm for the first prime.
+    Images for the other primes are obtained with the same support and combined by
+    the Chinese remainder theorem and rational number reconstruction, until the
+    result is confirmed at a new prime.
+    """
+    xs = tuple(Variable(x) for x in variables)
+    if len(set(xs)) != len(xs):
+        raise ValueError("duplicate variables")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if max_degree < 0:
+        raise ValueError("max_degree must be non-negative")
+    if max_primes <= 0:
+        raise ValueError("max_primes must be positive")
+    return _Reconstructor(
+        blackbox, len(xs), batch, executor, chunk_size, max_degree, seed
+    ).run(xs, max_primes)
+
+
+class _Reconstructor:
+    """Reconstruction of a rational function from a black box."""
+
+    def __init__(
+        self,
+        blackbox: Callable[..., Any],
+        nvars: int,
+        batch: bool,
+        executor: Optional[Executor],
+        chunk_size: int,
+        max_degree: int,
+        seed: Optional[int],
+    ) -> None:
+        self._blackbox = blackbox
+        self._nvars = nvars
+        self._batch = batch
+        self._executor = executor
+        self._chunk_size = chunk_size
+        self._max_degree = max_degree
+        self._random = random.Random(seed)  # noqa: S311
+        # We reconstruct g(z) = f(z + shift) with z = t * (1, y_1, ..., y_{n-1}).
+        self._shift: _Point = (0,) * nvars
+        self._head: _Point = (1,) if nvars else ()
+
+    def run(self, variables: Sequence[Variable], max_primes: int) -> RationalFunction:
+        """Run the reconstruction."""
+        primes = _primes()
+        p = next(primes)
+
+        for _ in range(_MAX_ATTEMPTS):
+            try:
+                degrees, supports = self._learn(p)
+                coeffs = self._coefficients(p, degrees, supports)
+                if not self._check(p, degrees, supports, coeffs):
+                    raise _UnluckyError()
+                break
+            except (_ShiftError, _UnluckyError):
+                # Numerator and denominator of the same order at the origin can
+                # cancel along the line, which also requires a shift.
+                self._shift = tuple(self._random.randint(1, 100) for _ in variables)
+        else:
+            raise ValueError("failed to reconstruct the rational function")
+
+        if degrees[0] < 0:
+            return RationalFunction(0)
+
+        residues = [c for cc in coeffs for c in cc]
+        modulus = p
+        nprimes = 1
+        while True:
+            p = next(primes)
+            candidate = _rational_reconstruct_all(residues, modulus)
+            if candidate is not None:
+                if self._check(p, degrees, supports, _split(candidate, supports)):
+                    return self._build(variables, degrees, supports, candidate)
+            if nprimes >= max_primes:
+                raise ValueError(
+                    f"failed to reconstruct the rational function with {nprimes} primes"
+                )
+            try:
+                coeffs = self._coefficients(p, degrees, supports)
+            except _UnluckyError:
+                continue
+            factor = modulus * _inverse(modulus % p, p)
+            modulus *= p
+            residues = [
+                (r + (c - r) * factor) % modulus
+                for r, c in zip(residues, (c for cc in coeffs for c in cc))
+            ]
+            nprimes += 1
+
+    def _evaluate(self, points: List[_Point], p: int) -> List[int]:
+        """Evaluate the black box at the given points."""
+        n = self._chunk_size
+        chunks = [points[i : i + n] for i in range(0, len(points), n)]
+        func = functools.partial(_call_blackbox, self._blackbox, self._batch, p)
+        results: Iterable[List[Any]]
+        if self._executor is None:
+            results = map(func, chunks)
+        else:
+            results = self._executor.map(func, chunks)
+        values = [operator.index(v) % p for chunk in results for v in chunk]
+        if len(values) != len(points):
+            raise ValueError("black box returned a wrong number of values")
+        return values
+
+    def _random_values(self, n: int, p: int, exclude: Any = ()) -> List[int]:
+        """Return distinct random non-zero integers modulo the prime."""
+        values: List[int] = []
+        seen = set(exclude)
+        while len(values) < n:
+            x = self._random.randrange(1, p)
+            if x not in seen:
+                seen.add(x)
+                values.append(x)
+        return values
+
+    def _points(self, p: int, z: _Point, ts: Sequence[int]) -> List[_Point]:
+        """Return the points ``t * z + shift``."""
+        return [tuple((t * zi + si) % p for zi, si in zip(z, self._shift)) for t in ts]
+
+    def _learn(self, p: int) -> Tuple[Tuple[int, int], List[List[_Exponents]]]:
+        """Find the degrees and the supports of the homogeneous parts.
+
+        The targets are the numerator coefficients of ``t^0, ..., t^dn`` and the
+        denominator coefficients of ``t^1, ..., t^dd`` in ``g(t * z)``, normalized
+        such that the constant term of the denominator is one. Each of them is
+        a polynomial of ``y_1, ..., y_{n-1}`` with a degree bound given by the power
+        of ``t``.
+        """
+        m = max(self._nvars - 1, 0)
+        anchors = tuple(self._random_values(m, p))
+
+        num, den = self._thiele(p, self._head + anchors)
+        degrees = (len(num) - 1, len(den) - 1)
+        bounds = _bounds(degrees)
+        if degrees[0] < 0:
+            return degrees, []
+
+        # Zippel's algorithm: add y_1, ..., y_{n-1} one by one.
+        supports: List[List[_Exponents]] = [[()] for _ in bounds]
+        npoints = max(bounds) + 1
+        for r in range(m):
+            vs = self._random_values(npoints, p)
+            suffixes = [(v,) + anchors[r + 1 :] for v in vs]
+            results = self._solve_support(p, degrees, supports, suffixes)
+            new_supports: List[List[_Exponents]] = []
+            for j, (bound, support) in enumerate(zip(bounds, supports)):
+                new_support: List[_Exponents] = []
+                for i, e in enumerate(support):
+                    k = bound - sum(e) + 1
+                    poly = _interpolate(vs[:k], [results[q][j][i] for q in range(k)], p)
+                    new_support.extend(e + (d,) for d, c in enumerate(poly) if c)
+                new_supports.append(new_support)
+            supports = new_supports
+        return degrees, supports
+
+    def _thiele(self, p: int, z: _Point) -> Tuple[_UniPoly, _UniPoly]:
+        """Reconstruct ``g(t * z)`` as a univariate rational function of `t`."""
+        ts: List[int] = []
+        values: List[int] = []
+        n = 8
+        while True:
+            new_ts = self._random_values(n, p, ts)
+            ts.extend(new_ts)
+            values.extend(self._evaluate(self._points(p, z, new_ts), p))
+            result = _thiele(ts, values, p)
+            if result is not None:
+                num, den = result
+                if not den[0]:
+                    raise _ShiftError()
+                c = _inverse(den[0], p)
+                return [x * c % p for x in num], [x * c % p for x in den]
+            if len(ts) > 2 * self._max_degree + 2:
+                raise ValueError(f"degree exceeds max_degree = {self._max_degree}")
+            n = len(ts)
+
+    def _probe(
+        self, p: int, degrees: Tuple[int, int], zs: Sequence[_Point]
+    ) -> List[List[int]]:
+        """Return the coefficients of the targets at the given directions."""
+        ts = self._random_values(degrees[0] + degrees[1] + 1, p)
+        points = [x for z in zs for x in self._points(p, z, ts)]
+        values = self._evaluate(points, p)
+        n = len(ts)
+        return [
+            _solve_rational(ts, values[i * n : (i + 1) * n], degrees, p)
+            for i in range(len(zs))
+        ]
+
+    def _solve_support(
+        self,
+        p: int,
+        degrees: Tuple[int, int],
+        supports: List[List[_Exponents]],
+        suffixes: Sequence[_Point],
+    ) -> List[List[List[int]]]:
+        """Solve for the coefficients of the supports for each suffix of `y`.
+
+        The result is indexed by the suffix, the target and the term.
+        """
+        r = len(next((e for s in supports for e in s), ()))
+        for _ in range(_MAX_ATTEMPTS):
+            alpha = self._random_values(r, p)
+            nodes = [[_monomial(alpha, e, p) for e in support] for support in supports]
+            if all(len(set(x)) == len(x) for x in nodes):
+                break
+        else:
+            raise _UnluckyError()
+
+        # Start from the first powers, avoiding the degenerate direction y = 1.
+        n = max((len(s) for s in supports), default=0)
+        powers = [tuple(pow(a, i + 1, p) for a in alpha) for i in range(n)]
+        zs = [self._head + y + suffix for suffix in suffixes for y in powers]
+        results = self._probe(p, degrees, zs) if zs else []
+
+        return [
+            [
+                _solve_vandermonde(x, [results[q * n + i][j] for i in range(len(x))], p)
+                for j, x in enumerate(nodes)
+            ]
+            for q in range(len(suffixes))
+        ]
+
+    def _coefficients(
+        self, p: int, degrees: Tuple[int, int], supports: List[List[_Exponents]]
+    ) -> List[List[int]]:
+        """Return the coefficients of the targets with the given supports."""
+        return self._solve_support(p, degrees, supports, [()])[0]
+
+    def _check(
+        self,
+        p: int,
+        degrees: Tuple[int, int],
+        supports: List[List[_Exponents]],
+        coeffs: Sequence[Sequence[Any]],
+    ) -> bool:
+        """Check the given coefficients against the black box at random points."""
+        num: Dict[_Exponents, int] = {}
+        den: Dict[_Exponents, int] = {(0,) * self._nvars: 1}
+        for (is_num, k), support, cc in zip(_targets(degrees), supports, coeffs):
+            terms = num if is_num else den
+            for e, c in zip(support, cc):
+                if isinstance(c, Fraction):
+                    if c.denominator % p == 0:
+                        return False
+                    c = c.numerator * _inverse(c.denominator, p)
+                terms[self._homogenize(k, e)] = c % p
+
+        points = [tuple(self._random_values(self._nvars, p)) for _ in range(_NCHECKS)]
+        for x, value in zip(points, self._evaluate(points, p)):
+            z = tuple((xi - si) % p for xi, si in zip(x, self._shift))
+            if _evaluate_terms(num, z, p) != value * _evaluate_terms(den, z, p) % p:
+                return False
+        return True
+
+    def _homogenize(self, k: int, e: _Exponents) -> _Exponents:
+        """Return the exponents of a term of degree `k` from those of `y`."""
+        return (k - sum(e),) + e if self._nvars else ()
+
+    def _build(
+        self,
+        variables: Sequence[Variable],
+        degrees: Tuple[int, int],
+        supports: List[List[_Exponents]],
+        coeffs: Sequence[Fraction],
+    ) -> RationalFunction:
+        """Build the rational function from the reconstructed coefficients."""
+        num: List[Tuple[_Exponents, Fraction]] = []
+        den: List[Tuple[_Exponents, Fraction]] = [((0,) * self._nvars, Fraction(1))]
+        for (is_num, k), support, cc in zip(
+            _targets(degrees), supports, _split(coeffs, supports)
+        ):
+            terms = num if is_num else den
+            terms.extend((self._homogenize(k, e), c) for e, c in zip(support, cc))
+
+        lcm = 1
+        for _, c in num + den:
+            lcm = lcm * c.denominator // math.gcd(lcm, c.denominator)
+
+        def to_polynomial(terms: List[Tuple[_Exponents, Fraction]]) -> Polynomial:
+            coefficients = [int(c * lcm) for _, c in terms]
+            if not variables:
+                return Polynomial(sum(coefficients))
+            poly = Polynomial.from_arrays(
+                variables, [e for e, _ in terms], coefficients
+            )
+            if any(self._shift):
+                poly = poly.shift(variables, [-s for s in self._shift])
+            return poly
+
+        return RationalFunction(to_polynomial(num), to_polynomial(den))
+
+
+def _call_blackbox(
+    blackbox: Callable[..., Any], batch: bool, prime: int, points: List[_Point]
+) -> List[Any]:
+    """Call the black box for the given points."""
+    if batch:
+        return list(blackbox(points, prime))
+    return [blackbox(x, prime) for x in points]
+
+
+def _targets(degrees: Tuple[int, int]) -> List[Tuple[bool, int]]:
+    """Return the targets as pairs of the numerator flag and the power of ``t``."""
+    return [(True, k) for k in range(degrees[0] + 1)] + [
+        (False, k) for k in range(1, degrees[1] + 1)
+    ]
+
+
+def _bounds(degrees: Tuple[int, int]) -> List[int]:
+    """Return the degree bounds of the targets."""
+    return [k for _, k in _targets(degrees)]
+
+
+def _split(values: Sequence[Any], supports: List[List[_Exponents]]) -> List[List[Any]]:
+    """Split the flattened coefficients into those of each target."""
+    result = []
+    i = 0
+    for support in supports:
+        result.append(list(values[i : i + len(support)]))
+        i += len(support)
+    return result
+
+
+def _is_prime(n: int) -> bool:
+    """Return `True` if the given integer less than ``2**64`` is a prime."""
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+    if n < 2:
+        return False
+    for q in bases:
+        if n % q == 0:
+            return n == q
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primes() -> Iterator[int]:
+    """Generate primes less than ``2**62`` in descending order."""
+    n = 2**62 - 1
+    while n > 2:
+        if _is_prime(n):
+            yield n
+        n -= 2
+
+
+def _inverse(a: int, p: int) -> int:
+    """Return the inverse of `a` modulo the prime `p`."""
+    if a % p == 0:
+        raise _UnluckyError()
+    return pow(a, p - 2, p)
+
+
+def _isqrt(n: int) -> int:
+    """Return the integer square root."""
+    if n <= 0:
+        return 0
+    x = 1 << ((n.bit_length() + 1) // 2)
+    while True:
+        y = (x + n // x) // 2
+        if y >= x:
+            return x
+        x = y
+
+
+def _rational_reconstruct(a: int, m: int) -> Optional[Fraction]:
+    """Return the rational number congruent to `a` modulo `m` with small size."""
+    bound = _isqrt(m // 2)
+    r0, r1 = m, a % m
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > bound or math.gcd(r1, s1) != 1:
+        return None
+    return Fraction(r1, s1)
+
+
+def _rational_reconstruct_all(
+    residues: Sequence[int], m: int
+) -> Optional[List[Fraction]]:
+    """Apply the rational number reconstruction to all the residues."""
+    result = []
+    for a in residues:
+        x = _rational_reconstruct(a, m)
+        if x is None:
+            return None
+        result.append(x)
+    return result
+
+
+def _monomial(alpha: Sequence[int], e: _Exponents, p: int) -> int:
+    """Return the value of the monomial with exponents `e` at `alpha`."""
+    x = 1
+    for a, n in zip(alpha, e):
+        x = x * pow(a, n, p) % p
+    return x
+
+
+def _evaluate_terms(terms: Dict[_Exponents, int], z: _Point, p: int) -> int:
+    """Evaluate the sparse polynomial at the given point."""
+    return sum(c * _monomial(z, e, p) for e, c in terms.items()) % p
+
+
+def _trim(a: _UniPoly) -> _UniPoly:
+    """Remove the leading zero coefficients."""
+    while a and not a[-1]:
+        a.pop()
+    return a
+
+
+def _divmod(a: _UniPoly, b: _UniPoly, p: int) -> Tuple[_UniPoly, _UniPoly]:
+    """Return the quotient and remainder of univariate polynomials."""
+    r = list(a)
+    if len(r) < len(b):
+        return [], _trim(r)
+    c = _inverse(b[-1], p)
+    q = [0] * (len(r) - len(b) + 1)
+    for i in range(len(q) - 1, -1, -1):
+        x = r[i + len(b) - 1] * c % p
+        q[i] = x
+        if x:
+            for j, y in enumerate(b):
+                r[i + j] = (r[i + j] - x * y) % p
+    return _trim(q), _trim(r[: len(b) - 1])
+
+
+def _gcd(a: _UniPoly, b: _UniPoly, p: int) -> _UniPoly:
+    """Return the GCD of univariate polynomials."""
+    while b:
+        a, b = b, _divmod(a, b, p)[1]
+    return a
+
+
+def _thiele(
+    ts: Sequence[int], values: Sequence[int], p: int
+) -> Optional[Tuple[_UniPoly, _UniPoly]]:
+    """Return the Thiele interpolation of the samples if it terminates.
+
+    The interpolation is regarded as terminated if it correctly predicts the last
+    two samples. The result is a pair of the numerator and the denominator.
+    """
+    nodes: List[int] = []
+    coeffs: List[int] = []
+    agreed = 0
+    for t, v in zip(ts, values):
+        # Evaluate the continued fraction at t.
+        x: Optional[int] = None
+        if coeffs:
+            x = coeffs[-1]
+            for j in range(len(coeffs) - 2, -1, -1):
+                if not x:
+                    x = None
+                    break
+                x = (coeffs[j] + (t - nodes[j]) * _inverse(x, p)) % p
+        if x == v:
+            agreed += 1
+            if agreed >= 2:
+                break
+            continue
+        agreed = 0
+        # Add the sample to the continued fraction.
+        x = v
+        for j in range(len(coeffs)):
+            x = (t - nodes[j]) * _inverse(x - coeffs[j], p) % p
+        nodes.append(t)
+        coeffs.append(x)
+    else:
+        return None
+
+    num = [coeffs[-1]]
+    den = [1]
+    for j in range(len(coeffs) - 2, -1, -1):
+        # num / den <- coeffs[j] + (t - nodes[j]) / (num / den)
+        new = [c * coeffs[j] % p for c in num]
+        new += [0] * (len(den) + 1 - len(new))
+        for i, c in enumerate(den):
+            new[i] = (new[i] - nodes[j] * c) % p
+            new[i + 1] = (new[i + 1] + c) % p
+        num, den = _trim(new), num
+    g = _gcd(list(num), list(den), p)
+    return (_divmod(num, g, p)[0] if num else []), _divmod(den, g, p)[0]
+
+
+def _interpolate(xs: Sequence[int], ys: Sequence[int], p: int) -> _UniPoly:
+    """Return the univariate polynomial interpolating the samples."""
+    n = len(xs)
+    c = list(ys)
+    for j in range(1, n):
+        for i in range(n - 1, j - 1, -1):
+            c[i] = (c[i] - c[i - 1]) * _inverse(xs[i] - xs[i - j], p) % p
+    result = [c[-1]] if c else []
+    for k in range(n - 2, -1, -1):
+        # result <- result * (x - xs[k]) + c[k]
+        new = [0] + result
+        for i, a in enumerate(result):
+            new[i] = (new[i] - a * xs[k]) % p
+        new[0] = (new[0] + c[k]) % p
+        result = new
+    return result
+
+
+def _solve_linear(rows: List[List[int]], p: int) -> List[int]:
+    """Solve the linear system given as an augmented matrix."""
+    n = len(rows)
+    for i in range(n):
+        pivot = next((k for k in range(i, n) if rows[k][i]), None)
+        if pivot is None:
+            raise _UnluckyError()
+        rows[i], rows[pivot] = rows[pivot], rows[i]
+        c = _inverse(rows[i][i], p)
+        row = [x * c % p for x in rows[i]]
+        rows[i] = row
+        for k in range(n):
+            if k != i and rows[k][i]:
+                f = rows[k][i]
+                rows[k] = [(x - f * y) % p for x, y in zip(rows[k], row)]
+    return [row[-1] for row in rows]
+
+
+def _solve_rational(
+    ts: Sequence[int], values: Sequence[int], degrees: Tuple[int, int], p: int
+) -> List[int]:
+    """Return the coefficients of the univariate rational function of known degrees.
+
+    The result consists of the numerator coefficients of ``t^0, ..., t^dn`` and the
+    denominator coefficients of ``t^1, ..., t^dd``, where the denominator is
+    normalized such that its constant term is one.
+    """
+    dn, dd = degrees
+    rows = []
+    for t, v in zip(ts, values):
+        powers = [1]
+        for _ in range(max(dn, dd)):
+            powers.append(powers[-1] * t % p)
+        rows.append(powers[: dn + 1] + [-v * x % p for x in powers[1 : dd + 1]] + [v])
+    return _solve_linear(rows, p)
+
+
+def _solve_vandermonde(
+    nodes: Sequence[int], values: Sequence[int], p: int
+) -> List[int]:
+    """Solve ``sum_j c_j * nodes[j]^(i+1) = values[i]`` for the coefficients ``c_j``."""
+    n = len(nodes)
+    master = [1]
+    for w in nodes:
+        # master <- master * (x - w)
+        new = [0] + master
+        for i, a in enumerate(master):
+            new[i] = (new[i] - a * w) % p
+        master = new
+
+    result = []
+    for w in nodes:
+        # q <- master / (x - w)
+        q = [0] * n
+        acc = 1
+        for i in range(n - 1, -1, -1):
+            q[i] = acc
+            acc = (master[i] + acc * w) % p
+        denom = 0
+        for c in reversed(q):
+            denom = (denom * w + c) % p
+        num = sum(c * v for c, v in zip(q, values)) % p
+        result.append(num * _inverse(denom * w, p) % p)
+    return result
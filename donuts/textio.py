@@ -0,0 +1,59 @@
+"""Streaming text I/O."""
+
+from __future__ import annotations
+
+import io
+import os
+from typing import IO, Any, Union
+
+from .jvm import jvm
+
+_RawTextFormat = jvm.find_class("com.github.tueda.donuts.python.TextFormat")
+
+TextFile = Union[str, "os.PathLike[str]", IO[Any]]
+
+
+def _write_text(raw: Any, file: Any, rational: bool) -> None:
+    """Write the text of a raw polynomial or rational function to a file.
+
+    Files given by paths are written directly on the Java side. For file objects,
+    the text is transferred in chunks.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        # Open the file here for the usual exceptions; moreover, the Java side may
+        # have a different working directory.
+        path = os.path.abspath(file)
+        with open(path, "wb"):
+            pass
+        try:
+            if rational:
+                _RawTextFormat.writeRationalFunction(raw, path)
+            else:
+                _RawTextFormat.writePolynomial(raw, path)
+        except jvm.java_error_class as e:
+            raise OSError(f"failed to write to {path}") from e
+        return
+
+    binary = isinstance(file, (io.RawIOBase, io.BufferedIOBase)) or (
+        not isinstance(file, io.TextIOBase) and "b" in getattr(file, "mode", "")
+    )
+    raw_chunks = _RawTextFormat.toChunks(raw)
+    while True:
+        s = str(raw_chunks.next())
+        if not s:
+            break
+        file.write(s.encode() if binary else s)
+
+
+def _read_text(path: Union[str, os.PathLike[str]], rational: bool) -> Any:
+    """Read a raw polynomial or rational function from a file."""
+    path = os.path.abspath(path)
+    with open(path, "rb"):
+        pass
+    try:
+        if rational:
+            return _RawTextFormat.readRationalFunction(path)
+        return _RawTextFormat.readPolynomial(path)
+    except jvm.java_error_class as e:
+        kind = "rational function" if rational else "polynomial"
+        raise ValueError(f"invalid text for {kind}") from e
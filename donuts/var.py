@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import functools
 from typing import TYPE_CHECKING, Any, Union, overload
 
+from .cache import _lru_cache
 from .jvm import jvm
 
 if TYPE_CHECKING:
@@ -12,10 +12,9 @@ if TYPE_CHECKING:
     from .rat import RationalFunction
 
 _RawVariable = jvm.find_class("com.github.tueda.donuts.Variable")
-_JavaError = jvm.java_error_class
 
 
-@functools.lru_cache(maxsize=1024)
+@_lru_cache("variable", maxsize=1024)
 def _raw_variable_from_str(name: str) -> Any:
     return _RawVariable(name)
 
@@ -53,7 +52,7 @@ class Variable:
 
         try:
             self._raw = _raw_variable_from_str(variable)
-        except _JavaError as e:
+        except jvm.java_error_class as e:
             raise ValueError(f"invalid string for variable: `{variable}'") from e
 
         self._name = variable
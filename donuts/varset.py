@@ -15,6 +15,7 @@ from typing import (
 )
 
 from .array import _create_raw_var_array
+from .cache import _lru_cache
 from .jvm import jvm
 from .var import Variable, VariableLike
 
@@ -22,11 +23,16 @@ _RawVariableSet = jvm.find_class("com.github.tueda.donuts.VariableSet")
 _RawPythonUtils = jvm.find_class("com.github.tueda.donuts.python.PythonUtils")
 
 
-@functools.lru_cache(maxsize=1024)
+@_lru_cache("variable_set", maxsize=1024)
 def _raw_variable_set_from_frozenset(variables: FrozenSet[VariableLike]) -> Any:
     return _RawPythonUtils.variableSet(_create_raw_var_array(tuple(variables)))
 
 
+@functools.lru_cache(maxsize=None)
+def _raw_empty_variable_set() -> Any:
+    return _RawVariableSet()
+
+
 class VariableSet(AbstractSet[Variable]):
     """Variable set."""
 
@@ -34,8 +40,6 @@ class VariableSet(AbstractSet[Variable]):
 
     __NONE = "[__PRIVATE_NONE__]"
 
-    __RAW_EMPTY = _RawVariableSet()
-
     @overload
     def __init__(self) -> None:
         """Construct an empty set of variables."""
@@ -64,7 +68,7 @@ class VariableSet(AbstractSet[Variable]):
     def __init__(self, *variables) -> None:  # type: ignore[misc,no-untyped-def]
         """Construct a set of variables."""
         if len(variables) == 0:
-            self._raw = VariableSet.__RAW_EMPTY
+            self._raw = _raw_empty_variable_set()
             return
 
         if len(variables) == 1:
@@ -97,17 +101,22 @@ class VariableSet(AbstractSet[Variable]):
     @staticmethod
     def _get_raw(variables: Iterable[Union[Variable, str]]) -> Any:
         if isinstance(variables, Collection) and len(variables) == 0:
-            VariableSet.__RAW_EMPTY
+            return _raw_empty_variable_set()
 
         return _raw_variable_set_from_frozenset(frozenset(variables))
 
     def __getstate__(self) -> Any:
         """Get the object state."""
-        return jvm.serialize(self._raw)
+        # The variable names separated by commas.
+        return str(_RawPythonUtils.getVariableNames(self._raw))
 
     def __setstate__(self, state: Any) -> None:
         """Set the object state."""
-        self._raw = jvm.deserialize(state)
+        if isinstance(state, str):
+            self._raw = _RawPythonUtils.variableSetOf(state)
+        else:
+            # Older versions pickled the Java serialization.
+            self._raw = jvm.deserialize(state)
 
     def __str__(self) -> str:
         """Return the string representation."""
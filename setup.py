@@ -68,6 +68,7 @@ setup(
     package_data={"donuts": ["py.typed", "java/donuts-all.jar"]},
     python_requires=">=3.7",
     install_requires=['importlib-resources>=1.3; python_version < "3.9"', "pyjnius"],
+    extras_require={"numpy": ["numpy>=1.17"]},  # type: ignore[arg-type]
     setup_requires=["pytest-runner"],
     tests_require=["pytest", "pytest-benchmark", "pytest-cov"],
     cmdclass={
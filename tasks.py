@@ -77,17 +77,23 @@ def doc(c: Context) -> None:
 
 
 @task
-def build(c: Context, sdist: bool = False, wheel: bool = False) -> None:
+def build(
+    c: Context, sdist: bool = False, wheel: bool = False, cds: bool = False
+) -> None:
     """Build the JAR file/distribution."""
     import shutil
     from pathlib import Path
 
-    from build import build_jar
+    from build import build_cds_archive, build_jar
 
     if not wheel:
         # Ensure that the jar file is built.
         build_jar()
 
+    if cds:
+        # The CDS archive is specific to the local JDK and not distributed.
+        build_cds_archive()
+
     if sdist:
         c.run("python setup.py sdist", pty=True)
         # Poetry 1.2.2 normalizes the sdist name.
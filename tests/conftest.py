@@ -1,10 +1,11 @@
 """Configuration for testing."""
 
 import random
-from typing import Any, Callable, Dict, List, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Sequence
 
 import pytest
 
+import donuts
 from donuts import Polynomial, RationalFunction
 
 
@@ -75,11 +76,33 @@ def random_rat(
             return r1 / r2
 
 
+@pytest.fixture()
+def _no_result_cache() -> Iterator[None]:
+    """Disable the result cache, e.g., for benchmarking uncached operations."""
+    maxsize = donuts.result_cache_info().maxsize
+    donuts.configure_result_cache(maxsize=0)
+    try:
+        yield
+    finally:
+        donuts.configure_result_cache(maxsize=maxsize)
+
+
+@pytest.fixture()
+def _no_parse_cache() -> Iterator[None]:
+    """Disable the parse caches, e.g., for benchmarking uncached parsing."""
+    maxsize = donuts.parse_cache_info().maxsize
+    donuts.configure_parse_cache(maxsize=0)
+    try:
+        yield
+    finally:
+        donuts.configure_parse_cache(maxsize=maxsize)
+
+
 @pytest.fixture()
 def bigints() -> List[int]:
     """Give a list of integers containing big values."""
     test_int_set = set()
-    for i in (-(2**63), 0, 2**63):
+    for i in (-(2**1000), -(2**63), 0, 2**63, 2**1000):
         for j in range(-2, 3):
             n = i + j
             test_int_set.add(n)
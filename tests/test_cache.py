@@ -0,0 +1,326 @@
+import os
+import sqlite3
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import pytest
+
+import donuts
+from donuts import Polynomial, RationalFunction, Variable, VariableSet, gcd, lcm
+
+
+def test_result_cache() -> None:
+    donuts.clear_result_cache()
+    info = donuts.result_cache_info()
+    assert (info.hits, info.misses, info.currsize, info.nbytes) == (0, 0, 0, 0)
+
+    a = Polynomial("(1+x)^3*(1-y)")
+    b = Polynomial("(1+x)*(2-y)")
+
+    assert a.gcd(b) == Polynomial("1+x")
+    assert b.gcd(a) == Polynomial("1+x")
+    assert a.lcm(b) == Polynomial("(1+x)^3*(1-y)*(2-y)")
+    assert gcd(a, b, 1 + Polynomial("x")) == Polynomial("1+x")
+    assert lcm(a, b) == a.lcm(b)
+    assert a.divide_exact(b.divide_exact(2 - Polynomial("y"))) == Polynomial(
+        "(1+x)^2*(1-y)"
+    )
+    assert Polynomial(str(a)).factors == a.factors
+
+    info = donuts.result_cache_info()
+    assert info.hits == 4
+    assert info.misses == 6
+    assert info.currsize == 6
+    assert info.nbytes > 0
+
+    with pytest.raises(ValueError, match="not divisible"):
+        a.divide_exact(b)
+    assert donuts.result_cache_info().currsize == 6
+
+    donuts.clear_result_cache()
+    info = donuts.result_cache_info()
+    assert (info.hits, info.misses, info.currsize, info.nbytes) == (0, 0, 0, 0)
+
+
+def test_result_cache_variables() -> None:
+    donuts.clear_result_cache()
+
+    # Equal polynomials with different sets of variables.
+    a = Polynomial("(1+x)*(1-x)")
+    b = a.translate("x", "y", "z")
+    c = Polynomial("1+x")
+    xyz = VariableSet("x", "y", "z")
+    for p, v in ((a, VariableSet("x")), (b, xyz)):
+        assert all(f.variables == v for f in p.factors)
+        assert p.gcd(c).variables == v
+        assert p.lcm(c).variables == v
+        assert p.divide_exact(c).variables == v
+        assert gcd(p, c, c).variables == v
+        assert lcm(c, p, c).variables == v
+    assert donuts.result_cache_info().hits == 0
+
+    # Hits.
+    b = a.translate("x", "y", "z")
+    assert all(f.variables == xyz for f in b.factors)
+    assert b.gcd(c).variables == xyz
+    assert donuts.result_cache_info().hits == 2
+
+    donuts.clear_result_cache()
+
+
+def test_configure_result_cache() -> None:
+    info = donuts.result_cache_info()
+    maxsize, max_bytes = info.maxsize, info.max_bytes
+    try:
+        donuts.clear_result_cache()
+        donuts.configure_result_cache(maxsize=2)
+        for i in range(5):
+            assert Polynomial(f"(1+x)^{i}").factors
+        info = donuts.result_cache_info()
+        assert info.currsize == 2
+        assert info.maxsize == 2
+        assert info.max_bytes == max_bytes
+
+        donuts.configure_result_cache(max_bytes=0)
+        assert donuts.result_cache_info().currsize == 0
+        assert Polynomial("(1+x)^5").factors
+        assert donuts.result_cache_info().currsize == 0
+
+        with pytest.raises(ValueError, match="non-negative"):
+            donuts.configure_result_cache(maxsize=-1)
+    finally:
+        donuts.configure_result_cache(maxsize=maxsize, max_bytes=max_bytes)
+        donuts.clear_result_cache()
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    a = Polynomial("(1+x)^3*(1-y)*(1+z+w)^4")
+    b = Polynomial("(1+x)*(2-y)*(1+z+w)")
+    try:
+        donuts.configure_disk_cache(tmp_path, min_time=0)
+        assert (tmp_path / "donuts-cache.sqlite3").exists()
+        donuts.clear_result_cache()
+
+        expected = (
+            a.gcd(b),
+            a.lcm(b),
+            gcd(a, b, a),
+            lcm(a, b, b),
+            a.divide_exact(b.gcd(a)),
+            Polynomial(str(a)).factors,
+        )
+        info = donuts.disk_cache_info()
+        assert info.hits == 0
+        assert info.misses == 6
+        assert info.currsize == 6
+        assert info.nbytes > 0
+
+        with pytest.raises(ValueError, match="not divisible"):
+            a.divide_exact(b)
+        assert donuts.disk_cache_info().currsize == 6
+
+        # Results are read from the database when not in memory.
+        donuts.clear_result_cache()
+        result = (
+            a.gcd(b),
+            a.lcm(b),
+            gcd(a, b, a),
+            lcm(a, b, b),
+            a.divide_exact(b.gcd(a)),
+            Polynomial(str(a)).factors,
+        )
+        assert result == expected
+        assert donuts.disk_cache_info().hits == 6
+
+        # Shared with other processes.
+        code = """
+import donuts
+a = donuts.Polynomial("(1+x)^3*(1-y)*(1+z+w)^4")
+print(a.factors == a.divide_exact(1).factors, donuts.disk_cache_info().hits)
+"""
+        env = dict(os.environ, DONUTS_PYTHON_DISK_CACHE=str(tmp_path))
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            env=env,
+        )
+        assert process.stdout.split() == ["True", "1"]
+
+        # Results have the variables of the operands, not of the stored ones.
+        donuts.clear_result_cache()
+        hits = donuts.disk_cache_info().hits
+        wxyz = VariableSet("w", "x", "y", "z")
+        c = a.translate(wxyz | {"v"})
+        d = b.translate(wxyz | {"u"})
+        assert all(f.variables == c.variables for f in c.factors)
+        assert c.gcd(b).variables == c.variables
+        assert a.lcm(d).variables == d.variables
+        assert gcd(a, d, a).variables == d.variables
+        assert c.divide_exact(d.gcd(a)).variables == c.variables | d.variables
+        assert donuts.disk_cache_info().hits == hits + 6
+
+        # Corrupt entries are ignored and overwritten.
+        with sqlite3.connect(str(tmp_path / "donuts-cache.sqlite3")) as conn:
+            rows = conn.execute("SELECT key, value FROM results").fetchall()
+            for i, (key, value) in enumerate(rows):
+                corrupt = (
+                    value[:-1],
+                    b"\x01",
+                    b"",
+                    value + b"\x00",
+                    b"\x03\x00\x00\x00abc",
+                )[i % 5]
+                conn.execute(
+                    "UPDATE results SET value = ? WHERE key = ?", (corrupt, key)
+                )
+        donuts.clear_result_cache()
+        hits = donuts.disk_cache_info().hits
+        result = (
+            a.gcd(b),
+            a.lcm(b),
+            gcd(a, b, a),
+            lcm(a, b, b),
+            a.divide_exact(b.gcd(a)),
+            Polynomial(str(a)).factors,
+        )
+        assert result == expected
+        assert donuts.disk_cache_info().hits == hits
+        donuts.clear_result_cache()
+        assert Polynomial(str(a)).factors == expected[-1]
+        assert donuts.disk_cache_info().hits == hits + 1
+
+        donuts.clear_disk_cache()
+        info = donuts.disk_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+        # Eviction.
+        donuts.configure_disk_cache(tmp_path / "b.db", max_bytes=50000, min_time=0)
+        c = Polynomial("(1+x+y+z)^12")
+        for i in range(30):
+            assert (c * (i + 1)).divide_exact(i + 1) == c
+        info = donuts.disk_cache_info()
+        assert 0 < info.currsize < 30
+        assert info.nbytes <= 50000
+
+        donuts.configure_disk_cache(None)
+        assert donuts.disk_cache_info() == (0, 0, 0, 1 << 30, 0)
+
+        with pytest.raises(ValueError, match="non-negative"):
+            donuts.configure_disk_cache(tmp_path, max_bytes=-1)
+
+        with pytest.raises(OSError, match="failed to open"):
+            donuts.configure_disk_cache(tmp_path / "none" / "a.db")
+    finally:
+        donuts.configure_disk_cache(None)
+        donuts.clear_result_cache()
+
+
+def test_parse_cache() -> None:
+    saved = donuts.parse_cache_info()
+    try:
+        donuts.clear_parse_cache()
+        for _ in range(3):
+            assert Polynomial("1+x") == Polynomial("x+1")
+            assert RationalFunction("1/(1+x)") == 1 / Polynomial("1+x")
+            assert len(Polynomial("(1+x)^200")) == 201
+            assert Polynomial("x" + "+x" * 1000) == Polynomial("1001*x")
+            with pytest.raises(ValueError, match="invalid string"):
+                Polynomial("1/0")
+
+        # "(1+x)^200" has too many terms and "x+x+...+x" is too long. Errors are
+        # not cached.
+        info = donuts.parse_cache_info()
+        assert info.hits == 11
+        assert info.misses == 10
+        assert info.currsize == 4
+
+        donuts.configure_parse_cache(maxsize=1)
+        assert donuts.parse_cache_info().currsize == 2
+
+        donuts.configure_parse_cache(maxsize=1024, max_terms=1000)
+        Polynomial("(1+x)^200")
+        Polynomial("(1+x)^200")
+        assert donuts.parse_cache_info().hits == 12
+
+        with pytest.raises(ValueError, match="non-negative"):
+            donuts.configure_parse_cache(max_length=-1)
+    finally:
+        donuts.configure_parse_cache(
+            maxsize=saved.maxsize,
+            max_length=saved.max_length,
+            max_terms=saved.max_terms,
+        )
+        donuts.clear_parse_cache()
+
+
+def test_cache_info() -> None:
+    info = donuts.cache_info()
+    assert set(info) == {
+        "variable",
+        "variable_set",
+        "polynomial_int",
+        "polynomial_variable",
+        "rational_function_int",
+        "rational_function_variable",
+        "parse",
+        "result",
+    }
+    assert all(i.maxsize == 1024 for i in info.values())
+
+    # The JVM is not started only for the statistics.
+    code = """
+import donuts
+from donuts.jvm import jvm
+print(donuts.cache_info()["result"], jvm.is_started)
+"""
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert process.stdout.split() == [
+        "CacheInfo(hits=0,",
+        "misses=0,",
+        "maxsize=1024,",
+        "currsize=0)",
+        "False",
+    ]
+
+    Variable("a")
+    hits = donuts.cache_info()["variable"].hits
+    Variable("a")
+    assert donuts.cache_info()["variable"].hits == hits + 1
+
+
+def test_configure_caches() -> None:
+    saved = {name: info.maxsize for name, info in donuts.cache_info().items()}
+    try:
+        donuts.configure_caches(variable=2, variable_set=None, parse=0)
+        for i in range(10):
+            assert str(Variable(f"v{i}")) == f"v{i}"
+            assert VariableSet("a", f"v{i}") == VariableSet(f"v{i}", "a")
+        info = donuts.cache_info()
+        assert info["variable"].maxsize == 2
+        assert info["variable"].currsize == 2
+        assert info["variable_set"].maxsize is None
+        assert info["variable_set"].currsize == 10
+        assert info["parse"].maxsize == 0
+
+        donuts.configure_caches(polynomial_int=0, rational_function_int=0)
+        assert Polynomial(3) + RationalFunction(2) == 5
+        info = donuts.cache_info()
+        assert info["polynomial_int"].currsize == 0
+        assert info["rational_function_int"].currsize == 0
+
+        with pytest.raises(ValueError, match="unknown cache"):
+            donuts.configure_caches(foo=1)
+        with pytest.raises(ValueError, match="unbounded"):
+            donuts.configure_caches(result=None)
+        with pytest.raises(ValueError, match="non-negative"):
+            donuts.configure_caches(variable=-1)
+    finally:
+        donuts.configure_caches(**saved)
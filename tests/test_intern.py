@@ -0,0 +1,84 @@
+import gc
+import pickle
+from typing import Iterator
+
+import pytest
+
+import donuts
+from donuts import Polynomial, RationalFunction, VariableSet
+
+
+@pytest.fixture()
+def _interning() -> Iterator[None]:
+    donuts.set_interning(True)
+    try:
+        yield
+    finally:
+        donuts.set_interning(False)
+
+
+@pytest.mark.usefixtures("_interning")
+def test_interning() -> None:
+    a = Polynomial("1+x")
+    b = Polynomial("1-y")
+
+    c = [a * b for _ in range(10)]
+    assert all(x is c[0] for x in c)
+    assert c[0] == Polynomial("(1+x)*(1-y)")
+    assert (a + b) is (b + a)
+    assert (a + b) is not (a - b)
+
+    d = [RationalFunction(a) / b for _ in range(10)]
+    assert all(x is d[0] for x in d)
+    assert isinstance(d[0], RationalFunction)
+
+    # Polynomials and rational functions are never mixed.
+    assert type(a + 0) is Polynomial
+    assert type(RationalFunction(a) + 0) is RationalFunction
+
+    assert pickle.loads(pickle.dumps(a * b)) == c[0]  # noqa: S301
+
+    info = donuts.interning_info()
+    assert info.requests >= 20
+    assert info.hits >= 18
+    assert info.size >= 2
+    assert info.ratio > 1
+
+
+def test_interning_disabled() -> None:
+    a = Polynomial("1+x")
+    assert (a * a) is not (a * a)
+    assert (a * a) == (a * a)
+
+    donuts.set_interning(True)
+    donuts.set_interning(False)
+    assert donuts.interning_info() == (0, 0, 0)
+    assert donuts.interning_info().ratio == 1
+
+
+@pytest.mark.usefixtures("_interning")
+def test_interning_weak() -> None:
+    a = Polynomial("1+x")
+    b = a * a
+    del b
+    gc.collect()
+    c = a * a
+    assert c == Polynomial("(1+x)^2")
+    assert c is (a * a)
+
+
+@pytest.mark.usefixtures("_interning")
+def test_interning_variables() -> None:
+    a = Polynomial("(1+x+y)-(1+x+z)")
+    v = VariableSet("a", "x", "y", "z")
+    b = a.translate(v)
+    assert b == a
+    assert b is not a
+    assert b.variables == v
+    assert a.variables == VariableSet("x", "y", "z")
+    assert b.translate(v) is b
+
+    r = RationalFunction(a) / Polynomial("1+x")
+    s = r.translate(v)
+    assert s == r
+    assert s.variables == v
@@ -0,0 +1,157 @@
+import os
+import subprocess  # noqa: S404
+import sys
+from typing import List
+
+import pytest
+
+import donuts
+from donuts.jvm import jvm
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    return result.stdout.strip()
+
+
+def test_lazy_start() -> None:
+    code = """
+import donuts
+from donuts.jvm import jvm
+from donuts.poly import _RawPolynomial
+print(jvm.is_started)
+print(hasattr(jvm, "__wrapped__"), hasattr(_RawPolynomial, "__wrapped__"))
+print(jvm.is_started)
+a = donuts.Polynomial("1+x")
+print(jvm.is_started)
+"""
+    assert run_python(code).split() == ["False", "False", "False", "False", "True"]
+
+
+def test_start() -> None:
+    donuts.start()
+    assert jvm.is_started
+    # Calling it again must be harmless.
+    donuts.start()
+    assert jvm.is_started
+
+
+def test_configure() -> None:
+    code = """
+import donuts
+from donuts.jvm import jvm
+donuts.configure(heap="123m", gc="serial", options=["-Dfoo.bar=baz"])
+runtime = jvm.find_class("java.lang.Runtime").getRuntime()
+system = jvm.find_class("java.lang.System")
+print(runtime.maxMemory() // 2**20)
+print(system.getProperty("foo.bar"))
+"""
+    result = run_python(code).split()
+    assert 100 <= int(result[0]) <= 123
+    assert result[1] == "baz"
+
+
+def test_configure_env() -> None:
+    code = """
+import os
+os.environ["DONUTS_PYTHON_JVM_OPTS"] = "-Dfoo.bar=qux"
+import donuts
+from donuts.jvm import jvm
+donuts.configure(options=["-Dfoo.bar=baz"])
+print(jvm.find_class("java.lang.System").getProperty("foo.bar"))
+"""
+    assert run_python(code) == "qux"
+
+
+def test_configure_error() -> None:
+    donuts.start()
+
+    with pytest.raises(RuntimeError, match="JVM already started"):
+        donuts.configure(heap="1g")
+
+    code = """
+import donuts
+try:
+    donuts.configure(gc="unknown")
+except ValueError as e:
+    print(e)
+"""
+    assert run_python(code) == "unknown garbage collector: `unknown`"
+
+
+def test_array_items() -> None:
+    from donuts.array import _create_raw_int_array
+
+    # More than one chunk of pipelined commands for Py4J.
+    values = list(range(-1000, 1000))
+    array = _create_raw_int_array(values)
+    assert jvm.get_array_items(array) == values
+
+
+def test_call_many() -> None:
+    a = donuts.Polynomial("(1+x)^2")
+    b = donuts.Polynomial("(1+x)*(1-y)")
+    c, d = jvm.call_many(((a._raw.gcd, (b._raw,)), (a._raw.toString, ())))
+    assert donuts.Polynomial._new(c) == donuts.Polynomial("1+x")
+    assert str(d) == "1+2*x+x^2"
+
+
+def test_py4j_without_pipelining(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = jvm.start()
+    if not hasattr(backend, "_pipelined"):
+        pytest.skip("not Py4J")
+    # The plain calls, used when the Py4J internals are not available.
+    monkeypatch.setattr(backend, "_pipelined", False)
+    test_array_items()
+    test_call_many()
+    assert donuts.Polynomial("(1+x)^2").coeff_dict("x") == {(0,): 1, (1,): 2, (2,): 1}
+
+
+def test_shared_gateway() -> None:
+    pytest.importorskip("py4j")
+
+    launcher = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "donuts.gateway"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    try:
+        assert launcher.stdout is not None
+        env = dict(os.environ)
+        for _ in range(3):
+            key, value = launcher.stdout.readline().strip().split("=", 1)
+            env[key] = value
+
+        code = """
+import sys
+
+import donuts
+from donuts.jvm import jvm
+system = jvm.find_class("java.lang.System")
+print(system.getProperty("donuts.test"))
+system.setProperty("donuts.test", sys.argv[1])
+print(donuts.Polynomial("(1+x)^2"))
+"""
+
+        def run(arg: str) -> List[str]:
+            result = subprocess.run(  # noqa: S603
+                [sys.executable, "-c", code, arg],
+                check=True,
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+                env=env,
+            )
+            return result.stdout.split()
+
+        # The second process sees the property set by the first one.
+        assert run("a") == ["None", "1+2*x+x^2"]
+        assert run("b") == ["a", "1+2*x+x^2"]
+    finally:
+        launcher.terminate()
+        launcher.wait()
@@ -0,0 +1,27 @@
+import os
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+from conftest import Benchmark
+
+from donuts.jvm import _cds_options
+
+# From importing the package to the first result in a fresh process.
+CODE = "import donuts; donuts.Polynomial('(1+x+y)^3*(2-z)').factors"
+
+
+def run_python(cds: bool) -> None:
+    env = dict(os.environ, DONUTS_PYTHON_CDS="1" if cds else "0")
+    subprocess.run([sys.executable, "-c", CODE], check=True, env=env)  # noqa: S603
+
+
+def test_startup(benchmark: Benchmark) -> None:
+    benchmark(run_python, False)
+
+
+@pytest.mark.skipif(
+    not _cds_options(), reason="CDS archive not available (invoke build --cds)"
+)
+def test_startup_cds(benchmark: Benchmark) -> None:
+    benchmark(run_python, True)
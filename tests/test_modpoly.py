@@ -0,0 +1,177 @@
+from pickle import dumps, loads
+
+import pytest
+
+from donuts import ModPolynomial, Polynomial, Variable
+
+P = 1000003
+
+
+def test_init() -> None:
+    a = ModPolynomial(0, P)
+    assert a.is_zero
+    assert str(a) == "0"
+
+    a = ModPolynomial(-1, P)
+    assert a == P - 1
+    assert a.as_integer == P - 1
+
+    a = ModPolynomial(2**100, P)
+    assert a.as_integer == pow(2, 100, P)
+
+    a = ModPolynomial("(1+x)^2-2*x", 7)
+    assert a == ModPolynomial("1+x^2", 7)
+    assert a.modulus == 7
+
+    a = ModPolynomial(Variable("x"), 7)
+    assert str(a) == "x"
+
+    a = Polynomial("-3*x+10*y^2-7").mod(7)
+    assert str(a) == "4*x+3*y^2"
+    assert len(a) == 2
+    assert ModPolynomial(a, 7) == a
+    assert repr(a) == "ModPolynomial('4*x+3*y^2', 7)"
+
+    with pytest.raises(ValueError, match="prime"):
+        ModPolynomial(1, 4)
+    with pytest.raises(ValueError, match="prime"):
+        ModPolynomial(1, 1)
+    with pytest.raises(ValueError, match="prime"):
+        ModPolynomial(1, 2**62 + 135)
+    with pytest.raises(ValueError, match="different moduli"):
+        ModPolynomial(a, 11)
+    with pytest.raises(TypeError):
+        ModPolynomial(1, "7")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        ModPolynomial(1.0, 7)  # type: ignore[arg-type]
+
+
+def test_lift() -> None:
+    p = Polynomial("(1+x)^3*(2-y)-15*z")
+    a = p.mod(P)
+    b = a.lift()
+    assert all(0 <= c < P for _, c in b.iter_terms())
+    assert b != p
+    assert b.mod(P) == a
+    assert a.lift(symmetric=True) == p
+    assert a.lift(True).mod(P) == a
+
+
+def test_state() -> None:
+    a = Polynomial("(1+x)^3*(2-y)-15").mod(P)
+    b = loads(dumps(a))
+    assert a == b
+    assert b.modulus == P
+
+
+def test_hash() -> None:
+    a = ModPolynomial("x+y-y", 7)
+    b = ModPolynomial("x", 7)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b, ModPolynomial("x+7", 7)}) == 1
+
+
+def test_arith() -> None:
+    p1 = Polynomial("(1+x)^3-y")
+    p2 = Polynomial("2*x-3*z+5")
+    a = p1.mod(7)
+    b = p2.mod(7)
+
+    assert +a == a
+    assert -a == (-p1).mod(7)
+    assert a + b == (p1 + p2).mod(7)
+    assert a - b == (p1 - p2).mod(7)
+    assert a * b == (p1 * p2).mod(7)
+    assert a**3 == (p1**3).mod(7)
+    assert a**0 == 1
+
+    assert a + 8 == (p1 + 1).mod(7)
+    assert 8 + a == (p1 + 1).mod(7)
+    assert a - p2 == (p1 - p2).mod(7)
+    assert p2 - a == (p2 - p1).mod(7)
+    assert a * Variable("w") == (p1 * Variable("w")).mod(7)
+    assert Variable("w") * a == (p1 * Variable("w")).mod(7)
+    assert a * 7 == 0
+
+    with pytest.raises(ValueError, match="different moduli"):
+        a + ModPolynomial(1, 11)
+    with pytest.raises(ValueError, match="negative power"):
+        a**-1
+    with pytest.raises(TypeError):
+        a + 1.0  # type: ignore[operator]
+
+
+def test_variables() -> None:
+    a = ModPolynomial("x+y-z+z", 7)
+    assert a.variables == {Variable("x"), Variable("y"), Variable("z")}
+    assert a.min_variables == {Variable("x"), Variable("y")}
+    assert a.degree() == 1
+
+
+def test_divide_exact() -> None:
+    a = ModPolynomial("(1+x)*(2-y)", 7)
+    assert a.divide_exact(Polynomial("1+x")) == ModPolynomial("2-y", 7)
+    assert a.divide_exact(3) * 3 == a
+
+    with pytest.raises(ZeroDivisionError):
+        a.divide_exact(7)
+    with pytest.raises(ValueError, match="not divisible"):
+        a.divide_exact(Polynomial("1+y"))
+
+
+def test_gcd() -> None:
+    g = Polynomial("1+x+2*y*z")
+    a = (g * Polynomial("(3-x)*(1-z)")).mod(P)
+    b = (g * Polynomial("(3+x)*(1+y)^2")).mod(P)
+    # The result is monic, with respect to the leading term y*z.
+    assert a.gcd(b) * 2 == g.mod(P)
+    assert ModPolynomial("2*x+4", 7).gcd(Polynomial("x^2-4")) == ModPolynomial("x+2", 7)
+
+
+def test_factors() -> None:
+    a = Polynomial("3*(x^2-1)*(x-y)^2").mod(5)
+    factors = a.factors
+    assert len(factors) == 5
+    assert factors[0] == 3
+    assert set(factors[1:]) == {
+        ModPolynomial("x+1", 5),
+        ModPolynomial("x-1", 5),
+        ModPolynomial("x-y", 5),
+    }
+
+    # x^2 + 1 is irreducible over the integers but not modulo 5.
+    assert len(ModPolynomial("x^2+1", 5).factors) == 2
+
+    assert ModPolynomial(0, 5).factors == (ModPolynomial(0, 5),)
+    assert ModPolynomial(3, 5).factors == (ModPolynomial(3, 5),)
+
+
+def test_subs() -> None:
+    p = Polynomial("(1+x)^3*(2-y)")
+    a = p.mod(7)
+    assert a.subs("x", "y+z") == p.subs("x", "y+z").mod(7)
+    assert a.subs(Variable("y"), 9) == p.subs("y", 2).mod(7)
+    assert a.subs("w", 1) == a
+
+    with pytest.raises(TypeError):
+        a.subs(Polynomial("x"), 1)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="different moduli"):
+        a.subs("x", ModPolynomial(1, 11))
+
+
+def test_evaluate() -> None:
+    p = Polynomial("(1+x)^3*(2-y)+z")
+    a = p.mod(P)
+    assert a.evaluate("x", 3) == p.evaluate("x", 3).mod(P)
+    assert a.evaluate(Variable("x"), 2**70) == p.evaluate("x", 2**70).mod(P)
+    assert a.evaluate(["x", "y", "z"], [1, 2, 3]).as_integer == 3
+    assert a.evaluate(["x", "w"], [-1, 5]) == ModPolynomial("z", P)
+    assert a.evaluate([], []) == a
+
+    with pytest.raises(ValueError, match="different sizes"):
+        a.evaluate(["x", "y"], [1])
+    with pytest.raises(TypeError):
+        a.evaluate("x", "1")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="not an integer"):
+        a.evaluate("x", 1).as_integer
@@ -0,0 +1,39 @@
+from conftest import Benchmark, random_poly
+
+P = 2**61 - 1
+
+
+def test_modpoly_mul(benchmark: Benchmark) -> None:
+    p1 = random_poly(nterms=100, seed=1).mod(P)
+    p2 = random_poly(nterms=100, seed=2).mod(P)
+    result = benchmark(lambda a, b: a * b, p1, p2)
+    assert result
+
+
+def test_modpoly_gcd(benchmark: Benchmark) -> None:
+    g = random_poly(nterms=10)
+    p1 = (g * random_poly(nterms=10, seed=1)).mod(P)
+    p2 = (g * random_poly(nterms=10, seed=2)).mod(P)
+    result = benchmark(lambda a, b: a.gcd(b), p1, p2)
+    assert result
+
+
+def test_modpoly_factor(benchmark: Benchmark) -> None:
+    p1 = random_poly(nterms=4, seed=1)
+    p2 = random_poly(nterms=5, seed=2)
+    p3 = random_poly(nterms=5, seed=3)
+    p = (p1 * p2 * p3).mod(P)
+    result = benchmark(lambda a: a.factors, p)
+    assert len(result) >= 3
+
+
+def test_modpoly_from_poly(benchmark: Benchmark) -> None:
+    p = random_poly(nterms=1000)
+    result = benchmark(lambda a: a.mod(P), p)
+    assert result
+
+
+def test_modpoly_lift(benchmark: Benchmark) -> None:
+    p = random_poly(nterms=1000).mod(P)
+    result = benchmark(lambda a: a.lift(True), p)
+    assert result
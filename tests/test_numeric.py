@@ -0,0 +1,79 @@
+from typing import List, Union
+
+import pytest
+
+from donuts import Polynomial, PolynomialLike, RationalFunction, Variable, compile_many
+
+
+def test_compile() -> None:
+    np = pytest.importorskip("numpy")
+
+    rng = np.random.default_rng(1)
+    x, y, z = rng.uniform(-2, 2, size=(3, 100))
+
+    p = Polynomial("(1+x-2*y)^3*z+x^5-12345678901234567890")
+    f = p.compile(["x", "y", "z"])
+    expected = (1 + x - 2 * y) ** 3 * z + x**5 - 12345678901234567890
+    assert np.allclose(f(x, y, z), expected)
+    assert f(1, 2, 3) == pytest.approx(
+        p.evaluate(["x", "y", "z"], [1, 2, 3]).as_integer
+    )
+
+    # Complex numbers, broadcast with scalars.
+    w = x + 1j * y
+    assert np.allclose(f(w, 2.0, z), (1 + w - 4) ** 3 * z + w**5 - 12345678901234567890)
+
+    r = RationalFunction("(1+x)^2/(x-y)/3")
+    g = r.compile([Variable("y"), "x"])
+    assert np.allclose(g(y, x), (1 + x) ** 2 / (x - y) / 3)
+
+    # Variables that the expression does not depend on are fine.
+    assert np.allclose(Polynomial("x^10").compile(["w", "x"])(y, x), x**10)
+
+    # Constants are broadcast.
+    assert Polynomial(0).compile(["x"])(x).shape == (100,)
+    assert RationalFunction("1/3").compile(["x", "y"])(x, 1.0) == pytest.approx(
+        np.full(100, 1 / 3)
+    )
+    assert RationalFunction(5).compile([])() == 5
+
+    # The arguments are not returned as they are.
+    a = Polynomial("x").compile(["x"])(x)
+    assert a is not x
+    assert np.array_equal(a, x)
+
+    with pytest.raises(ValueError, match="depends on other variables"):
+        p.compile(["x", "y"])
+    with pytest.raises(ValueError, match="depends on other variables"):
+        r.compile(["x"])
+    with pytest.raises(ValueError, match="duplicate"):
+        p.compile(["x", "y", "z", "x"])
+    with pytest.raises(ValueError, match="backend"):
+        p.compile(["x", "y", "z"], backend="cuda")
+    with pytest.raises(TypeError):
+        p.compile([1])  # type: ignore[list-item]
+
+
+def test_compile_many() -> None:
+    np = pytest.importorskip("numpy")
+
+    rng = np.random.default_rng(2)
+    x, y = rng.uniform(0.5, 2, size=(2, 100))
+
+    exprs: List[Union[RationalFunction, PolynomialLike, str]] = [
+        Polynomial("(x+y)^20"),
+        RationalFunction("(x+y)^20/(1+x^2)"),
+        Variable("y"),
+        -3,
+        "x^2-y^2",
+    ]
+    f = compile_many(exprs, ["x", "y"])
+    results = f(x, y)
+    assert len(results) == 5
+    assert np.allclose(results[0], (x + y) ** 20)
+    assert np.allclose(results[1], (x + y) ** 20 / (1 + x**2))
+    assert np.allclose(results[2], y)
+    assert np.allclose(results[3], -3)
+    assert np.allclose(results[4], x**2 - y**2)
+
+    assert compile_many([], ["x"])(x) == ()
@@ -0,0 +1,50 @@
+from typing import Any
+
+import pytest
+from conftest import Benchmark, random_poly
+
+from donuts import Polynomial, compile_many
+
+VARIABLES = ["x" + str(i) for i in range(1, 11)]
+
+
+def test_poly_compile(benchmark: Benchmark) -> None:
+    pytest.importorskip("numpy")
+    p = random_poly(nterms=1000)
+    result = benchmark(p.compile, VARIABLES)
+    assert callable(result)
+
+
+def test_poly_compiled_100000(benchmark: Benchmark) -> None:
+    np = pytest.importorskip("numpy")
+    p = random_poly(nterms=100)
+    f = p.compile(VARIABLES)
+    points = np.random.default_rng(42).uniform(-1, 1, size=(10, 100000))
+    result = benchmark(f, *points)
+    assert result.shape == (100000,)
+
+
+def test_poly_naive_100000(benchmark: Benchmark) -> None:
+    # Term-by-term evaluation, for comparison.
+    np = pytest.importorskip("numpy")
+    p = random_poly(nterms=100)
+    points = np.random.default_rng(42).uniform(-1, 1, size=(10, 100000))
+
+    def evaluate(a: Polynomial) -> Any:
+        exponents, coefficients = a.to_arrays(VARIABLES)
+        result = np.zeros(points.shape[1])
+        for e, c in zip(exponents, coefficients):
+            result += float(c) * np.prod(points ** e[:, np.newaxis], axis=0)
+        return result
+
+    result = benchmark(evaluate, p)
+    assert result.shape == (100000,)
+
+
+def test_poly_compile_many_100000(benchmark: Benchmark) -> None:
+    np = pytest.importorskip("numpy")
+    exprs = [random_poly(nterms=20, seed=seed) for seed in range(5)]
+    f = compile_many(exprs, VARIABLES)
+    points = np.random.default_rng(42).uniform(-1, 1, size=(10, 100000))
+    result = benchmark(f, *points)
+    assert len(result) == 5
@@ -1,4 +1,7 @@
+import io
+from array import array
 from fractions import Fraction
+from pathlib import Path
 from pickle import dumps, loads
 from typing import List, Union
 
@@ -47,6 +50,126 @@ def test_init_with_bigints(bigints: BigIntSeq) -> None:
         assert a == b
 
 
+def test_from_arrays() -> None:
+    a = Polynomial.from_arrays(["x", "y"], [[2, 0], [1, 1], [0, 0]], [3, -2, 1])
+    assert a == Polynomial("3*x^2-2*x*y+1")
+    assert a.variables == VariableSet("x", "y")
+
+    # Terms with the same exponents are summed up.
+    a = Polynomial.from_arrays(["x"], [[1], [0], [1]], [1, 1, -1])
+    assert a == 1
+
+    # Big coefficients.
+    n = 2**100 + 1
+    a = Polynomial.from_arrays([Variable("x")], [(1,), (0,)], [n, -n])
+    assert a == Polynomial(f"{n}*x-{n}")
+
+    # Unused variables are kept.
+    a = Polynomial.from_arrays(["z", "y", "x"], [[0, 0, 3]], [1])
+    assert a == Polynomial("x^3")
+    assert a.variables == VariableSet("x", "y", "z")
+
+    assert Polynomial.from_arrays([], [[]], [5]) == 5
+    assert Polynomial.from_arrays(["x"], [], []) == 0
+
+    with pytest.raises(ValueError, match="number of terms"):
+        Polynomial.from_arrays(["x"], [[1], [2]], [1])
+
+    with pytest.raises(ValueError, match="matrix"):
+        Polynomial.from_arrays(["x", "y"], [[1], [2]], [1, 2])
+
+    with pytest.raises(ValueError, match="out of range"):
+        Polynomial.from_arrays(["x"], [[-1]], [1])
+
+    with pytest.raises(ValueError, match="invalid arrays"):
+        Polynomial.from_arrays(["x", "x"], [[1, 1]], [1])
+
+    with pytest.raises(TypeError):
+        Polynomial.from_arrays(["x"], [[1.5]], [1])
+
+    with pytest.raises(TypeError):
+        Polynomial.from_arrays(["x"], [[1]], ["1"])
+
+
+def test_from_arrays_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    e = np.array([[2, 0], [1, 1], [0, 0]], dtype=np.int64)
+    a = Polynomial.from_arrays(["x", "y"], e, np.array([3, -2, 1], dtype=np.int32))
+    assert a == Polynomial("3*x^2-2*x*y+1")
+
+    c = np.array([2**64 - 1, 1], dtype=np.uint64)
+    a = Polynomial.from_arrays(["x"], e[1:, :1], c)
+    assert a == Polynomial(f"{2**64 - 1}*x+1")
+
+    c = np.array([2**100, -1], dtype=object)
+    a = Polynomial.from_arrays(["x"], e[1:, :1], c)
+    assert a == Polynomial(f"{2**100}*x-1")
+
+    with pytest.raises(ValueError, match="matrix"):
+        Polynomial.from_arrays(["x", "y"], np.zeros(4, dtype=np.int32), np.ones(2))
+
+    with pytest.raises(TypeError):
+        Polynomial.from_arrays(["x"], np.ones((1, 1)), [1])
+
+
+def test_to_arrays() -> None:
+    pytest.importorskip("numpy")
+
+    a = Polynomial("(1+x-2*y)^3")
+    e, c = a.to_arrays()
+    assert e.shape == (10, 2)
+    assert c.dtype.kind == "i"
+    assert Polynomial.from_arrays(["x", "y"], e, c) == a
+
+    # Columns for the given variables.
+    e, c = a.to_arrays(["y", "z", "x"])
+    assert e.shape == (10, 3)
+    assert not e[:, 1].any()
+    assert Polynomial.from_arrays(["y", "z", "x"], e, c) == a
+
+    # Big coefficients.
+    a = Polynomial("(2^70+x)^2-3")
+    e, c = a.to_arrays()
+    assert c.dtype.kind == "O"
+    assert Polynomial.from_arrays(["x"], e, c) == a
+
+    e, c = Polynomial(0).to_arrays()
+    assert e.shape == (0, 0)
+    assert c.shape == (0,)
+
+    e, c = Polynomial(-(2**64)).to_arrays(["x"])
+    assert e.tolist() == [[0]]
+    assert c.tolist() == [-(2**64)]
+
+    with pytest.raises(ValueError, match="depends on other variables"):
+        Polynomial("x+y").to_arrays(["x"])
+
+
+def test_iter_terms() -> None:
+    a = Polynomial("(1+x-2*y)^3+2^70*z")
+    terms = list(a.iter_terms())
+    assert len(terms) == len(a)
+    assert ((0, 1, 0), -6) in terms
+    assert ((0, 0, 1), 2**70) in terms
+    assert sum(Polynomial(f"{c}*x^{i}*y^{j}*z^{k}") for (i, j, k), c in terms) == a
+
+    # Columns for the given variables, in small chunks.
+    for chunk_size in (1, 2, 11, 100):
+        terms = list(a.iter_terms(["z", "w", "x", "y"], chunk_size=chunk_size))
+        assert len(terms) == len(a)
+        assert ((0, 0, 0, 1), -6) in terms
+
+    assert list(Polynomial(0).iter_terms()) == []
+    assert list(Polynomial(-(2**64)).iter_terms(["x"])) == [((0,), -(2**64))]
+
+    with pytest.raises(ValueError, match="depends on other variables"):
+        Polynomial("x+y").iter_terms(["x"])
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        a.iter_terms(chunk_size=0)
+
+
 def test_state() -> None:
     a = Polynomial("(1+x+y)^3")
     s = dumps(a)
@@ -54,6 +177,87 @@ def test_state() -> None:
     assert a == b
     assert a + b == a * 2
 
+    # Big coefficients and unused variables.
+    a = Polynomial("(123456789012345678901234567890 - 2^70 * x)^3 - z^2 * y")
+    a = a.evaluate("z", 0)
+    b = loads(dumps(a))
+    assert a == b
+    assert a.variables == b.variables
+
+    # The state in older versions.
+    b = Polynomial.__new__(Polynomial)
+    b.__setstate__(str(a))
+    assert a == b
+
+
+def test_write_read(tmp_path: Path) -> None:
+    for a in (
+        Polynomial(0),
+        Polynomial(-(2**70)),
+        Polynomial("(1+x-2*y)^5-2^70*z"),
+    ):
+        path = tmp_path / "a.txt"
+        a.write(path)
+        assert path.read_text() == str(a)
+        assert Polynomial.read(path) == a
+        assert Polynomial.read(str(path)) == a
+
+        f = io.StringIO()
+        a.write(f)
+        assert f.getvalue() == str(a)
+
+        g = io.BytesIO()
+        a.write(g)
+        assert g.getvalue() == str(a).encode()
+
+    # Parenthesized subexpressions.
+    path = tmp_path / "b.txt"
+    path.write_text("-2*x*(1+y)^2 - (x^2-1)/(x-1)*(y)^(1+1)\n")
+    assert Polynomial.read(path) == Polynomial("-2*x*(1+y)^2-(x+1)*y^2")
+
+    for s in ("", "1+", "(1+x", "x/2", "2*(1+x)y"):
+        path.write_text(s)
+        with pytest.raises(ValueError, match="invalid text for polynomial"):
+            Polynomial.read(path)
+
+    with pytest.raises(FileNotFoundError):
+        Polynomial.read(tmp_path / "none.txt")
+
+
+def test_parse_many() -> None:
+    strings = ["0", "1+x", "(1+x-2*y)^5-2^70*z", "1+\nx"]
+    expected = [Polynomial(s) for s in strings]
+    assert Polynomial.parse_many(strings) == expected
+    assert Polynomial.parse_many(iter(strings), parallel=True) == expected
+    assert Polynomial.parse_many(strings[:3]) == expected[:3]
+
+    # One expression per line.
+    assert Polynomial.parse_many("1+x\r\n\n2*y\n", errors="ignore") == [
+        Polynomial("1+x"),
+        None,
+        Polynomial("2*y"),
+    ]
+    assert Polynomial.parse_many("") == []
+    assert Polynomial.parse_many([]) == []
+
+    strings = [f"(1+x)^{i % 10}" if i % 3 else "x/2" for i in range(300)]
+    result = Polynomial.parse_many(strings, errors="ignore", parallel=True)
+    assert result == [
+        Polynomial(f"(1+x)^{i % 10}") if i % 3 else None for i in range(300)
+    ]
+
+    with pytest.raises(ValueError, match="at index 1"):
+        Polynomial.parse_many(["x", "x/2"])
+
+    with pytest.raises(ValueError, match="at index 2"):
+        Polynomial.parse_many("x\ny\n1/0\n")
+
+    with pytest.raises(ValueError, match="invalid errors"):
+        Polynomial.parse_many(["x"], errors="replace")
+
+    with pytest.raises(TypeError):
+        Polynomial.parse_many(["x", 1])  # type: ignore[list-item]
+
 
 def test_repr() -> None:
     a = Polynomial("1+x")
@@ -423,6 +627,10 @@ def test_coeff() -> None:
     assert a.coeff(["x", "y"], [1, 2]) == 3
     assert a.coeff(["x", "y"], [2, 2]) == 0
 
+    # Exponents beyond 32 bits.
+    assert a.coeff("x", 2**31) == 0
+    assert a.coeff(["x", "y"], [0, 2**100]) == 0
+
     with pytest.raises(TypeError):
         a.coeff(1, 1)  # type: ignore[call-overload]  # x must be a variable
 
@@ -664,6 +872,98 @@ def test_evaluate() -> None:
         a.evaluate([1], [1])  # type: ignore[list-item]  # not variables
 
 
+def test_evaluate_with_bigints(bigints: BigIntSeq) -> None:
+    p = Polynomial("(1+x+y)^3*z")
+    for n in bigints:
+        a = p.evaluate("x", n)
+        b = Polynomial(f"(1+({n})+y)^3*z")
+        assert a == b
+
+        a = p.evaluate(["x", "y"], [n, -n])
+        b = Polynomial("z")
+        assert a == b
+
+        a = p.shift("x", n)
+        b = Polynomial(f"(1+x+({n})+y)^3*z")
+        assert a == b
+
+        a = p.shift(["x", "z"], [-n, n])
+        b = Polynomial(f"(1+x-({n})+y)^3*(z+({n}))")
+        assert a == b
+
+
+def test_evaluate_with_arrays() -> None:
+    p = Polynomial("(1+x+y)^3*z")
+
+    a = p.evaluate(["x", "y"], array("b", [3, -2]))
+    b = Polynomial("8*z")
+    assert a == b
+
+    a = p.shift(["x", "y"], array("q", [3, -2]))
+    b = Polynomial("(2+x+y)^3*z")
+    assert a == b
+
+    a = p.coeff(["x", "y", "z"], array("i", [3, 0, 1]))
+    assert a == 1
+
+    with pytest.raises(TypeError):
+        p.evaluate(["x"], array("d", [1.0]))  # type: ignore[arg-type]
+
+    np = pytest.importorskip("numpy")
+
+    a = p.evaluate(["x", "y"], np.array([3, -2], dtype=np.int64))
+    b = Polynomial("8*z")
+    assert a == b
+
+    a = p.shift(["x", "y"], np.array([3, -2], dtype=np.int16))
+    b = Polynomial("(2+x+y)^3*z")
+    assert a == b
+
+    a = p.coeff(["x", "y", "z"], np.array([3, 0, 1], dtype=np.uint8))
+    assert a == 1
+
+    with pytest.raises(TypeError):
+        p.evaluate(["x"], np.array([1.0]))
+
+    a = p.evaluate(["x"], np.array([2**40], dtype=np.int64))
+    b = Polynomial(f"({2**40 + 1}+y)^3*z")
+    assert a == b
+
+
+def test_evaluate_many() -> None:
+    np = pytest.importorskip("numpy")
+
+    p = Polynomial("(1+x-2*y)^3+5*z*x")
+    points = [[1, 2, 3], [0, 0, 0], [-4, 7, 2**40]]
+    a = p.evaluate_many(["x", "y", "z"], points)
+    assert a.dtype.kind == "i"
+    assert a.tolist() == [p.evaluate(["x", "y", "z"], v).as_integer for v in points]
+
+    # Big values.
+    points = [[2**40, 1, 1], [1, 2**70, 0]]
+    a = p.evaluate_many(["x", "y", "z"], np.array(points, dtype=object))
+    assert a.dtype.kind == "O"
+    assert a.tolist() == [p.evaluate(["x", "y", "z"], v).as_integer for v in points]
+
+    # Columns for the given variables, on multiple threads.
+    grid = np.arange(4000).reshape(1000, 4) % 7 - 3
+    a = p.evaluate_many(["w", "z", "y", "x"], grid, parallel=True)
+    assert a[10] == p.evaluate(["z", "y", "x"], grid[10, 1:]).as_integer
+    assert len(a) == 1000
+
+    assert Polynomial(7).evaluate_many([], [[], []]).tolist() == [7, 7]
+    assert p.evaluate_many(["x", "y", "z"], np.zeros((0, 3), dtype=int)).shape == (0,)
+
+    with pytest.raises(ValueError, match="depends on other variables"):
+        p.evaluate_many(["x", "y"], [[1, 2]])
+    with pytest.raises(ValueError, match="duplicate"):
+        p.evaluate_many(["x", "x", "y", "z"], [[1, 1, 2, 3]])
+    with pytest.raises(ValueError, match="matrix"):
+        p.evaluate_many(["x", "y", "z"], [[1, 2]])
+    with pytest.raises(TypeError):
+        p.evaluate_many(["x", "y", "z"], [[1, 2, 3.0]])
+
+
 def test_evaluate_at_zero() -> None:
     a: PolynomialLike
     b: PolynomialLike
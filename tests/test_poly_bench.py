@@ -1,7 +1,11 @@
 import pickle
+from pathlib import Path
+from typing import Any, List
 
+import pytest
 from conftest import Benchmark, random_poly
 
+import donuts
 from donuts import Polynomial, Variable
 
 
@@ -18,6 +22,134 @@ def test_poly_from_string(benchmark: Benchmark) -> None:
     assert result
 
 
+@pytest.mark.usefixtures("_no_parse_cache")
+def test_poly_from_short_string_uncached(benchmark: Benchmark) -> None:
+    result = benchmark(Polynomial, "s-t")
+    assert result
+
+
+def test_poly_from_short_string(benchmark: Benchmark) -> None:
+    result = benchmark(Polynomial, "s-t")
+    assert result
+
+
+def test_poly_from_strings_1000(benchmark: Benchmark) -> None:
+    strings = [str(random_poly(nterms=10, seed=i)) for i in range(1000)]
+    result = benchmark(lambda: [Polynomial(s) for s in strings])
+    assert len(result) == 1000
+
+
+def test_poly_parse_many_1000(benchmark: Benchmark) -> None:
+    strings = [str(random_poly(nterms=10, seed=i)) for i in range(1000)]
+    result = benchmark(Polynomial.parse_many, strings)
+    assert result == [Polynomial(s) for s in strings]
+
+
+def test_poly_parse_many_parallel_1000(benchmark: Benchmark) -> None:
+    strings = [str(random_poly(nterms=10, seed=i)) for i in range(1000)]
+    result = benchmark(Polynomial.parse_many, strings, parallel=True)
+    assert result == [Polynomial(s) for s in strings]
+
+
+def test_poly_from_arrays(benchmark: Benchmark) -> None:
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(42)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    exponents = rng.integers(0, 5, size=(1000, 10), dtype=np.int32)
+    coefficients = rng.integers(-(2**31), 2**31, size=1000, dtype=np.int64)
+    result = benchmark(Polynomial.from_arrays, variables, exponents, coefficients)
+    assert result
+
+
+def test_poly_from_arrays_string(benchmark: Benchmark) -> None:
+    # Constructing the same polynomial via a string, for comparison.
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(42)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    exponents = rng.integers(0, 5, size=(1000, 10), dtype=np.int32)
+    coefficients = rng.integers(-(2**31), 2**31, size=1000, dtype=np.int64)
+
+    def from_arrays(e: Any, c: Any) -> Polynomial:
+        return Polynomial(
+            "".join(
+                f"+{ci}" + "".join(f"*{v}^{n}" for v, n in zip(variables, ei) if n)
+                for ei, ci in zip(e.tolist(), c.tolist())
+            )
+        )
+
+    result = benchmark(from_arrays, exponents, coefficients)
+    assert result == Polynomial.from_arrays(variables, exponents, coefficients)
+
+
+def test_poly_to_arrays(benchmark: Benchmark) -> None:
+    pytest.importorskip("numpy")
+    p = random_poly(nterms=1000)
+    result = benchmark(p.to_arrays)
+    assert len(result[1]) == 1000
+
+
+def test_poly_coeff_dict(benchmark: Benchmark) -> None:
+    # Extracting the same terms via coeff_dict, for comparison.
+    p = random_poly(nterms=1000)
+    variables = sorted(p.variables)
+    result = benchmark(p.coeff_dict, variables)
+    assert len(result) == len(p)
+
+
+def test_poly_evaluate_100(benchmark: Benchmark) -> None:
+    p = random_poly(nvars=100, nterms=100)
+    variables = ["x" + str(i) for i in range(1, 101)]
+    values = list(range(100))
+    result = benchmark(p.evaluate, variables, values)
+    assert result.is_integer
+
+
+def test_poly_evaluate_big(benchmark: Benchmark) -> None:
+    p = random_poly(nterms=100)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    values = [2**100 + i for i in range(10)]
+    result = benchmark(p.evaluate, variables, values)
+    assert result.is_integer
+
+
+def test_poly_evaluate_big_subs(benchmark: Benchmark) -> None:
+    # Substituting big integers one by one, for comparison.
+    p = random_poly(nterms=100)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    values = [Polynomial(2**100 + i) for i in range(10)]
+
+    def evaluate(a: Polynomial) -> Polynomial:
+        for x, v in zip(variables, values):
+            a = a.subs(x, v)
+        return a
+
+    result = benchmark(evaluate, p)
+    assert result.is_integer
+
+
+def test_poly_evaluate_many_10000(benchmark: Benchmark) -> None:
+    np = pytest.importorskip("numpy")
+    p = random_poly(nterms=100)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    points = np.random.default_rng(42).integers(-100, 100, size=(10000, 10))
+    result = benchmark(p.evaluate_many, variables, points)
+    assert len(result) == 10000
+
+
+def test_poly_evaluate_10000(benchmark: Benchmark) -> None:
+    # Evaluating one by one, for comparison.
+    np = pytest.importorskip("numpy")
+    p = random_poly(nterms=100)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    points = np.random.default_rng(42).integers(-100, 100, size=(10000, 10))
+
+    def evaluate(a: Polynomial) -> List[int]:
+        return [a.evaluate(variables, x).as_integer for x in points]
+
+    result = benchmark(evaluate, p)
+    assert len(result) == 10000
+
+
 def test_poly_dumps(benchmark: Benchmark) -> None:
     p = random_poly(nterms=1000)
     result = benchmark(pickle.dumps, p)
@@ -31,6 +163,32 @@ def test_poly_loads(benchmark: Benchmark) -> None:
     assert result
 
 
+def test_poly_loads_str(benchmark: Benchmark) -> None:
+    # Unpickling the string state in older versions, for comparison.
+    p = random_poly(nterms=1000)
+    s = str(p)
+
+    def loads(state: str) -> Polynomial:
+        q = Polynomial.__new__(Polynomial)
+        q.__setstate__(state)
+        return q
+
+    result = benchmark(loads, s)
+    assert result
+
+
+def test_poly_from_bigint(benchmark: Benchmark) -> None:
+    n = 3**5000
+    result = benchmark(Polynomial, n)
+    assert result
+
+
+def test_poly_as_bigint(benchmark: Benchmark) -> None:
+    p = Polynomial(3**5000)
+    result = benchmark(lambda a: a.as_integer, p)
+    assert result == 3**5000
+
+
 def test_poly_bool(benchmark: Benchmark) -> None:
     p = random_poly(nterms=100)
     result = benchmark(lambda a: bool(a), p)
@@ -43,6 +201,24 @@ def test_poly_it(benchmark: Benchmark) -> None:
     assert len(result) == 10
 
 
+def test_poly_iter_terms(benchmark: Benchmark) -> None:
+    p = random_poly(nterms=10)
+    result = benchmark(lambda a: list(a.iter_terms()), p)
+    assert len(result) == 10
+
+
+def test_poly_it_1000(benchmark: Benchmark) -> None:
+    p = random_poly(nterms=1000)
+    result = benchmark(lambda a: list(a), p)
+    assert len(result) == len(p)
+
+
+def test_poly_iter_terms_1000(benchmark: Benchmark) -> None:
+    p = random_poly(nterms=1000)
+    result = benchmark(lambda a: list(a.iter_terms()), p)
+    assert len(result) == len(p)
+
+
 def test_poly_eq(benchmark: Benchmark) -> None:
     p1 = random_poly(nterms=100, seed=1)
     p2 = random_poly(nterms=120, seed=2)
@@ -64,6 +240,25 @@ def test_poly_mul(benchmark: Benchmark) -> None:
     assert result
 
 
+def test_poly_mul_small(benchmark: Benchmark) -> None:
+    p1 = Polynomial("1+x")
+    p2 = Polynomial("s-t")
+    result = benchmark(lambda a, b: a * b, p1, p2)
+    assert result
+
+
+def test_poly_mul_small_interned(benchmark: Benchmark) -> None:
+    p1 = Polynomial("1+x")
+    p2 = Polynomial("s-t")
+    donuts.set_interning(True)
+    try:
+        result = benchmark(lambda a, b: a * b, p1, p2)
+    finally:
+        donuts.set_interning(False)
+    assert result
+
+
+@pytest.mark.usefixtures("_no_result_cache")
 def test_poly_gcd(benchmark: Benchmark) -> None:
     g = random_poly(nterms=10)
     p1 = g * random_poly(nterms=10, seed=1)
@@ -72,6 +267,7 @@ def test_poly_gcd(benchmark: Benchmark) -> None:
     assert result
 
 
+@pytest.mark.usefixtures("_no_result_cache")
 def test_poly_gcd_trivial(benchmark: Benchmark) -> None:
     p1 = random_poly(nterms=100, seed=1)
     p2 = random_poly(nterms=100, seed=2)
@@ -79,6 +275,7 @@ def test_poly_gcd_trivial(benchmark: Benchmark) -> None:
     assert result
 
 
+@pytest.mark.usefixtures("_no_result_cache")
 def test_poly_factor(benchmark: Benchmark) -> None:
     p1 = random_poly(nterms=4, seed=1)
     p2 = random_poly(nterms=5, seed=2)
@@ -88,14 +285,66 @@ def test_poly_factor(benchmark: Benchmark) -> None:
     assert result
 
 
+@pytest.mark.usefixtures("_no_result_cache")
 def test_poly_factor_trivial(benchmark: Benchmark) -> None:
     p = random_poly(nterms=100)
     result = benchmark(lambda a: Polynomial(a).factors, p)
     assert result
 
 
+def test_poly_gcd_cached(benchmark: Benchmark) -> None:
+    g = random_poly(nterms=10)
+    p1 = g * random_poly(nterms=10, seed=1)
+    p2 = g * random_poly(nterms=10, seed=2)
+    result = benchmark(lambda a, b: a.gcd(b), p1, p2)
+    assert result
+
+
+def test_poly_factor_cached(benchmark: Benchmark) -> None:
+    p1 = random_poly(nterms=4, seed=1)
+    p2 = random_poly(nterms=5, seed=2)
+    p3 = random_poly(nterms=5, seed=3)
+    p = p1 * p2 * p3
+    result = benchmark(lambda a: Polynomial(a).factors, p)
+    assert result
+
+
 def test_poly_varsubs(benchmark: Benchmark) -> None:
     p = random_poly(nterms=10) + Polynomial("x1")
     x = Variable("x1")
     result = benchmark(lambda a, b: a.subs(b, 1), p, x)
     assert result
+
+
+def test_poly_str_large(benchmark: Benchmark, tmp_path: Path) -> None:
+    p = Polynomial("(1+x+y+z+w)^20")
+    path = tmp_path / "a.txt"
+
+    def f(a: Polynomial) -> None:
+        path.write_text(str(a))
+
+    benchmark(f, p)
+    assert Polynomial(path.read_text()) == p
+
+
+def test_poly_write_large(benchmark: Benchmark, tmp_path: Path) -> None:
+    p = Polynomial("(1+x+y+z+w)^20")
+    path = tmp_path / "a.txt"
+    benchmark(lambda a: a.write(path), p)
+    assert Polynomial.read(path) == p
+
+
+def test_poly_parse_large(benchmark: Benchmark, tmp_path: Path) -> None:
+    p = Polynomial("(1+x+y+z+w)^20")
+    path = tmp_path / "a.txt"
+    p.write(path)
+    result = benchmark(lambda: Polynomial(path.read_text()))
+    assert result == p
+
+
+def test_poly_read_large(benchmark: Benchmark, tmp_path: Path) -> None:
+    p = Polynomial("(1+x+y+z+w)^20")
+    path = tmp_path / "a.txt"
+    p.write(path)
+    result = benchmark(Polynomial.read, path)
+    assert result == p
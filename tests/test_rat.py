@@ -1,4 +1,6 @@
+import io
 from fractions import Fraction
+from pathlib import Path
 from pickle import dumps, loads
 from typing import Union
 
@@ -87,6 +89,59 @@ def test_state() -> None:
     assert a == b
     assert a + b == a * 2
 
+    a = RationalFunction("-(1-2^100*x)/(1+x+y)^2/3^50")
+    b = loads(dumps(a))
+    assert a == b
+
+    # The state in older versions.
+    b = RationalFunction.__new__(RationalFunction)
+    b.__setstate__(str(a))
+    assert a == b
+
+
+def test_write_read(tmp_path: Path) -> None:
+    for a in (
+        RationalFunction(0),
+        RationalFunction(-3, 2**70),
+        RationalFunction("(1+x+y)^3/(1-z-w)/2"),
+        RationalFunction("-x^2/(2*y)"),
+        RationalFunction("x/y^3"),
+    ):
+        path = tmp_path / "a.txt"
+        a.write(path)
+        assert path.read_text() == str(a)
+        assert RationalFunction.read(path) == a
+
+        f = io.StringIO()
+        a.write(f)
+        assert f.getvalue() == str(a)
+
+    path = tmp_path / "b.txt"
+    path.write_text("1/(1+x) + 1/(1-x)")
+    assert RationalFunction.read(path) == RationalFunction("2/(1-x^2)")
+
+    for s in ("", "1/", "1/0", "(1+x))"):
+        path.write_text(s)
+        with pytest.raises(ValueError, match="invalid text for rational function"):
+            RationalFunction.read(path)
+
+
+def test_parse_many() -> None:
+    strings = ["0", "-3/4", "(1+x+y)^3/(1-z-w)/2", "1/(1+x) + 1/(1-x)"]
+    expected = [RationalFunction(s) for s in strings]
+    assert RationalFunction.parse_many(strings) == expected
+    assert RationalFunction.parse_many(strings, parallel=True) == expected
+    assert RationalFunction.parse_many("\n".join(strings)) == expected
+
+    assert RationalFunction.parse_many(["x", "1/0", "1/"], errors="ignore") == [
+        RationalFunction("x"),
+        None,
+        None,
+    ]
+
+    with pytest.raises(ValueError, match="at index 1"):
+        RationalFunction.parse_many(["x", "1/0"])
+
 
 def test_repr() -> None:
     a = RationalFunction("(1+x)/(1+y)")
@@ -379,6 +434,14 @@ def test_as_fraction() -> None:
         b.as_fraction
 
 
+def test_as_fraction_with_bigints(bigints: BigIntSeq) -> None:
+    for m in bigints:
+        for n in bigints:
+            if n != 0:
+                a = RationalFunction(m, n)
+                assert a.as_fraction == Fraction(m, n)
+
+
 def test_as_polynomial() -> None:
     a: Union[PolynomialLike, str]
 
@@ -530,6 +593,65 @@ def test_evaluate() -> None:
         RationalFunction("(1+x+y)/(5-x-y)").evaluate(["x", "y"], [2, 3])
 
 
+def test_evaluate_with_bigints(bigints: BigIntSeq) -> None:
+    r = RationalFunction("(1+x)/(x-y)")
+    for n in bigints:
+        if n == 0:
+            continue
+
+        a = r.evaluate("x", n)
+        b = RationalFunction(f"(1+({n}))/(({n})-y)")
+        assert a == b
+
+        a = r.evaluate(["x", "y"], [n, -n])
+        b = RationalFunction(f"(1+({n}))/(2*({n}))")
+        assert a == b
+
+        a = r.shift("y", n)
+        b = RationalFunction(f"(1+x)/(x-y-({n}))")
+        assert a == b
+
+        a = r.shift(["x", "y"], [n, n])
+        b = RationalFunction(f"(1+x+({n}))/(x-y)")
+        assert a == b
+
+        with pytest.raises(ZeroDivisionError):
+            r.evaluate(["x", "y"], [n, n])
+
+
+def test_evaluate_mod() -> None:
+    np = pytest.importorskip("numpy")
+
+    p = 1000003
+    r = RationalFunction("(1+x-2*y)^3/(x-y)/(z+2)")
+    points = [[1, 2, 3], [2, 2, 5], [0, 0, p - 2], [2**70, 3, -1]]
+    a = r.evaluate_mod(p, ["x", "y", "z"], points)
+    assert a.dtype == np.uint64
+    assert a.mask.tolist() == [False, True, True, False]
+    for x, v in zip(points, a):
+        if v is not np.ma.masked:
+            b = r.evaluate(["x", "y", "z"], x)
+            assert (b.numerator - int(v) * b.denominator).as_integer % p == 0
+
+    # Columns for the given variables, on multiple threads.
+    grid = np.arange(4000).reshape(1000, 4) % 7 - 3
+    a = r.evaluate_mod(p, ["w", "z", "y", "x"], grid, parallel=True)
+    assert len(a) == 1000
+    assert a.mask.sum() == sum(x == y or z == -2 for _, z, y, x in grid)
+
+    a = RationalFunction("1/7").evaluate_mod(7, [], [[]])
+    assert a.mask.tolist() == [True]
+
+    with pytest.raises(ValueError, match="prime"):
+        r.evaluate_mod(4, ["x", "y", "z"], points)
+    with pytest.raises(ValueError, match="depends on other variables"):
+        r.evaluate_mod(p, ["x", "y"], [[1, 2]])
+    with pytest.raises(ValueError, match="duplicate"):
+        r.evaluate_mod(p, ["x", "x", "y", "z"], [[1, 1, 2, 3]])
+    with pytest.raises(ValueError, match="matrix"):
+        r.evaluate_mod(p, ["x", "y", "z"], [[1, 2]])
+
+
 def test_evaluate_at_zero() -> None:
     a = RationalFunction("(1+x)^3/(3-x-y)").evaluate_at_zero(Variable("x"))
     b = RationalFunction("1/(3-y)")
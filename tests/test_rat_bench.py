@@ -1,5 +1,7 @@
 import pickle
+from fractions import Fraction
 
+import pytest
 from conftest import Benchmark, random_rat
 
 from donuts import RationalFunction
@@ -31,6 +33,33 @@ def test_rat_loads(benchmark: Benchmark) -> None:
     assert result
 
 
+def test_rat_loads_str(benchmark: Benchmark) -> None:
+    # Unpickling the string state in older versions, for comparison.
+    r = random_rat(nterms=1000)
+    s = str(r)
+
+    def loads(state: str) -> RationalFunction:
+        q = RationalFunction.__new__(RationalFunction)
+        q.__setstate__(state)
+        return q
+
+    result = benchmark(loads, s)
+    assert result
+
+
+def test_rat_from_big_fraction(benchmark: Benchmark) -> None:
+    f = Fraction(3**5000, 2**5000 + 1)
+    result = benchmark(RationalFunction, f)
+    assert result
+
+
+def test_rat_as_big_fraction(benchmark: Benchmark) -> None:
+    f = Fraction(3**5000, 2**5000 + 1)
+    r = RationalFunction(f)
+    result = benchmark(lambda a: a.as_fraction, r)
+    assert result == f
+
+
 def test_rat_add(benchmark: Benchmark) -> None:
     r1 = random_rat(nterms=100, seed=1)
     r2 = random_rat(nterms=100, seed=2)
@@ -43,3 +72,12 @@ def test_rat_mul(benchmark: Benchmark) -> None:
     r2 = random_rat(nterms=100, seed=2)
     result = benchmark(lambda a, b: a * b, r1, r2)
     assert result
+
+
+def test_rat_evaluate_mod_10000(benchmark: Benchmark) -> None:
+    np = pytest.importorskip("numpy")
+    r = random_rat(nterms=50)
+    variables = ["x" + str(i) for i in range(1, 11)]
+    points = np.random.default_rng(42).integers(-100, 100, size=(10000, 10))
+    result = benchmark(r.evaluate_mod, 2**61 - 1, variables, points)
+    assert len(result) == 10000
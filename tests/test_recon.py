@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import pytest
+
+from donuts import ModPolynomial, RationalFunction, reconstruct
+
+
+def inverse(a: int, p: int) -> int:
+    return pow(a, p - 2, p)
+
+
+def blackbox_of(r: RationalFunction, variables: Sequence[str]) -> Callable[..., int]:
+    images: Dict[int, Tuple[ModPolynomial, ModPolynomial]] = {}
+
+    def blackbox(values: Tuple[int, ...], p: int) -> int:
+        if p not in images:
+            images[p] = (r.numerator.mod(p), r.denominator.mod(p))
+        num, den = images[p]
+        a = num.evaluate(variables, values).as_integer
+        b = den.evaluate(variables, values).as_integer
+        return a * inverse(b, p) % p
+
+    return blackbox
+
+
+def test_reconstruct() -> None:
+    def f1(x: Tuple[int, ...], p: int) -> int:
+        a, b, c = x
+        return (1 + a + b**2) ** 2 * inverse(2 * (a - b * c + 3), p) % p
+
+    r = reconstruct(f1, ["a", "b", "c"], seed=1)
+    assert r == RationalFunction("(1+a+b^2)^2/(a-b*c+3)/2")
+
+    # The denominator vanishes at the origin.
+    def f2(x: Tuple[int, ...], p: int) -> int:
+        a, b = x
+        return (a + b) * inverse(a * b, p) % p
+
+    assert reconstruct(f2, ["a", "b"], seed=2) == RationalFunction("(a+b)/(a*b)")
+
+    # The lowest orders at the origin cancel.
+    def f3(x: Tuple[int, ...], p: int) -> int:
+        a, b = x
+        return a * inverse(b, p) % p
+
+    assert reconstruct(f3, ["a", "b"], seed=3) == RationalFunction("a/b")
+
+    def f4(x: Tuple[int, ...], p: int) -> int:
+        a, b = x
+        return a * b * inverse(a + b, p) % p
+
+    assert reconstruct(f4, ["a", "b"], seed=4) == RationalFunction("a*b/(a+b)")
+
+    # Large coefficients need several primes.
+    f = RationalFunction("(x^3*y-12345678901234567890*z)/(1-x)")
+    assert reconstruct(blackbox_of(f, ["x", "y", "z"]), ["x", "y", "z"], seed=3) == f
+
+    assert reconstruct(lambda x, p: 7 * inverse(3, p) % p, []) == RationalFunction(
+        "7/3"
+    )
+    assert reconstruct(lambda x, p: 0, ["x"]).is_zero
+
+
+def test_reconstruct_batch() -> None:
+    calls = []
+
+    def f(points: List[Tuple[int, ...]], p: int) -> List[int]:
+        calls.append(len(points))
+        return [(x + y) ** 3 * inverse(1 + x * y, p) % p for x, y in points]
+
+    r = RationalFunction("(x+y)^3/(1+x*y)")
+    assert reconstruct(f, ["x", "y"], batch=True, chunk_size=64, seed=1) == r
+    assert calls
+    assert max(calls) <= 64
+
+    with ThreadPoolExecutor(2) as executor:
+        assert reconstruct(f, ["x", "y"], batch=True, executor=executor) == r
+
+
+def test_reconstruct_errors() -> None:
+    f: Any = lambda x, p: 1  # noqa: E731
+
+    with pytest.raises(ValueError, match="duplicate"):
+        reconstruct(f, ["x", "x"])
+    with pytest.raises(ValueError, match="chunk_size"):
+        reconstruct(f, ["x"], chunk_size=0)
+    with pytest.raises(TypeError):
+        reconstruct(f, [1])  # type: ignore[list-item]
+
+    # Not a rational function.
+    with pytest.raises(ValueError, match="max_degree"):
+        reconstruct(lambda x, p: pow(2, x[0], p), ["x"], max_degree=10)
+
+    # Too large coefficients.
+    with pytest.raises(ValueError, match="primes"):
+        reconstruct(lambda x, p: 2**200 % p, [], max_primes=2)
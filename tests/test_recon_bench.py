@@ -0,0 +1,17 @@
+from typing import Tuple
+
+from conftest import Benchmark
+
+from donuts import reconstruct
+
+
+def blackbox(x: Tuple[int, ...], p: int) -> int:
+    a, b, c, d = x
+    num = (a + b) ** 5 * (c - d) + 12345 * a * b * c * d
+    den = (1 - a * b * c * d) ** 2 * (b + 3 * c - 5)
+    return num * pow(den, p - 2, p) % p
+
+
+def test_reconstruct(benchmark: Benchmark) -> None:
+    result = benchmark(lambda: reconstruct(blackbox, ["a", "b", "c", "d"], seed=1))
+    assert result
@@ -3,6 +3,7 @@ from pickle import dumps, loads
 import pytest
 
 from donuts import Variable
+from donuts.jvm import jvm
 from donuts.varset import VariableSet
 
 
@@ -50,6 +51,17 @@ def test_state() -> None:
     s = dumps(a)
     b = loads(s)
     assert a == b
+    assert a.__getstate__() == "a,b,c"
+
+    a = VariableSet()
+    b = loads(dumps(a))
+    assert a == b
+
+    # The state in older versions.
+    a = VariableSet("a", "b", "c")
+    b = VariableSet.__new__(VariableSet)
+    b.__setstate__(jvm.serialize(a._raw))
+    assert a == b
 
 
 def test_iter() -> None:
@@ -21,3 +21,16 @@ def test_varset_loads(benchmark: Benchmark) -> None:
     s = pickle.dumps(v)
     result = benchmark(pickle.loads, s)
     assert result
+
+
+def test_varset_dumps_1000(benchmark: Benchmark) -> None:
+    v = example_varset(1000)
+    result = benchmark(pickle.dumps, v)
+    assert result
+
+
+def test_varset_loads_1000(benchmark: Benchmark) -> None:
+    v = example_varset(1000)
+    s = pickle.dumps(v)
+    result = benchmark(pickle.loads, s)
+    assert result